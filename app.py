@@ -164,6 +164,15 @@ def init_live_orchestrator(websocket_server_instance):
                             message=data.get('message', 'Unknown error'),
                             error_type=data.get('error_type', 'processing')
                         )
+                    elif event_type == 'dropped':
+                        websocket_server_instance.emit_error(
+                            session_id=session_id,
+                            message=(
+                                f"Dropped chunk {data.get('start', 0.0):.2f}-{data.get('end', 0.0):.2f}s "
+                                f"({data.get('reason', 'stale')})"
+                            ),
+                            error_type='dropped'
+                        )
                 
                 live_orchestrator = Orchestrator(live_callback=live_callback)
                 print("Live Orchestrator initialized successfully")
@@ -1751,6 +1760,7 @@ if __name__ == '__main__':
     # Initialize live orchestrator with WebSocket callback
     def handle_audio_chunk(audio_bytes: bytes, session_id: str, chunk_data: dict):
         """Handle audio chunk from WebSocket client."""
+        arrival_monotonic = time.monotonic()
         live_orch = init_live_orchestrator(websocket_server)
         if not live_orch:
             websocket_server.emit_error(session_id, "Live orchestrator not available")
@@ -1777,9 +1787,12 @@ if __name__ == '__main__':
                     audio_bytes=audio_bytes,
                     start_time=start_time,
                     end_time=end_time,
-                    session_id=session_id
+                    session_id=session_id,
+                    arrival_monotonic=arrival_monotonic
                 )
-                live_sessions[session_id]['chunks_processed'] += 1
+                # Dropped or failed chunks return None
+                if result is not None:
+                    live_sessions[session_id]['chunks_processed'] += 1
             except Exception as e:
                 import logging
                 logging.getLogger(__name__).error(f"Error processing live chunk: {e}", exc_info=True)
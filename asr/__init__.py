@@ -14,14 +14,29 @@ Provides multiple ASR engines for multi-engine transcription:
 - GurbaniPromptBuilder: Context-aware prompts for Gurbani transcription
 """
 
-from .base_asr import BaseASR
-from .asr_whisper import ASRWhisper
-from .asr_indic import ASRIndic
-from .asr_english_fallback import ASREnglish
 from .asr_fusion import ASRFusion
 from .provider_registry import ProviderRegistry, ProviderType, get_registry
 from .gurbani_prompt import GurbaniPromptBuilder, get_prompt_builder, get_gurbani_prompt
 
+# Whisper-based engines import faster-whisper, so they load on first access
+_WHISPER_ENGINES = {
+    'BaseASR': '.base_asr',
+    'ASRWhisper': '.asr_whisper',
+    'ASRIndic': '.asr_indic',
+    'ASREnglish': '.asr_english_fallback',
+}
+
+
+def __getattr__(name):
+    """Lazy import for the Whisper-based engines."""
+    module_name = _WHISPER_ENGINES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 # Lazy imports for optional providers
 def get_indicconformer():
     """Lazy import for IndicConformer provider."""
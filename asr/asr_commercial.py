@@ -170,8 +170,9 @@ class ASRCommercial:
     
     def _transcribe_elevenlabs(
         self,
-        audio_path: Path,
-        language: str
+        audio_path: Optional[Path],
+        language: str,
+        audio_bytes: Optional[bytes] = None
     ) -> Dict:
         """
         Transcribe using ElevenLabs Scribe API.
@@ -179,6 +180,7 @@ class ASRCommercial:
         Args:
             audio_path: Path to audio file
             language: Language code
+            audio_bytes: In-memory WAV data to send instead of reading audio_path
         
         Returns:
             API response dict
@@ -189,12 +191,13 @@ class ASRCommercial:
         lang_param = self.language_map.get(language, language)
         
         # Read audio file
-        with open(audio_path, "rb") as f:
-            audio_bytes = f.read()
+        if audio_bytes is None:
+            with open(audio_path, "rb") as f:
+                audio_bytes = f.read()
         
         # Prepare request - ElevenLabs expects "file" parameter
         files = {
-            "file": (audio_path.name, audio_bytes, "audio/wav")
+            "file": (audio_path.name if audio_path else "chunk.wav", audio_bytes, "audio/wav")
         }
         
         data = {
@@ -228,7 +231,9 @@ class ASRCommercial:
         
         try:
             if self.provider == "elevenlabs":
-                response = self._transcribe_elevenlabs(chunk.audio_path, language)
+                response = self._transcribe_elevenlabs(
+                    chunk.audio_path, language, audio_bytes=chunk.audio_buffer
+                )
             else:
                 raise ValueError(f"Unsupported commercial provider: {self.provider}")
             
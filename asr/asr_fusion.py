@@ -12,7 +12,8 @@ import config
 logger = logging.getLogger(__name__)
 
 try:
-    from rapidfuzz import fuzz
+    import numpy as np
+    from rapidfuzz import fuzz, process
     RAPIDFUZZ_AVAILABLE = True
 except ImportError:
     RAPIDFUZZ_AVAILABLE = False
@@ -140,6 +141,22 @@ class ASRFusion:
             selected_engine=selected_result.engine
         )
     
+    def preview_agreement(self, primary: ASRResult, other: ASRResult) -> float:
+        """
+        Score agreement between two hypotheses ahead of full fusion.
+        
+        Lets the caller stop waiting on slower engines once an early
+        hypothesis already agrees with the primary one.
+        
+        Args:
+            primary: Primary (ASR-A) hypothesis
+            other: Hypothesis from an additional engine
+        
+        Returns:
+            Agreement score (0-1)
+        """
+        return self._text_similarity(primary.text, other.text)
+    
     def _calculate_agreement_scores(
         self,
         hypotheses: List[ASRResult]
@@ -154,6 +171,18 @@ class ASRFusion:
             Matrix of agreement scores (symmetric)
         """
         n = len(hypotheses)
+        
+        if RAPIDFUZZ_AVAILABLE:
+            # Score all pairs in one native call; each text is normalized once
+            texts = [' '.join(h.text.split()) for h in hypotheses]
+            scores = process.cdist(texts, texts, scorer=fuzz.ratio, dtype=np.float64) / 100.0
+            # As in _text_similarity, an empty text only agrees with another empty text
+            empty = np.array([not h.text for h in hypotheses])
+            scores[np.ix_(empty, ~empty)] = 0.0
+            scores[np.ix_(~empty, empty)] = 0.0
+            np.fill_diagonal(scores, 1.0)
+            return scores.tolist()
+        
         agreement_matrix = [[0.0] * n for _ in range(n)]
         
         for i in range(n):
@@ -5,10 +5,13 @@ This ASR engine uses a Whisper model fine-tuned for Indic languages
 (Punjabi, Hindi, Braj) to provide better accuracy for Gurbani and
 mixed-language Katha content.
 """
+import logging
 from typing import Optional
 import config
 from asr.base_asr import BaseASR, WHISPER_AVAILABLE
 
+logger = logging.getLogger(__name__)
+
 # Import WhisperModel for fallback loading
 if WHISPER_AVAILABLE:
     from faster_whisper import WhisperModel
@@ -59,18 +62,18 @@ class ASRIndic(BaseASR):
         if is_hf_model:
         # Try to load Indic-specific model first
             try:
-                print(f"Loading {self.engine_name} (Indic-tuned): {self.model_size} on {self.device.upper()}")
+                logger.info("Loading %s (Indic-tuned): %s on %s", self.engine_name, self.model_size, self.device.upper())
                 self.model = WhisperModel(
                     self.model_size,
                     device=self.device,
                     compute_type=compute_type,
                     cpu_threads=4 if self.device == "cpu" else 0
                 )
-                print(f"{self.engine_name} Indic-tuned model {self.model_size} loaded successfully")
+                logger.info("%s Indic-tuned model %s loaded successfully", self.engine_name, self.model_size)
                 return
             except Exception as e:
-                print(f"Warning: Failed to load Indic model {self.model_size}: {e}")
-                print(f"Falling back to standard Whisper {self.fallback_model}")
+                logger.warning("Failed to load Indic model %s: %s", self.model_size, e)
+                logger.info("Falling back to standard Whisper %s", self.fallback_model)
                 self.model_size = self.fallback_model
         
         # Fallback to standard Whisper
@@ -10,7 +10,7 @@ Framework: HuggingFace transformers (alternative to NeMo for easier setup)
 import logging
 import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union, BinaryIO
 import numpy as np
 
 import config
@@ -143,18 +143,18 @@ class ASRIndicConformer:
                 logger.error(f"Pipeline loading also failed: {pipe_error}")
                 raise RuntimeError(f"Failed to load IndicConformer model: {e}")
     
-    def _load_audio(self, audio_path: Path) -> np.ndarray:
+    def _load_audio(self, audio_path: Union[str, Path, BinaryIO]) -> np.ndarray:
         """
         Load and preprocess audio file.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or a file object over in-memory audio
         
         Returns:
             Audio samples as numpy array (mono, 16kHz)
         """
         # Load audio using soundfile
-        audio, sr = sf.read(str(audio_path))
+        audio, sr = sf.read(str(audio_path) if isinstance(audio_path, Path) else audio_path)
         
         # Convert to mono if stereo
         if len(audio.shape) > 1:
@@ -195,7 +195,7 @@ class ASRIndicConformer:
         language = language or self.default_language
         
         # Load audio
-        audio = self._load_audio(chunk.audio_path)
+        audio = self._load_audio(chunk.audio_source())
         
         # Transcribe based on model type
         if self.pipe is not None:
@@ -306,7 +306,7 @@ class ASRIndicConformer:
         
         if len(audio) > max_chunk_samples:
             segments = []
-            full_text = ""
+            text_parts = []
             
             # Process in chunks
             for start_sample in range(0, len(audio), max_chunk_samples):
@@ -331,7 +331,7 @@ class ASRIndicConformer:
                         confidence=confidence,
                         language=language
                     ))
-                    full_text += text + " "
+                    text_parts.append(text)
             
             overall_confidence = (
                 sum(seg.confidence for seg in segments) / len(segments)
@@ -339,7 +339,7 @@ class ASRIndicConformer:
             )
             
             return ASRResult(
-                text=full_text.strip(),
+                text=" ".join(text_parts).strip(),
                 language=language,
                 confidence=overall_confidence,
                 segments=segments,
@@ -10,7 +10,7 @@ Framework: HuggingFace transformers + torch
 import logging
 import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union, BinaryIO
 import numpy as np
 
 import config
@@ -131,18 +131,18 @@ class ASRWav2Vec2:
             
             raise RuntimeError(f"Failed to load Wav2Vec2 model: {e}")
     
-    def _load_audio(self, audio_path: Path) -> np.ndarray:
+    def _load_audio(self, audio_path: Union[str, Path, BinaryIO]) -> np.ndarray:
         """
         Load and preprocess audio file.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or a file object over in-memory audio
         
         Returns:
             Audio samples as numpy array (mono, 16kHz)
         """
         # Load audio using soundfile
-        audio, sr = sf.read(str(audio_path))
+        audio, sr = sf.read(str(audio_path) if isinstance(audio_path, Path) else audio_path)
         
         # Convert to mono if stereo
         if len(audio.shape) > 1:
@@ -183,7 +183,7 @@ class ASRWav2Vec2:
         language = language or self.default_language
         
         # Load audio
-        audio = self._load_audio(chunk.audio_path)
+        audio = self._load_audio(chunk.audio_source())
         
         # Transcribe
         text, confidence = self._transcribe(audio)
@@ -352,7 +352,7 @@ class ASRWav2Vec2:
         
         if len(audio) > max_chunk_samples:
             segments = []
-            full_text = ""
+            text_parts = []
             
             # Process in chunks
             for start_sample in range(0, len(audio), max_chunk_samples):
@@ -372,7 +372,7 @@ class ASRWav2Vec2:
                         confidence=confidence,
                         language=language
                     ))
-                    full_text += text + " "
+                    text_parts.append(text)
             
             overall_confidence = (
                 sum(seg.confidence for seg in segments) / len(segments)
@@ -380,7 +380,7 @@ class ASRWav2Vec2:
             )
             
             return ASRResult(
-                text=full_text.strip(),
+                text=" ".join(text_parts).strip(),
                 language=language,
                 confidence=overall_confidence,
                 segments=segments,
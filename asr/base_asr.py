@@ -4,6 +4,7 @@ Base ASR class providing shared functionality for all ASR engines.
 This module provides the abstract base class that all ASR engines should extend,
 reducing code duplication across ASRWhisper, ASRIndic, and ASREnglish.
 """
+import bisect
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -16,11 +17,19 @@ logger = logging.getLogger(__name__)
 
 # Try to import faster-whisper
 try:
-    from faster_whisper import WhisperModel
+    from faster_whisper import WhisperModel, decode_audio
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
-    print("ERROR: faster-whisper is not installed. Install with: pip install faster-whisper")
+    logger.error("faster-whisper is not installed. Install with: pip install faster-whisper")
+
+# Batched decoding needs faster-whisper >= 1.1
+try:
+    from faster_whisper import BatchedInferencePipeline
+    import numpy as np
+    BATCHED_INFERENCE_AVAILABLE = True
+except ImportError:
+    BATCHED_INFERENCE_AVAILABLE = False
 
 
 class BaseASR(ABC):
@@ -64,6 +73,7 @@ class BaseASR(ABC):
         
         self.model_size = model_size or self._get_default_model_size()
         self.model = None
+        self._batched_pipeline = None
         self.device, self.device_name = detect_device()
         self._load_model()
     
@@ -91,9 +101,10 @@ class BaseASR(ABC):
             if cache_key in BaseASR._model_cache:
                 logger.debug(f"Using cached model for {self.engine_name}: {self.model_size}")
                 self.model = BaseASR._model_cache[cache_key]
+                self._init_batched_pipeline()
                 return
             
-            print(f"Loading {self.engine_name} model: {self.model_size} on {device_info}")
+            logger.info("Loading %s model: %s on %s", self.engine_name, self.model_size, device_info)
             
             try:
                 self.model = WhisperModel(
@@ -104,10 +115,17 @@ class BaseASR(ABC):
                 )
                 # Store in cache
                 BaseASR._model_cache[cache_key] = self.model
-                print(f"{self.engine_name} model {self.model_size} loaded successfully on {self.device.upper()}")
+                logger.info("%s model %s loaded successfully on %s", self.engine_name, self.model_size, self.device.upper())
             except Exception as e:
                 # If loading fails, don't cache and raise
                 raise RuntimeError(f"Failed to load {self.engine_name} model: {str(e)}")
+        
+        self._init_batched_pipeline()
+    
+    def _init_batched_pipeline(self):
+        """Wrap the loaded model for batched decoding, if available and enabled."""
+        if BATCHED_INFERENCE_AVAILABLE and getattr(config, 'ASR_BATCHED_INFERENCE', True):
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
     
     def _get_language_for_route(self, language: Optional[str], route: Optional[str]) -> Optional[str]:
         """
@@ -189,16 +207,22 @@ class BaseASR(ABC):
         language = self._get_language_for_route(language, route)
         params = self._get_transcription_params(language, vad_filter=False, initial_prompt=initial_prompt)
         
-        segments, info = self.model.transcribe(str(chunk.audio_path), **params)
+        segments, info = self.model.transcribe(chunk.audio_source(), **params)
+        
+        # A buffered chunk holds only its own audio, so its range starts at 0
+        if chunk.audio_buffer is not None:
+            window_start, window_end = 0.0, chunk.duration
+        else:
+            window_start, window_end = chunk.start_time, chunk.end_time
         
         # Filter segments to only include those within chunk time range
         chunk_segments = []
-        full_text = ""
+        text_parts = []
         
         for segment in segments:
-            if segment.start < chunk.end_time and segment.end > chunk.start_time:
-                adjusted_start = max(0, segment.start - chunk.start_time)
-                adjusted_end = min(chunk.duration, segment.end - chunk.start_time)
+            if segment.start < window_end and segment.end > window_start:
+                adjusted_start = max(0, segment.start - window_start)
+                adjusted_end = min(chunk.duration, segment.end - window_start)
                 
                 chunk_segments.append(Segment(
                     start=adjusted_start,
@@ -207,7 +231,170 @@ class BaseASR(ABC):
                     confidence=self._extract_confidence(segment),
                     language=info.language
                 ))
-                full_text += segment.text + " "
+                text_parts.append(segment.text)
+        
+        overall_confidence = (
+            sum(seg.confidence for seg in chunk_segments) / len(chunk_segments)
+            if chunk_segments else 0.0
+        )
+        
+        return ASRResult(
+            text=" ".join(text_parts).strip(),
+            language=info.language,
+            confidence=overall_confidence,
+            segments=chunk_segments,
+            engine=self.engine_name,
+            language_probability=getattr(info, 'language_probability', None)
+        )
+    
+    def transcribe_batch(
+        self,
+        chunks: List[AudioChunk],
+        language: Optional[str] = None,
+        route: Optional[str] = None,
+        initial_prompt: Optional[str] = None
+    ) -> List[ASRResult]:
+        """
+        Transcribe several chunks that share a route and language.
+        
+        Each source file is decoded once and every chunk is transcribed from
+        its slice of the decoded samples, instead of re-decoding the file for
+        each chunk as transcribe_chunk does. With a fixed language and
+        ASR_BATCHED_INFERENCE enabled, all chunks go through a single batched
+        decoder call, provided no chunk is longer than the model's 30 s window.
+        
+        Args:
+            chunks: AudioChunks to transcribe
+            language: Language code to force (e.g., 'pa', 'en')
+            route: Route string (e.g., 'punjabi_speech', 'english_speech')
+            initial_prompt: Optional prompt to bias transcription toward specific vocabulary
+        
+        Returns:
+            ASRResult per chunk, in input order
+        """
+        language = self._get_language_for_route(language, route)
+        params = self._get_transcription_params(language, vad_filter=False, initial_prompt=initial_prompt)
+        
+        sample_rate = 16000
+        decoded: Dict[Path, Any] = {}
+        chunk_samples = []
+        
+        for chunk in chunks:
+            if chunk.audio_buffer is not None:
+                chunk_samples.append(decode_audio(chunk.audio_source(), sampling_rate=sample_rate))
+            else:
+                if chunk.audio_path not in decoded:
+                    decoded[chunk.audio_path] = decode_audio(str(chunk.audio_path), sampling_rate=sample_rate)
+                chunk_samples.append(decoded[chunk.audio_path][
+                    int(chunk.start_time * sample_rate):int(chunk.end_time * sample_rate)
+                ])
+        
+        # One batched decoder call for the whole group; needs a fixed language,
+        # since the batched pipeline detects language once for all chunks.
+        # Each clip is decoded as a single window, so the batched pipeline
+        # only transcribes the first chunk_length seconds of a chunk
+        pipeline = getattr(self, '_batched_pipeline', None)
+        if (
+            pipeline is not None and language is not None and len(chunks) > 1
+            and all(
+                0 < len(samples) <= self.model.feature_extractor.chunk_length * sample_rate
+                for samples in chunk_samples
+            )
+        ):
+            try:
+                return self._transcribe_samples_batched(pipeline, chunks, chunk_samples, params, sample_rate)
+            except Exception as e:
+                logger.warning("%s batched inference failed, decoding chunks one by one: %s", self.engine_name, e)
+        
+        results = []
+        for chunk, samples in zip(chunks, chunk_samples):
+            segments, info = self.model.transcribe(samples, **params)
+            # Segment times are already relative to the chunk start
+            results.append(self._build_chunk_result(chunk, segments, info))
+        
+        return results
+    
+    def _transcribe_samples_batched(
+        self,
+        pipeline: Any,
+        chunks: List[AudioChunk],
+        chunk_samples: List[Any],
+        params: Dict[str, Any],
+        sample_rate: int
+    ) -> List[ASRResult]:
+        """
+        Transcribe decoded chunks with one BatchedInferencePipeline call.
+        
+        Chunks are laid end to end (VAD chunks may overlap in the source
+        file) and passed as clip timestamps, so every returned segment falls
+        inside exactly one chunk's range.
+        
+        Args:
+            pipeline: BatchedInferencePipeline wrapping self.model
+            chunks: AudioChunks being transcribed
+            chunk_samples: Decoded samples per chunk
+            params: Transcription parameters from _get_transcription_params
+            sample_rate: Sample rate of the decoded audio
+        
+        Returns:
+            ASRResult per chunk, in input order
+        """
+        offsets = []
+        clips = []
+        position = 0
+        for samples in chunk_samples:
+            offsets.append(position / sample_rate)
+            clips.append({"start": position / sample_rate, "end": (position + len(samples)) / sample_rate})
+            position += len(samples)
+        
+        segments, info = pipeline.transcribe(
+            np.concatenate(chunk_samples),
+            clip_timestamps=clips,
+            batch_size=len(chunks),
+            **params
+        )
+        
+        per_chunk = [[] for _ in chunks]
+        for segment in segments:
+            # Segment times are rounded, so allow for a start just before its clip
+            index = max(0, bisect.bisect_right(offsets, segment.start + 0.01) - 1)
+            per_chunk[index].append(segment)
+        
+        return [
+            self._build_chunk_result(chunk, segments, info, offset)
+            for chunk, segments, offset in zip(chunks, per_chunk, offsets)
+        ]
+    
+    def _build_chunk_result(
+        self,
+        chunk: AudioChunk,
+        segments: Any,
+        info: Any,
+        offset: float = 0.0
+    ) -> ASRResult:
+        """
+        Build a chunk's ASRResult from decoded whisper segments.
+        
+        Args:
+            chunk: AudioChunk the segments belong to
+            segments: Whisper segments for this chunk
+            info: Whisper TranscriptionInfo
+            offset: Time of the chunk start on the segments' timeline
+        
+        Returns:
+            ASRResult with segment times relative to the chunk start
+        """
+        chunk_segments = []
+        text_parts = []
+        for segment in segments:
+            chunk_segments.append(Segment(
+                start=max(0, segment.start - offset),
+                end=min(chunk.duration, segment.end - offset),
+                text=segment.text.strip(),
+                confidence=self._extract_confidence(segment),
+                language=info.language
+            ))
+            text_parts.append(segment.text)
         
         overall_confidence = (
             sum(seg.confidence for seg in chunk_segments) / len(chunk_segments)
@@ -215,7 +402,7 @@ class BaseASR(ABC):
         )
         
         return ASRResult(
-            text=full_text.strip(),
+            text=" ".join(text_parts).strip(),
             language=info.language,
             confidence=overall_confidence,
             segments=chunk_segments,
@@ -250,7 +437,7 @@ class BaseASR(ABC):
             segments, info = self.model.transcribe(str(audio_path), **params)
             
             segment_list = []
-            full_text = ""
+            text_parts = []
             
             for segment in segments:
                 segment_list.append(Segment(
@@ -260,7 +447,7 @@ class BaseASR(ABC):
                     confidence=self._extract_confidence(segment),
                     language=info.language
                 ))
-                full_text += segment.text + " "
+                text_parts.append(segment.text)
             
             overall_confidence = (
                 sum(seg.confidence for seg in segment_list) / len(segment_list)
@@ -268,7 +455,7 @@ class BaseASR(ABC):
             )
             
             return ASRResult(
-                text=full_text.strip(),
+                text=" ".join(text_parts).strip(),
                 language=info.language,
                 confidence=overall_confidence,
                 segments=segment_list,
@@ -277,7 +464,7 @@ class BaseASR(ABC):
             )
             
         except Exception as e:
-            print(f"{self.engine_name} transcription error: {e}")
+            logger.error("%s transcription error: %s", self.engine_name, e)
             raise RuntimeError(f"{self.engine_name} transcription failed: {e}")
     
     def is_model_loaded(self) -> bool:
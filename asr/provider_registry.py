@@ -22,6 +22,10 @@ class ProviderType(Enum):
     COMMERCIAL = "commercial"
 
 
+# Provider type names, resolved once for per-call validation
+PROVIDER_TYPE_VALUES = tuple(p.value for p in ProviderType)
+
+
 class ProviderCapabilities:
     """Describes the capabilities of an ASR provider."""
     
@@ -204,9 +208,9 @@ class ProviderRegistry:
         provider_type = provider_type.lower()
         
         # Validate provider type
-        if provider_type not in [p.value for p in ProviderType]:
+        if provider_type not in PROVIDER_TYPE_VALUES:
             raise ValueError(f"Unknown provider type: {provider_type}. "
-                           f"Available: {[p.value for p in ProviderType]}")
+                           f"Available: {list(PROVIDER_TYPE_VALUES)}")
         
         # Check availability
         capabilities = self._capabilities.get(provider_type)
@@ -217,7 +221,7 @@ class ProviderRegistry:
         # Return cached provider if available
         with self._lock:
             if provider_type in self._providers and not force_reload:
-                logger.debug(f"Returning cached provider: {provider_type}")
+                logger.debug("Returning cached provider: %s", provider_type)
                 return self._providers[provider_type]
             
             # Instantiate provider
@@ -87,6 +87,20 @@ ASR_C_FORCE_LANGUAGE = "en"  # Always force English for ASR-C
 ASR_PARALLEL_EXECUTION = True  # Run ASR-B/C in parallel
 ASR_PARALLEL_WORKERS = int(os.getenv("ASR_PARALLEL_WORKERS", "2"))
 ASR_TIMEOUT_SECONDS = 60  # Per-engine timeout in seconds
+# Stop waiting for further engines once one agrees with ASR-A at least this much (> 1.0 disables)
+ASR_EARLY_ABORT_AGREEMENT = float(os.getenv("ASR_EARLY_ABORT_AGREEMENT", "0.9"))
+ASR_BATCH_SIZE = int(os.getenv("ASR_BATCH_SIZE", "8"))  # Max consecutive same-route chunks per batched ASR-A call (batch mode)
+# Decode each ASR-A batch in one batched faster-whisper call (BatchedInferencePipeline)
+ASR_BATCHED_INFERENCE = os.getenv("ASR_BATCHED_INFERENCE", "true").lower() == "true"
+
+# Start loading ASR-B/C on background threads when the orchestrator starts,
+# instead of on the first chunk that needs them
+ASR_PRELOAD_ENGINES = os.getenv("ASR_PRELOAD_ENGINES", "false").lower() == "true"
+
+# Warm up ASR-A/B/C with a short silent chunk when the orchestrator starts
+# (moves model load/first-inference cost out of the first transcription)
+WARMUP_AT_STARTUP = os.getenv("WARMUP_AT_STARTUP", "false").lower() == "true"
+WARMUP_SILENCE_SECONDS = 0.5
 
 # ============================================
 # ASR PROVIDER SELECTION (Multi-Provider Support)
@@ -133,6 +147,8 @@ VAD_OVERLAP_SECONDS = 0.5  # Overlap between chunks in seconds
 # Language Identification settings
 LANGID_PUNJABI_THRESHOLD = 0.6  # Confidence threshold for Punjabi detection (0.0-1.0)
 LANGID_ENGLISH_THRESHOLD = 0.6  # Confidence threshold for English detection (0.0-1.0)
+LANGID_CACHE_SIZE = 512  # Routes remembered per chunk audio to skip repeat quick-ASR passes (0 disables)
+LANGID_WORKERS = int(os.getenv("LANGID_WORKERS", "4"))  # Threads identifying upcoming chunks concurrently
 
 # Segment confidence threshold
 SEGMENT_CONFIDENCE_THRESHOLD = 0.7  # Segments below this confidence will be flagged for review
@@ -142,6 +158,7 @@ FUSION_AGREEMENT_THRESHOLD = 0.85  # Text similarity for "agreement" (0-1)
 FUSION_CONFIDENCE_BOOST = 0.1  # Boost when engines agree (0-1)
 FUSION_REDECODE_THRESHOLD = 0.6  # Trigger re-decode below this confidence (0-1)
 FUSION_MAX_REDECODE_ATTEMPTS = 2  # Maximum re-decode attempts per segment
+REDECODE_MIN_AGREEMENT = float(os.getenv("REDECODE_MIN_AGREEMENT", "0.85"))  # Skip re-decode when 2+ engines agree at/above this
 
 # Segment Reliability Configuration
 SEGMENT_RETRY_ON_EMPTY = os.getenv("SEGMENT_RETRY_ON_EMPTY", "true").lower() == "true"
@@ -241,6 +258,8 @@ EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "paraphrase-multilingual-MiniLM-L
 LIVE_CHUNK_DURATION_MS = int(os.getenv("LIVE_CHUNK_DURATION_MS", "1000"))
 LIVE_DRAFT_DELAY_MS = int(os.getenv("LIVE_DRAFT_DELAY_MS", "100"))
 LIVE_VERIFIED_DELAY_S = float(os.getenv("LIVE_VERIFIED_DELAY_S", "2.0"))
+LIVE_STALE_THRESHOLD_S = float(os.getenv("LIVE_STALE_THRESHOLD_S", "5.0"))  # Drop chunks queued longer than this
+LIVE_MAX_INFLIGHT_PER_SESSION = int(os.getenv("LIVE_MAX_INFLIGHT_PER_SESSION", "2"))  # Reject chunks beyond this many in flight
 WEBSOCKET_PING_INTERVAL = int(os.getenv("WEBSOCKET_PING_INTERVAL", "25"))
 WEBSOCKET_PING_TIMEOUT = int(os.getenv("WEBSOCKET_PING_TIMEOUT", "120"))
 
@@ -3,10 +3,11 @@ Data models for the transcription pipeline.
 
 This module defines the core data structures used throughout the system.
 """
+import io
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, BinaryIO
 
 
 @dataclass
@@ -14,17 +15,31 @@ class AudioChunk:
     """Represents a chunk of audio with timing information."""
     start_time: float
     end_time: float
-    audio_path: Path  # Path to original file or extracted chunk
+    audio_path: Optional[Path]  # Path to original file or extracted chunk
     duration: float
+    audio_buffer: Optional[bytes] = None  # In-memory WAV holding only this chunk (live mode)
     
     def __post_init__(self):
         """Validate chunk data."""
+        if self.audio_path is None and self.audio_buffer is None:
+            raise ValueError("Chunk needs an audio_path or an audio_buffer")
         if self.duration <= 0:
             raise ValueError(f"Chunk duration must be positive, got {self.duration}")
         if self.start_time < 0:
             raise ValueError(f"Start time must be non-negative, got {self.start_time}")
         if self.end_time <= self.start_time:
             raise ValueError(f"End time must be greater than start time")
+    
+    def audio_source(self) -> Union[str, BinaryIO]:
+        """
+        Get the audio input to hand to a decoder.
+        
+        Returns:
+            A file object over audio_buffer when set, otherwise the path as a string
+        """
+        if self.audio_buffer is not None:
+            return io.BytesIO(self.audio_buffer)
+        return str(self.audio_path)
 
 
 @dataclass
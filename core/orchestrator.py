@@ -7,22 +7,24 @@ to produce structured transcription results.
 Phase 2: Supports multi-ASR ensemble with fusion.
 Phase 12: Supports dynamic provider selection via ProviderRegistry.
 """
+import collections
 import logging
-import uuid
+import mmap
+import os
+import secrets
 import tempfile
+import threading
+import time
 import io
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable, Iterator, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 import config
 from core.models import (
     AudioChunk, ASRResult, ProcessedSegment, TranscriptionResult, Segment
 )
-from services.vad_service import VADService
 from services.langid_service import LangIDService, ROUTE_PUNJABI_SPEECH, ROUTE_ENGLISH_SPEECH, ROUTE_SCRIPTURE_QUOTE_LIKELY, ROUTE_MIXED
-from asr.asr_whisper import ASRWhisper
-from asr.asr_indic import ASRIndic
-from asr.asr_english_fallback import ASREnglish
 from asr.asr_fusion import ASRFusion
 from asr.provider_registry import ProviderRegistry, ProviderType, get_registry
 from services.script_converter import ScriptConverter
@@ -42,14 +44,136 @@ from services.ngram_rescorer import NGramRescorer, get_ngram_rescorer
 from services.sggs_aligner import SGGSAligner, get_sggs_aligner
 from post.annotator import Annotator
 from post.document_formatter import DocumentFormatter
-from core.errors import ASREngineError, VADError, FusionError, AudioDenoiseError
+from core.errors import TranscriptionError, ASREngineError, VADError, FusionError, AudioDenoiseError
 # Shabad Mode imports
 from services.shabad_detector import ShabadDetector, get_shabad_detector, ShabadDetectionResult, AudioMode
 from services.semantic_praman import SemanticPramanService, get_semantic_praman_service, PramanSearchResult
 
+# VAD and the Whisper-based engines pull in webrtcvad/faster-whisper, so they
+# are imported where they are constructed; these imports are for annotations
+if TYPE_CHECKING:
+    from services.vad_service import VADService
+    from asr.asr_whisper import ASRWhisper
+    from asr.asr_indic import ASRIndic
+    from asr.asr_english_fallback import ASREnglish
+
 logger = logging.getLogger(__name__)
 
 
+def load_settings() -> SimpleNamespace:
+    """
+    Snapshot the config values used by the orchestrator.
+    
+    Resolves every setting (with its default) once, so the per-chunk
+    path reads plain attributes instead of probing the config module.
+    
+    Returns:
+        Namespace of lowercase setting names
+    """
+    return SimpleNamespace(
+        vad_aggressiveness=getattr(config, 'VAD_AGGRESSIVENESS', 2),
+        vad_min_chunk_duration=getattr(config, 'VAD_MIN_CHUNK_DURATION', 1.0),
+        vad_max_chunk_duration=getattr(config, 'VAD_MAX_CHUNK_DURATION', 30.0),
+        vad_overlap_seconds=getattr(config, 'VAD_OVERLAP_SECONDS', 0.5),
+        asr_primary_provider=getattr(config, 'ASR_PRIMARY_PROVIDER', 'whisper'),
+        asr_fallback_provider=getattr(config, 'ASR_FALLBACK_PROVIDER', None),
+        roman_transliteration_scheme=getattr(config, 'ROMAN_TRANSLITERATION_SCHEME', 'practical'),
+        enable_dictionary_lookup=getattr(config, 'ENABLE_DICTIONARY_LOOKUP', True),
+        enable_gurbani_prompting=getattr(config, 'ENABLE_GURBANI_PROMPTING', True),
+        enable_ngram_rescoring=getattr(config, 'ENABLE_NGRAM_RESCORING', True),
+        enable_quote_alignment=getattr(config, 'ENABLE_QUOTE_ALIGNMENT', True),
+        domain_mode=getattr(config, 'DOMAIN_MODE', 'sggs'),
+        strict_gurmukhi=getattr(config, 'STRICT_GURMUKHI', True),
+        enable_domain_correction=getattr(config, 'ENABLE_DOMAIN_CORRECTION', True),
+        langid_punjabi_threshold=getattr(config, 'LANGID_PUNJABI_THRESHOLD', 0.6),
+        langid_english_threshold=getattr(config, 'LANGID_ENGLISH_THRESHOLD', 0.6),
+        langid_cache_size=getattr(config, 'LANGID_CACHE_SIZE', 512),
+        langid_workers=getattr(config, 'LANGID_WORKERS', 4),
+        asr_parallel_execution=getattr(config, 'ASR_PARALLEL_EXECUTION', True),
+        asr_parallel_workers=getattr(config, 'ASR_PARALLEL_WORKERS', 2),
+        asr_batch_size=getattr(config, 'ASR_BATCH_SIZE', 8),
+        asr_preload_engines=getattr(config, 'ASR_PRELOAD_ENGINES', False),
+        asr_timeout_seconds=getattr(config, 'ASR_TIMEOUT_SECONDS', 60),
+        asr_early_abort_agreement=getattr(config, 'ASR_EARLY_ABORT_AGREEMENT', 0.9),
+        redecode_min_agreement=getattr(config, 'REDECODE_MIN_AGREEMENT', 0.85),
+        segment_confidence_threshold=getattr(config, 'SEGMENT_CONFIDENCE_THRESHOLD', 0.7),
+        segment_retry_on_empty=getattr(config, 'SEGMENT_RETRY_ON_EMPTY', True),
+        segment_max_retries=getattr(config, 'SEGMENT_MAX_RETRIES', 2),
+        warmup_at_startup=getattr(config, 'WARMUP_AT_STARTUP', False),
+        warmup_silence_seconds=getattr(config, 'WARMUP_SILENCE_SECONDS', 0.5),
+        enable_denoising=getattr(config, 'ENABLE_DENOISING', False),
+        denoise_backend=getattr(config, 'DENOISE_BACKEND', 'noisereduce'),
+        denoise_strength=getattr(config, 'DENOISE_STRENGTH', 'medium'),
+        denoise_sample_rate=getattr(config, 'DENOISE_SAMPLE_RATE', 16000),
+        denoise_auto_enable_threshold=getattr(config, 'DENOISE_AUTO_ENABLE_THRESHOLD', 0.4),
+        live_denoise_enabled=getattr(config, 'LIVE_DENOISE_ENABLED', False),
+        live_stale_threshold_s=getattr(config, 'LIVE_STALE_THRESHOLD_S', 5.0),
+        live_max_inflight_per_session=getattr(config, 'LIVE_MAX_INFLIGHT_PER_SESSION', 2),
+        shabad_mode_denoise_strength=getattr(config, 'SHABAD_MODE_DENOISE_STRENGTH', 'aggressive'),
+        semantic_index_path=getattr(config, 'SEMANTIC_INDEX_PATH', None)
+    )
+
+
+# Additional ASR engines to run per route (ASR-A always runs first)
+ROUTE_TO_ENGINES: Dict[str, Tuple[str, ...]] = {
+    ROUTE_PUNJABI_SPEECH: ('asr_b',),  # Indic ASR for Punjabi
+    ROUTE_ENGLISH_SPEECH: ('asr_c',),  # English ASR
+    ROUTE_SCRIPTURE_QUOTE_LIKELY: ('asr_b',),  # Indic ASR for Gurbani
+    ROUTE_MIXED: ('asr_b', 'asr_c'),  # Indic + English ASR
+}
+
+# Routes reported in the transcription metrics
+METRIC_ROUTES = (ROUTE_PUNJABI_SPEECH, ROUTE_ENGLISH_SPEECH, ROUTE_SCRIPTURE_QUOTE_LIKELY, ROUTE_MIXED)
+
+# Routes whose live draft caption is script-converted (English speech is shown as-is)
+DRAFT_CONVERSION_ROUTES = frozenset({ROUTE_PUNJABI_SPEECH, ROUTE_SCRIPTURE_QUOTE_LIKELY, ROUTE_MIXED})
+
+# Chunks queued for identification beyond those already running on the LangID pool
+LANGID_PREFETCH_DEPTH = 2
+
+# Emit the per-chunk progress line at INFO only every N chunks (others go to DEBUG)
+CHUNK_LOG_INTERVAL = 10
+
+# Placeholder text for segments whose chunk failed or produced no transcription
+TRANSCRIPTION_ERROR_TEXT = "[Transcription error]"
+EMPTY_TRANSCRIPTION_TEXT = "[Transcription failed - review audio]"
+
+
+def _load_asr_indic() -> 'ASRIndic':
+    """Construct ASR-B (Indic), importing it on first use."""
+    from asr.asr_indic import ASRIndic
+    return ASRIndic()
+
+
+def _load_asr_english() -> 'ASREnglish':
+    """Construct ASR-C (English), importing it on first use."""
+    from asr.asr_english_fallback import ASREnglish
+    return ASREnglish()
+
+
+def error_segment(chunk: AudioChunk, route: str) -> ProcessedSegment:
+    """
+    Build the placeholder segment for a chunk whose processing failed.
+    
+    Args:
+        chunk: Chunk that failed
+        route: Route the chunk was identified as
+    
+    Returns:
+        ProcessedSegment flagged for review with TRANSCRIPTION_ERROR_TEXT
+    """
+    return ProcessedSegment(
+        start=chunk.start_time,
+        end=chunk.end_time,
+        route=route,
+        type="speech",
+        text=TRANSCRIPTION_ERROR_TEXT,
+        confidence=0.0,
+        language="unknown",
+        needs_review=True
+    )
+
+
 class Orchestrator:
     """
     Main orchestrator for the transcription pipeline.
@@ -63,11 +187,11 @@ class Orchestrator:
     
     def __init__(
         self,
-        vad_service: Optional[VADService] = None,
+        vad_service: Optional['VADService'] = None,
         langid_service: Optional[LangIDService] = None,
-        asr_service: Optional[ASRWhisper] = None,
-        asr_indic: Optional[ASRIndic] = None,
-        asr_english: Optional[ASREnglish] = None,
+        asr_service: Optional['ASRWhisper'] = None,
+        asr_indic: Optional['ASRIndic'] = None,
+        asr_english: Optional['ASREnglish'] = None,
         fusion_service: Optional[ASRFusion] = None,
         live_callback: Optional[Callable] = None,
         primary_provider: Optional[str] = None,
@@ -89,17 +213,23 @@ class Orchestrator:
             primary_provider: Primary ASR provider type (whisper, indicconformer, wav2vec2, commercial)
             fallback_provider: Fallback ASR provider type
         """
-        self.vad_service = vad_service or VADService(
-            aggressiveness=config.VAD_AGGRESSIVENESS if hasattr(config, 'VAD_AGGRESSIVENESS') else 2,
-            min_chunk_duration=config.VAD_MIN_CHUNK_DURATION if hasattr(config, 'VAD_MIN_CHUNK_DURATION') else 1.0,
-            max_chunk_duration=config.VAD_MAX_CHUNK_DURATION if hasattr(config, 'VAD_MAX_CHUNK_DURATION') else 30.0,
-            overlap_seconds=config.VAD_OVERLAP_SECONDS if hasattr(config, 'VAD_OVERLAP_SECONDS') else 0.5
-        )
+        # Read config per instance so flags set after import (e.g. CLI --no-* options) apply
+        self._cfg = load_settings()
+        
+        if vad_service is None:
+            from services.vad_service import VADService
+            vad_service = VADService(
+                aggressiveness=self._cfg.vad_aggressiveness,
+                min_chunk_duration=self._cfg.vad_min_chunk_duration,
+                max_chunk_duration=self._cfg.vad_max_chunk_duration,
+                overlap_seconds=self._cfg.vad_overlap_seconds
+            )
+        self.vad_service = vad_service
         
         # Phase 12: Initialize provider registry for dynamic provider selection
         self.provider_registry = get_registry()
-        self.primary_provider_type = primary_provider or getattr(config, 'ASR_PRIMARY_PROVIDER', 'whisper')
-        self.fallback_provider_type = fallback_provider or getattr(config, 'ASR_FALLBACK_PROVIDER', None)
+        self.primary_provider_type = primary_provider or self._cfg.asr_primary_provider
+        self.fallback_provider_type = fallback_provider or self._cfg.asr_fallback_provider
         
         # Initialize primary ASR service using registry or provided service
         if asr_service is not None:
@@ -112,6 +242,19 @@ class Orchestrator:
         self.asr_indic = asr_indic
         self.asr_english = asr_english
         
+        # ASR-B/C load on first use (see _get_asr_indic/_get_asr_english), or in
+        # the background from here when preloading is enabled
+        self._engine_locks = {'asr_indic': threading.Lock(), 'asr_english': threading.Lock()}
+        self._engine_futures: Dict[str, Future] = {}
+        if self._cfg.asr_preload_engines:
+            self._preload_asr_engines()
+        
+        # Legacy additional-engine names; other names resolve through get_provider
+        self._legacy_engine_getters: Dict[str, Callable[[], Any]] = {
+            'asr_b': self._get_asr_indic,
+            'asr_c': self._get_asr_english,
+        }
+        
         # Store additional providers for new provider types
         self._indicconformer_provider = None
         self._wav2vec2_provider = None
@@ -122,8 +265,8 @@ class Orchestrator:
         
         # Phase 3: Initialize script converter
         self.script_converter = ScriptConverter(
-            roman_scheme=getattr(config, 'ROMAN_TRANSLITERATION_SCHEME', 'practical'),
-            enable_dictionary_lookup=getattr(config, 'ENABLE_DICTIONARY_LOOKUP', True)
+            roman_scheme=self._cfg.roman_transliteration_scheme,
+            enable_dictionary_lookup=self._cfg.enable_dictionary_lookup
         )
         logger.info("ScriptConverter initialized for Phase 3")
         
@@ -143,9 +286,9 @@ class Orchestrator:
         logger.info("Document formatting service initialized for Phase 11")
         
         # Phase 14: Initialize SGGS enhancement services
-        self._enable_gurbani_prompting = getattr(config, 'ENABLE_GURBANI_PROMPTING', True)
-        self._enable_ngram_rescoring = getattr(config, 'ENABLE_NGRAM_RESCORING', True)
-        self._enable_quote_alignment = getattr(config, 'ENABLE_QUOTE_ALIGNMENT', True)
+        self._enable_gurbani_prompting = self._cfg.enable_gurbani_prompting
+        self._enable_ngram_rescoring = self._cfg.enable_ngram_rescoring
+        self._enable_quote_alignment = self._cfg.enable_quote_alignment
         
         if self._enable_gurbani_prompting:
             self.prompt_builder = GurbaniPromptBuilder()
@@ -177,9 +320,9 @@ class Orchestrator:
             self.sggs_aligner = None
         
         # Phase 13: Initialize domain language prioritization services
-        self._domain_mode = DomainMode(getattr(config, 'DOMAIN_MODE', 'sggs'))
-        self._strict_gurmukhi = getattr(config, 'STRICT_GURMUKHI', True)
-        self._enable_domain_correction = getattr(config, 'ENABLE_DOMAIN_CORRECTION', True)
+        self._domain_mode = DomainMode(self._cfg.domain_mode)
+        self._strict_gurmukhi = self._cfg.strict_gurmukhi
+        self._enable_domain_correction = self._cfg.enable_domain_correction
         self.script_lock = ScriptLock(self._domain_mode)
         self.drift_detector = DriftDetector(self._domain_mode)
         self.domain_corrector = DomainCorrector(self._domain_mode)
@@ -189,28 +332,50 @@ class Orchestrator:
         if langid_service is None:
             self.langid_service = LangIDService(
                 quick_asr_service=self.asr_service,
-                punjabi_threshold=config.LANGID_PUNJABI_THRESHOLD if hasattr(config, 'LANGID_PUNJABI_THRESHOLD') else 0.6,
-                english_threshold=config.LANGID_ENGLISH_THRESHOLD if hasattr(config, 'LANGID_ENGLISH_THRESHOLD') else 0.6
+                punjabi_threshold=self._cfg.langid_punjabi_threshold,
+                english_threshold=self._cfg.langid_english_threshold,
+                cache_size=self._cfg.langid_cache_size
             )
         else:
             self.langid_service = langid_service
         
+        # Language code per known route, resolved once instead of per chunk
+        self._route_languages = {
+            route: self.langid_service.get_language_code(route) for route in METRIC_ROUTES
+        }
+        
         # Parallel execution settings
-        self.parallel_execution = getattr(config, 'ASR_PARALLEL_EXECUTION', True)
-        self.asr_timeout = getattr(config, 'ASR_TIMEOUT_SECONDS', 60)
+        self.parallel_execution = self._cfg.asr_parallel_execution
+        self.asr_timeout = self._cfg.asr_timeout_seconds
+        self.redecode_min_agreement = self._cfg.redecode_min_agreement
+        
+        # Worker pool shared by all chunks for running additional ASR engines
+        self._asr_pool_size = max(1, self._cfg.asr_parallel_workers)
+        self._asr_pool = ThreadPoolExecutor(max_workers=self._asr_pool_size, thread_name_prefix='asr')
+        # Held while submitting to or replacing the pool, so a job never submits to a shut-down pool
+        self._asr_pool_lock = threading.Lock()
+        # Engines abandoned (early abort or timeout) that still hold a pool worker
+        self._abandoned_engines = 0
+        self._abandoned_lock = threading.Lock()
         
         # Phase 6: Live mode callback
         self.live_callback = live_callback
+        # Per-thread live state, so concurrent sessions don't share a session id
+        self._tls = threading.local()
+        
+        # Live chunks currently being processed, per session
+        self._live_inflight: Dict[str, int] = {}
+        self._live_inflight_lock = threading.Lock()
         
         # Phase 7: Initialize audio denoiser (if enabled)
         self.denoiser = None
-        if getattr(config, 'ENABLE_DENOISING', False):
+        if self._cfg.enable_denoising:
             try:
                 from audio.denoiser import AudioDenoiser
                 self.denoiser = AudioDenoiser(
-                    backend=getattr(config, 'DENOISE_BACKEND', 'noisereduce'),
-                    strength=getattr(config, 'DENOISE_STRENGTH', 'medium'),
-                    sample_rate=getattr(config, 'DENOISE_SAMPLE_RATE', 16000)
+                    backend=self._cfg.denoise_backend,
+                    strength=self._cfg.denoise_strength,
+                    sample_rate=self._cfg.denoise_sample_rate
                 )
                 logger.info("AudioDenoiser initialized for Phase 7")
             except Exception as e:
@@ -226,8 +391,145 @@ class Orchestrator:
         self._shabad_mode_enabled = False
         logger.info("Shabad mode services will be initialized on first use")
         
+        if self._cfg.warmup_at_startup:
+            self._warmup_asr_engines()
+        
         logger.info(f"Orchestrator initialized with primary provider: {self.primary_provider_type}")
     
+    def _preload_asr_engines(self) -> None:
+        """Start loading any missing ASR-B/C models on background threads."""
+        loaders = {
+            attr: loader
+            for attr, loader in (('asr_indic', _load_asr_indic), ('asr_english', _load_asr_english))
+            if getattr(self, attr) is None
+        }
+        if not loaders:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix='asr-preload')
+        for attr, loader in loaders.items():
+            self._engine_futures[attr] = executor.submit(loader)
+        executor.shutdown(wait=False)
+        logger.info(f"Preloading ASR engines in background: {', '.join(loaders)}")
+    
+    def _resolve_asr_engine(self, attr: str, loader: Callable[[], Any]) -> Any:
+        """
+        Get an ASR engine attribute, loading it on first use.
+        
+        Waits for a background preload when one was started; otherwise loads
+        the engine in the calling thread. Concurrent callers share one load.
+        
+        Args:
+            attr: Attribute holding the engine ('asr_indic' or 'asr_english')
+            loader: Engine constructor
+        
+        Returns:
+            The loaded engine
+        """
+        engine = getattr(self, attr)
+        if engine is None:
+            with self._engine_locks[attr]:
+                engine = getattr(self, attr)
+                if engine is None:
+                    future = self._engine_futures.pop(attr, None)
+                    engine = future.result() if future is not None else loader()
+                    setattr(self, attr, engine)
+        return engine
+    
+    def _get_asr_indic(self) -> 'ASRIndic':
+        """Get ASR-B (Indic), loading it on first use."""
+        return self._resolve_asr_engine('asr_indic', _load_asr_indic)
+    
+    def _get_asr_english(self) -> 'ASREnglish':
+        """Get ASR-C (English), loading it on first use."""
+        return self._resolve_asr_engine('asr_english', _load_asr_english)
+    
+    def _warmup_asr_engines(self) -> None:
+        """
+        Run each ASR engine once on a short silent chunk.
+        
+        Loads ASR-B/C eagerly and pays first-inference costs (CUDA context,
+        kernel selection) at startup instead of on the first real chunk.
+        Failures are logged and otherwise ignored.
+        """
+        import wave
+        
+        try:
+            self._get_asr_indic()
+        except Exception as e:
+            logger.warning(f"Failed to load ASR-B for warmup: {e}")
+        try:
+            self._get_asr_english()
+        except Exception as e:
+            logger.warning(f"Failed to load ASR-C for warmup: {e}")
+        
+        engines = [
+            engine for engine in (self.asr_service, self.asr_indic, self.asr_english)
+            if engine is not None
+        ]
+        if not engines:
+            return
+        
+        silence_seconds = self._cfg.warmup_silence_seconds
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+        try:
+            with wave.open(str(tmp_path), 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(16000)
+                wav_file.writeframes(b"\x00\x00" * int(16000 * silence_seconds))
+            
+            silence_chunk = AudioChunk(
+                start_time=0.0,
+                end_time=silence_seconds,
+                audio_path=tmp_path,
+                duration=silence_seconds
+            )
+            
+            def warm(engine) -> None:
+                try:
+                    engine.transcribe_chunk(silence_chunk, language='en', route=ROUTE_ENGLISH_SPEECH)
+                except Exception as e:
+                    logger.warning(f"ASR warmup failed for {type(engine).__name__}: {e}")
+            
+            for future in self._submit_to_asr_pool(warm, engines):
+                future.result()
+            logger.info(f"Warmed up {len(engines)} ASR engine(s)")
+        finally:
+            try:
+                tmp_path.unlink()
+            except Exception as e:
+                logger.warning(f"Failed to delete warmup file: {e}")
+    
+    def close(self) -> None:
+        """Shut down the ASR worker pool."""
+        with self._asr_pool_lock:
+            self._asr_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _submit_to_asr_pool(self, fn: Callable, items: List[Any]) -> List[Future]:
+        """
+        Submit one call of fn per item to the ASR worker pool.
+        
+        All items go to the same pool, even if a concurrent job resizes it.
+        
+        Args:
+            fn: Callable taking a single item
+            items: Items to submit
+        
+        Returns:
+            Futures in item order
+        """
+        with self._asr_pool_lock:
+            return [self._asr_pool.submit(fn, item) for item in items]
+    
+    def __del__(self):
+        """Release the ASR worker pool when the orchestrator is discarded."""
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def _get_primary_asr_service(self):
         """
         Get the primary ASR service based on configured provider type.
@@ -235,6 +537,8 @@ class Orchestrator:
         Returns:
             ASR provider instance
         """
+        from asr.asr_whisper import ASRWhisper
+        
         try:
             # For whisper, use the existing ASRWhisper
             if self.primary_provider_type == "whisper":
@@ -357,7 +661,7 @@ class Orchestrator:
             self.vad_service.vad = None  # Reset VAD to reinitialize
             import webrtcvad
             self.vad_service.vad = webrtcvad.Vad(options['vadAggressiveness'])
-            logger.debug(f"[{job_id}] VAD aggressiveness set to {options['vadAggressiveness']}")
+            logger.debug("[%s] VAD aggressiveness set to %s", job_id, options['vadAggressiveness'])
         
         if 'vadMinChunkDuration' in options:
             self.vad_service.min_chunk_duration = options['vadMinChunkDuration']
@@ -371,7 +675,7 @@ class Orchestrator:
                 from audio.denoiser import AudioDenoiser
                 backend = options.get('denoiseBackend', 'noisereduce')
                 strength = options.get('denoiseStrength', 'medium')
-                sample_rate = getattr(config, 'DENOISE_SAMPLE_RATE', 16000)
+                sample_rate = self._cfg.denoise_sample_rate
                 
                 # Reinitialize denoiser with new settings
                 self.denoiser = AudioDenoiser(
@@ -390,7 +694,19 @@ class Orchestrator:
         if 'parallelProcessingEnabled' in options:
             self.parallel_execution = options['parallelProcessingEnabled']
         
-        # Note: parallelWorkers is stored in options for use during processing
+        # Resize the shared ASR pool if a different worker count is requested
+        parallel_workers = options.get('parallelWorkers')
+        if parallel_workers:
+            old_pool = None
+            with self._asr_pool_lock:
+                if parallel_workers != self._asr_pool_size:
+                    old_pool = self._asr_pool
+                    self._asr_pool_size = parallel_workers
+                    self._asr_pool = ThreadPoolExecutor(max_workers=parallel_workers, thread_name_prefix='asr')
+            if old_pool is not None:
+                # Work already submitted to the old pool still runs to completion
+                old_pool.shutdown(wait=False)
+                logger.debug("[%s] ASR worker pool resized to %d", job_id, parallel_workers)
     
     def transcribe_file(
         self,
@@ -428,201 +744,52 @@ class Orchestrator:
         Returns:
             TranscriptionResult with structured segments and metadata
         """
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-        
         # Generate job ID if not provided
         if job_id is None:
-            job_id = str(uuid.uuid4())[:8]
-        
-        filename = audio_path.name
-        logger.info(f"[{job_id}] Starting transcription: {filename} (mode: {mode})")
-        
-        # Apply processing options
-        if processing_options:
-            self._apply_processing_options(processing_options, job_id)
-        
-        # Phase 13: Configure domain mode for this transcription
-        current_domain_mode = (
-            DomainMode(domain_mode) if domain_mode 
-            else self._domain_mode
-        )
-        current_strict_gurmukhi = (
-            strict_gurmukhi if strict_gurmukhi is not None 
-            else self._strict_gurmukhi
-        )
-        logger.info(f"[{job_id}] Domain mode: {current_domain_mode.value}, strict Gurmukhi: {current_strict_gurmukhi}")
-        
-        # Store for use in _process_chunk_with_fusion
-        self._current_domain_mode = current_domain_mode
-        self._current_strict_gurmukhi = current_strict_gurmukhi
+            job_id = secrets.token_hex(4)
         
-        # Step 0: Audio denoising (Phase 7) - if enabled
-        working_audio_path = audio_path
-        denoise_enabled = (
-            processing_options.get('denoiseEnabled', False) if processing_options
-            else getattr(config, 'ENABLE_DENOISING', False)
+        chunks = self._prepare_chunks(
+            audio_path, mode, job_id, processing_options, progress_callback,
+            domain_mode, strict_gurmukhi
         )
         
-        if progress_callback:
-            progress_callback("denoising", 0, 0, "Checking if denoising is needed...", None)
-        
-        if denoise_enabled and self.denoiser is not None:
-            # Check if auto-enable based on noise level
-            auto_enable = getattr(config, 'DENOISE_AUTO_ENABLE_THRESHOLD', 0.4)
-            try:
-                if progress_callback:
-                    progress_callback("denoising", 10, 2, "Estimating noise level...", None)
-                noise_level = self.denoiser.estimate_noise_level(audio_path)
-                if noise_level >= auto_enable:
-                    logger.info(f"[{job_id}] Step 0: Noise level {noise_level:.2f} >= {auto_enable}, applying denoising...")
-                    if progress_callback:
-                        progress_callback("denoising", 30, 5, f"Denoising audio file... (noise level: {noise_level:.2f})", None)
-                    try:
-                        # Create temporary file for denoised audio
-                        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                            tmp_path = Path(tmp_file.name)
-                        working_audio_path = self.denoiser.denoise_file(audio_path, tmp_path)
-                        logger.info(f"[{job_id}] Denoised audio saved to temporary file")
-                        if progress_callback:
-                            progress_callback("denoising", 100, 10, "Denoising complete", None)
-                    except Exception as e:
-                        logger.warning(f"[{job_id}] Denoising failed: {e}. Using original audio.")
-                        working_audio_path = audio_path
-                else:
-                    logger.debug(f"[{job_id}] Noise level {noise_level:.2f} < {auto_enable}, skipping denoising")
-                    if progress_callback:
-                        progress_callback("denoising", 100, 10, f"Noise level acceptable ({noise_level:.2f}), skipping denoising", None)
-            except Exception as e:
-                logger.warning(f"[{job_id}] Noise level estimation failed: {e}. Skipping denoising.")
-                working_audio_path = audio_path
-                if progress_callback:
-                    progress_callback("denoising", 100, 10, "Skipping denoising", None)
-        elif getattr(config, 'ENABLE_DENOISING', False):
-            # Denoising enabled but not initialized - try to denoise anyway
-            logger.info(f"[{job_id}] Step 0: Denoising enabled, applying...")
-            if progress_callback:
-                progress_callback("denoising", 30, 5, "Denoising audio file...", None)
-            try:
-                from audio.denoiser import AudioDenoiser
-                denoiser = AudioDenoiser(
-                    backend=getattr(config, 'DENOISE_BACKEND', 'noisereduce'),
-                    strength=getattr(config, 'DENOISE_STRENGTH', 'medium'),
-                    sample_rate=getattr(config, 'DENOISE_SAMPLE_RATE', 16000)
-                )
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                    tmp_path = Path(tmp_file.name)
-                working_audio_path = denoiser.denoise_file(audio_path, tmp_path)
-                logger.info(f"[{job_id}] Denoised audio saved to temporary file")
-                if progress_callback:
-                    progress_callback("denoising", 100, 10, "Denoising complete", None)
-            except Exception as e:
-                logger.warning(f"[{job_id}] Denoising failed: {e}. Using original audio.")
-                working_audio_path = audio_path
-        else:
-            # Denoising not enabled
-            if progress_callback:
-                progress_callback("denoising", 100, 10, "Denoising disabled", None)
-        
-        # Step 1: VAD chunking
-        logger.info(f"[{job_id}] Step 1: Chunking audio with VAD...")
-        if progress_callback:
-            progress_callback("chunking", 0, 10, "Creating audio chunks with VAD...", None)
-        try:
-            # Use options for VAD chunking if provided
-            vad_min = None
-            vad_max = None
-            if processing_options:
-                vad_min = processing_options.get('vadMinChunkDuration')
-                vad_max = processing_options.get('vadMaxChunkDuration')
-            
-            chunks = self.vad_service.chunk_audio(
-                working_audio_path,
-                min_chunk_duration=vad_min,
-                max_chunk_duration=vad_max
-            )
-            logger.info(f"[{job_id}] Created {len(chunks)} audio chunks")
-            if progress_callback:
-                progress_callback("chunking", 100, 20, f"Created {len(chunks)} audio chunks", {"chunk_count": len(chunks)})
-        except Exception as e:
-            logger.error(f"[{job_id}] VAD chunking failed: {e}")
-            raise VADError(f"Failed to chunk audio: {e}")
-        finally:
-            # Clean up temporary denoised file if created
-            if working_audio_path != audio_path and working_audio_path.exists():
-                try:
-                    working_audio_path.unlink()
-                    logger.debug(f"[{job_id}] Cleaned up temporary denoised file")
-                except Exception as e:
-                    logger.warning(f"[{job_id}] Failed to clean up temp file: {e}")
-        
-        # Step 2: Process each chunk
-        processed_segments = []
-        total_gurmukhi_text = ""
-        total_roman_text = ""  # Will be populated in later phases
-        
-        total_chunks = len(chunks)
-        for i, chunk in enumerate(chunks):
-            logger.info(f"[{job_id}] Processing chunk {i+1}/{len(chunks)} (time: {chunk.start_time:.2f}-{chunk.end_time:.2f}s)")
-            
-            # Update progress for chunk processing
-            if progress_callback:
-                chunk_progress = int((i / total_chunks) * 100) if total_chunks > 0 else 0
-                overall_progress = 20 + int((i / total_chunks) * 70) if total_chunks > 0 else 20
-                progress_callback("transcribing", chunk_progress, overall_progress, 
-                                f"Transcribing chunk {i+1} of {total_chunks}", 
-                                {"current_chunk": i+1, "total_chunks": total_chunks})
-            
-            # Step 2a: Language/domain identification
-            route = self.langid_service.identify_segment(chunk)
-            logger.debug(f"[{job_id}] Chunk {i+1} route: {route}")
-            
-            # Step 2b: Get language code for ASR
-            language = self.langid_service.get_language_code(route)
-            
-            # Step 2c: Multi-ASR processing with fusion (Phase 2)
-            try:
-                processed_segment = self._process_chunk_with_fusion(
-                    chunk, route, language, job_id
-                )
-                
-                processed_segments.append(processed_segment)
-                total_gurmukhi_text += processed_segment.text + " "
-                # Add roman text if available
-                if processed_segment.roman:
-                    total_roman_text += processed_segment.roman + " "
-                
-                if processed_segment.needs_review:
-                    logger.warning(f"[{job_id}] Chunk {i+1} flagged for review (confidence: {processed_segment.confidence:.2f})")
-                
-            except Exception as e:
-                logger.error(f"[{job_id}] Error processing chunk {i+1}: {e}", exc_info=True)
-                # Create error segment
-                error_segment = ProcessedSegment(
-                    start=chunk.start_time,
-                    end=chunk.end_time,
-                    route=route,
-                    type="speech",
-                    text="[Transcription error]",
-                    confidence=0.0,
-                    language="unknown",
-                    needs_review=True
-                )
-                processed_segments.append(error_segment)
+        # Step 2: Process each chunk into its own slot, so completion order never matters.
+        # Metrics (including Phase 4 quote statistics) are accumulated as segments arrive.
+        processed_segments: List[Optional[ProcessedSegment]] = [None] * len(chunks)
+        produced = 0
+        route_counts = dict.fromkeys(METRIC_ROUTES, 0)
+        segments_needing_review = 0
+        confidence_sum = 0.0
+        quotes_detected = 0
+        quotes_replaced = 0
+        quotes_flagged_review = 0
+        segments_with_empty_text = []
+        for i, seg in self._iter_segments(chunks, mode, job_id, progress_callback):
+            processed_segments[i] = seg
+            produced += 1
+            if seg.route in route_counts:
+                route_counts[seg.route] += 1
+            confidence_sum += seg.confidence
+            if seg.needs_review:
+                segments_needing_review += 1
+            if seg.quote_match is not None:
+                quotes_detected += 1
+                if seg.type == "scripture_quote":
+                    quotes_replaced += 1
+                if seg.needs_review:
+                    quotes_flagged_review += 1
+            if seg.text.strip() in (TRANSCRIPTION_ERROR_TEXT, EMPTY_TRANSCRIPTION_TEXT):
+                segments_with_empty_text.append(i + 1)
+        if produced != len(chunks):
+            missing = [i + 1 for i, seg in enumerate(processed_segments) if seg is None]
+            raise TranscriptionError(f"No segment produced for chunk(s) {missing}")
+        avg_confidence = confidence_sum / produced if produced else 0.0
         
-        # Step 2d: Validate all segments have transcriptions
+        # Step 2d: Summarize segments left without a usable transcription
         logger.info(f"[{job_id}] Validating segment transcriptions...")
         if progress_callback:
             progress_callback("transcribing", 100, 90, "Validating transcriptions...", None)
-        segments_with_empty_text = []
-        for i, seg in enumerate(processed_segments):
-            if not seg.text or not seg.text.strip() or seg.text.strip() == "[Transcription error]":
-                segments_with_empty_text.append(i + 1)
-                # Ensure segment is marked for review
-                seg.needs_review = True
-                if not seg.text or not seg.text.strip():
-                    seg.text = "[Transcription failed - review audio]"
-                    logger.warning(f"[{job_id}] Segment {i+1} has empty transcription, marked for review")
+        segments_with_empty_text.sort()
         
         if segments_with_empty_text:
             logger.warning(
@@ -645,24 +812,6 @@ class Orchestrator:
         if progress_callback:
             progress_callback("post_processing", 50, 93, "Detecting quotes...", None)
         
-        # Calculate metrics
-        segments_needing_review = sum(1 for seg in processed_segments if seg.needs_review)
-        avg_confidence = (
-            sum(seg.confidence for seg in processed_segments) / len(processed_segments)
-            if processed_segments else 0.0
-        )
-        
-        # Calculate quote statistics (Phase 4)
-        quotes_detected = sum(1 for seg in processed_segments if seg.quote_match is not None)
-        quotes_replaced = sum(
-            1 for seg in processed_segments 
-            if seg.quote_match is not None and seg.type == "scripture_quote"
-        )
-        quotes_flagged_review = sum(
-            1 for seg in processed_segments 
-            if seg.quote_match is not None and seg.needs_review
-        )
-        
         metrics = {
             "mode": mode,
             "job_id": job_id,
@@ -670,10 +819,7 @@ class Orchestrator:
             "total_segments": len(processed_segments),
             "segments_needing_review": segments_needing_review,
             "average_confidence": avg_confidence,
-            "routes": {
-                route: sum(1 for seg in processed_segments if seg.route == route)
-                for route in [ROUTE_PUNJABI_SPEECH, ROUTE_ENGLISH_SPEECH, "scripture_quote_likely", "mixed"]
-            },
+            "routes": route_counts,
             "quotes_detected": quotes_detected,
             "quotes_replaced": quotes_replaced,
             "quotes_flagged_review": quotes_flagged_review
@@ -683,7 +829,7 @@ class Orchestrator:
                    f"avg confidence: {avg_confidence:.2f}, review needed: {segments_needing_review}")
         
         result = TranscriptionResult(
-            filename=filename,
+            filename=audio_path.name,
             segments=processed_segments,
             transcription=transcription,
             metrics=metrics
@@ -706,6 +852,368 @@ class Orchestrator:
         
         return result
     
+    def transcribe_file_stream(
+        self,
+        audio_path: Path,
+        mode: str = "batch",
+        job_id: Optional[str] = None,
+        processing_options: Optional[Dict[str, Any]] = None,
+        domain_mode: Optional[str] = None,
+        strict_gurmukhi: Optional[bool] = None
+    ) -> Iterator[ProcessedSegment]:
+        """
+        Transcribe an audio file, yielding each segment as soon as it is ready.
+        
+        Runs the same per-chunk pipeline as transcribe_file, so callers can
+        store or push segments while later chunks are still being processed.
+        Merging, metrics and document formatting are left to the caller.
+        
+        Args:
+            audio_path: Path to audio file
+            mode: Processing mode ("batch" or "live")
+            job_id: Optional job identifier for logging (auto-generated if None)
+            processing_options: Optional dict with processing configuration (see transcribe_file)
+            domain_mode: Domain mode for language prioritization (sggs, dasam, generic)
+            strict_gurmukhi: Enforce strict Gurmukhi-only output
+        
+        Yields:
+            ProcessedSegment per chunk, in chunk order
+        """
+        if job_id is None:
+            job_id = secrets.token_hex(4)
+        
+        chunks = self._prepare_chunks(
+            audio_path, mode, job_id, processing_options, None,
+            domain_mode, strict_gurmukhi
+        )
+        for _, segment in self._iter_segments(chunks, mode, job_id):
+            yield segment
+    
+    def _prepare_chunks(
+        self,
+        audio_path: Path,
+        mode: str,
+        job_id: str,
+        processing_options: Optional[Dict[str, Any]],
+        progress_callback: Optional[callable],
+        domain_mode: Optional[str],
+        strict_gurmukhi: Optional[bool]
+    ) -> List[AudioChunk]:
+        """
+        Apply per-job settings, denoise if needed, and chunk the file with VAD.
+        
+        Args:
+            audio_path: Path to audio file
+            mode: Processing mode ("batch" or "live")
+            job_id: Job identifier for logging
+            processing_options: Optional dict with processing configuration
+            progress_callback: Optional progress callback (see transcribe_file)
+            domain_mode: Domain mode for language prioritization
+            strict_gurmukhi: Enforce strict Gurmukhi-only output
+        
+        Returns:
+            List of AudioChunk in time order
+        """
+        # Map the file once up front; this also raises FileNotFoundError
+        audio_buffer = self.prefetch(audio_path)
+        try:
+            # Cached routes are keyed by path and time range; a re-uploaded file may reuse the path
+            self.langid_service.clear_cache()
+            
+            logger.info(f"[{job_id}] Starting transcription: {audio_path.name} (mode: {mode})")
+            
+            # Apply processing options
+            if processing_options:
+                self._apply_processing_options(processing_options, job_id)
+            
+            # Phase 13: Configure domain mode for this transcription
+            current_domain_mode = (
+                DomainMode(domain_mode) if domain_mode 
+                else self._domain_mode
+            )
+            current_strict_gurmukhi = (
+                strict_gurmukhi if strict_gurmukhi is not None 
+                else self._strict_gurmukhi
+            )
+            logger.info(f"[{job_id}] Domain mode: {current_domain_mode.value}, strict Gurmukhi: {current_strict_gurmukhi}")
+            
+            # Store for use in _process_chunk_with_fusion
+            self._current_domain_mode = current_domain_mode
+            self._current_strict_gurmukhi = current_strict_gurmukhi
+            
+            # Step 0: Audio denoising (Phase 7) - if enabled
+            working_audio_path = audio_path
+            denoise_enabled = (
+                processing_options.get('denoiseEnabled', False) if processing_options
+                else self._cfg.enable_denoising
+            )
+            
+            if progress_callback:
+                progress_callback("denoising", 0, 0, "Checking if denoising is needed...", None)
+            
+            if denoise_enabled and self.denoiser is not None:
+                # Check if auto-enable based on noise level
+                auto_enable = self._cfg.denoise_auto_enable_threshold
+                try:
+                    if progress_callback:
+                        progress_callback("denoising", 10, 2, "Estimating noise level...", None)
+                    noise_level = self.denoiser.estimate_noise_level(audio_path)
+                    if noise_level >= auto_enable:
+                        logger.info(f"[{job_id}] Step 0: Noise level {noise_level:.2f} >= {auto_enable}, applying denoising...")
+                        if progress_callback:
+                            progress_callback("denoising", 30, 5, f"Denoising audio file... (noise level: {noise_level:.2f})", None)
+                        try:
+                            # Create temporary file for denoised audio
+                            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
+                                tmp_path = Path(tmp_file.name)
+                            working_audio_path = self.denoiser.denoise_file(audio_path, tmp_path)
+                            logger.info(f"[{job_id}] Denoised audio saved to temporary file")
+                            if progress_callback:
+                                progress_callback("denoising", 100, 10, "Denoising complete", None)
+                        except Exception as e:
+                            logger.warning(f"[{job_id}] Denoising failed: {e}. Using original audio.")
+                            working_audio_path = audio_path
+                    else:
+                        logger.debug("[%s] Noise level %.2f < %s, skipping denoising", job_id, noise_level, auto_enable)
+                        if progress_callback:
+                            progress_callback("denoising", 100, 10, f"Noise level acceptable ({noise_level:.2f}), skipping denoising", None)
+                except Exception as e:
+                    logger.warning(f"[{job_id}] Noise level estimation failed: {e}. Skipping denoising.")
+                    working_audio_path = audio_path
+                    if progress_callback:
+                        progress_callback("denoising", 100, 10, "Skipping denoising", None)
+            elif self._cfg.enable_denoising:
+                # Denoising enabled but not initialized - try to denoise anyway
+                logger.info(f"[{job_id}] Step 0: Denoising enabled, applying...")
+                if progress_callback:
+                    progress_callback("denoising", 30, 5, "Denoising audio file...", None)
+                try:
+                    from audio.denoiser import AudioDenoiser
+                    denoiser = AudioDenoiser(
+                        backend=self._cfg.denoise_backend,
+                        strength=self._cfg.denoise_strength,
+                        sample_rate=self._cfg.denoise_sample_rate
+                    )
+                    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
+                        tmp_path = Path(tmp_file.name)
+                    working_audio_path = denoiser.denoise_file(audio_path, tmp_path)
+                    logger.info(f"[{job_id}] Denoised audio saved to temporary file")
+                    if progress_callback:
+                        progress_callback("denoising", 100, 10, "Denoising complete", None)
+                except Exception as e:
+                    logger.warning(f"[{job_id}] Denoising failed: {e}. Using original audio.")
+                    working_audio_path = audio_path
+            else:
+                # Denoising not enabled
+                if progress_callback:
+                    progress_callback("denoising", 100, 10, "Denoising disabled", None)
+            
+            # Step 1: VAD chunking
+            logger.info(f"[{job_id}] Step 1: Chunking audio with VAD...")
+            if progress_callback:
+                progress_callback("chunking", 0, 10, "Creating audio chunks with VAD...", None)
+            try:
+                # Use options for VAD chunking if provided
+                vad_min = None
+                vad_max = None
+                if processing_options:
+                    vad_min = processing_options.get('vadMinChunkDuration')
+                    vad_max = processing_options.get('vadMaxChunkDuration')
+            
+                chunks = self.vad_service.chunk_audio(
+                    working_audio_path,
+                    min_chunk_duration=vad_min,
+                    max_chunk_duration=vad_max,
+                    audio_bytes=audio_buffer if working_audio_path == audio_path else None
+                )
+                logger.info(f"[{job_id}] Created {len(chunks)} audio chunks")
+                if progress_callback:
+                    progress_callback("chunking", 100, 20, f"Created {len(chunks)} audio chunks", {"chunk_count": len(chunks)})
+            except Exception as e:
+                logger.error(f"[{job_id}] VAD chunking failed: {e}")
+                raise VADError(f"Failed to chunk audio: {e}")
+            finally:
+                # Clean up temporary denoised file if created
+                if working_audio_path != audio_path and working_audio_path.exists():
+                    try:
+                        working_audio_path.unlink()
+                        logger.debug("[%s] Cleaned up temporary denoised file", job_id)
+                    except Exception as e:
+                        logger.warning(f"[{job_id}] Failed to clean up temp file: {e}")
+        finally:
+            self._release_prefetch(audio_buffer)
+        
+        return chunks
+    
+    def _iter_segments(
+        self,
+        chunks: List[AudioChunk],
+        mode: str,
+        job_id: str,
+        progress_callback: Optional[callable] = None
+    ) -> Iterator[Tuple[int, ProcessedSegment]]:
+        """
+        Process chunks through routing, ASR and fusion, yielding each result.
+        
+        Segments are yielded in chunk order as soon as they are finished.
+        A chunk that fails is yielded as an error segment flagged for review,
+        and empty transcriptions are replaced and flagged the same way.
+        
+        Args:
+            chunks: AudioChunks to process
+            mode: Processing mode ("batch" or "live")
+            job_id: Job identifier for logging
+            progress_callback: Optional progress callback (see transcribe_file)
+        
+        Yields:
+            Tuples of (chunk index, ProcessedSegment)
+        """
+        total_chunks = len(chunks)
+        # Steps 2a/2b (language/domain identification) run ahead on a thread pool
+        routed_chunks = self._iter_routed_chunks(chunks, job_id)
+        # Batch mode runs ASR-A once per group of consecutive chunks sharing a route
+        batch_size = self._cfg.asr_batch_size if mode == "batch" else 1
+        for batch in self._iter_asr_batches(routed_chunks, batch_size):
+            asr_a_results = self._transcribe_primary_batch(batch, job_id)
+            for (i, chunk, route, language), asr_a_result in zip(batch, asr_a_results):
+                # Log progress at INFO every few chunks only; the rest go to DEBUG
+                if i % CHUNK_LOG_INTERVAL == 0 or i == total_chunks - 1:
+                    chunk_log_level = logging.INFO
+                else:
+                    chunk_log_level = logging.DEBUG
+                logger.log(
+                    chunk_log_level,
+                    "[%s] Processing chunk %d/%d (time: %.2f-%.2fs)",
+                    job_id, i + 1, total_chunks, chunk.start_time, chunk.end_time
+                )
+                
+                # Update progress for chunk processing
+                if progress_callback:
+                    chunk_progress = int((i / total_chunks) * 100) if total_chunks > 0 else 0
+                    overall_progress = 20 + int((i / total_chunks) * 70) if total_chunks > 0 else 20
+                    progress_callback("transcribing", chunk_progress, overall_progress, 
+                                    f"Transcribing chunk {i+1} of {total_chunks}", 
+                                    {"current_chunk": i+1, "total_chunks": total_chunks})
+                
+                # Step 2c: Multi-ASR processing with fusion (Phase 2)
+                try:
+                    processed_segment = self._process_chunk_with_fusion(
+                        chunk, route, language, job_id, asr_a_result=asr_a_result
+                    )
+                    
+                    if processed_segment.needs_review:
+                        logger.warning(f"[{job_id}] Chunk {i+1} flagged for review (confidence: {processed_segment.confidence:.2f})")
+                    
+                except Exception as e:
+                    logger.error(f"[{job_id}] Error processing chunk {i+1}: {e}", exc_info=True)
+                    processed_segment = error_segment(chunk, route)
+                
+                # Step 2d: Make sure every segment has a transcription
+                if not processed_segment.text or not processed_segment.text.strip():
+                    processed_segment.needs_review = True
+                    processed_segment.text = EMPTY_TRANSCRIPTION_TEXT
+                    logger.warning(f"[{job_id}] Segment {i+1} has empty transcription, marked for review")
+                elif processed_segment.text.strip() == TRANSCRIPTION_ERROR_TEXT:
+                    processed_segment.needs_review = True
+                
+                yield i, processed_segment
+    
+    def _iter_routed_chunks(
+        self,
+        chunks: List[AudioChunk],
+        job_id: Optional[str] = None
+    ) -> Iterator[Tuple[int, AudioChunk, str, Optional[str]]]:
+        """
+        Yield chunks with their route and language, identified ahead of time.
+        
+        Language/domain identification runs on a pool of LANGID_WORKERS
+        threads, up to LANGID_PREFETCH_DEPTH chunks beyond the ones in flight,
+        hiding LangID latency behind ASR work on the current chunk. Chunks are
+        yielded in order; identification errors are re-raised in the consumer.
+        
+        Args:
+            chunks: Chunks to identify
+            job_id: Optional job identifier for logging
+        
+        Yields:
+            Tuples of (index, chunk, route, language)
+        """
+        workers = max(1, min(self._cfg.langid_workers, len(chunks)))
+        lookahead = workers + LANGID_PREFETCH_DEPTH
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"langid-{job_id}")
+        pending = collections.deque()
+        upcoming = iter(enumerate(chunks))
+        
+        def submit_next() -> None:
+            for i, chunk in upcoming:
+                pending.append((i, chunk, pool.submit(self.langid_service.identify_segment, chunk)))
+                return
+        
+        try:
+            for _ in range(lookahead):
+                submit_next()
+            while pending:
+                i, chunk, future = pending.popleft()
+                route = future.result()
+                submit_next()
+                logger.debug("[%s] Chunk %d route: %s", job_id, i + 1, route)
+                language = self._language_for_route(route)
+                yield i, chunk, route, language
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+    
+    def _language_for_route(self, route: str) -> Optional[str]:
+        """Get the ASR language code for a route (None means auto-detect)."""
+        if route in self._route_languages:
+            return self._route_languages[route]
+        return self.langid_service.get_language_code(route)
+    
+    def prefetch(self, audio_path: Path) -> memoryview:
+        """
+        Map an audio file into memory for zero-copy reads.
+        
+        The kernel is advised to read the file ahead sequentially, so the
+        disk I/O overlaps with the remaining pipeline setup and later readers
+        of the same path (ASR engines) hit the page cache.
+        
+        Args:
+            audio_path: Path to audio file
+        
+        Returns:
+            Read-only view of the file contents (release with _release_prefetch)
+        
+        Raises:
+            FileNotFoundError: If the audio file does not exist
+        """
+        try:
+            with open(audio_path, 'rb') as f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                if os.fstat(f.fileno()).st_size == 0:
+                    return memoryview(b"")
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        
+        if hasattr(mapped, 'madvise'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        return memoryview(mapped)
+    
+    @staticmethod
+    def _release_prefetch(buffer: memoryview) -> None:
+        """Release a view returned by prefetch() and unmap the file."""
+        mapped = buffer.obj
+        try:
+            buffer.release()
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        except BufferError:
+            # A decoder still holds a slice (e.g. in a traceback); the map closes when it is freed
+            pass
+    
     def format_document(
         self,
         result: TranscriptionResult
@@ -730,12 +1238,17 @@ class Orchestrator:
         start_time: float,
         end_time: float,
         session_id: str,
-        job_id: Optional[str] = None
+        job_id: Optional[str] = None,
+        arrival_monotonic: Optional[float] = None
     ) -> Optional[ProcessedSegment]:
         """
         Process a single audio chunk for live mode.
         
         Phase 6: Live mode processing that emits draft and verified events.
+        Chunks that arrive while the session already has
+        LIVE_MAX_INFLIGHT_PER_SESSION chunks in flight, or that are older than
+        LIVE_STALE_THRESHOLD_S by the time ASR would start, are dropped with
+        a "dropped" callback instead of transcribed.
         
         Args:
             audio_bytes: Raw audio data (WAV format expected)
@@ -743,92 +1256,155 @@ class Orchestrator:
             end_time: End timestamp in seconds
             session_id: Client session identifier
             job_id: Optional job identifier for logging
+            arrival_monotonic: time.monotonic() when the chunk was received
+                (defaults to now)
         
         Returns:
-            ProcessedSegment if successful, None on error
+            ProcessedSegment if successful, None on error or when dropped
         """
-        # Store session_id for callback
-        self._current_session_id = session_id
-        """
-        Process a single audio chunk for live mode.
+        if arrival_monotonic is None:
+            arrival_monotonic = time.monotonic()
         
-        Phase 6: Live mode processing that emits draft and verified events.
+        if not self._acquire_live_slot(session_id):
+            self._drop_live_chunk(
+                session_id, start_time, end_time, "overloaded", time.monotonic() - arrival_monotonic
+            )
+            return None
+        
+        try:
+            return self._process_live_audio_chunk(
+                audio_bytes, start_time, end_time, session_id, job_id, arrival_monotonic
+            )
+        finally:
+            self._release_live_slot(session_id)
+    
+    def _acquire_live_slot(self, session_id: str) -> bool:
+        """Reserve an in-flight slot for a session; False if it is at capacity."""
+        with self._live_inflight_lock:
+            inflight = self._live_inflight.get(session_id, 0)
+            if inflight >= self._cfg.live_max_inflight_per_session:
+                return False
+            self._live_inflight[session_id] = inflight + 1
+            return True
+    
+    def _release_live_slot(self, session_id: str) -> None:
+        """Release an in-flight slot taken by _acquire_live_slot."""
+        with self._live_inflight_lock:
+            inflight = self._live_inflight.get(session_id, 0) - 1
+            if inflight > 0:
+                self._live_inflight[session_id] = inflight
+            else:
+                self._live_inflight.pop(session_id, None)
+    
+    def _drop_live_chunk(
+        self,
+        session_id: str,
+        start_time: float,
+        end_time: float,
+        reason: str,
+        queued_for: float
+    ) -> None:
+        """Log and report a live chunk that is skipped without ASR."""
+        logger.warning(
+            "[live_%s] Dropping live chunk %.2f-%.2fs (%s, queued %.2fs)",
+            session_id[:8], start_time, end_time, reason, queued_for
+        )
+        if self.live_callback:
+            self.live_callback("dropped", {
+                "session_id": session_id,
+                "reason": reason,
+                "queued_seconds": queued_for,
+                "start": start_time,
+                "end": end_time
+            })
+    
+    @staticmethod
+    def _pcm_to_wav_bytes(pcm_bytes: bytes) -> bytes:
+        """
+        Wrap raw PCM in an in-memory WAV container.
         
         Args:
-            audio_bytes: Raw audio data (WAV format expected)
-            start_time: Start timestamp in seconds (relative to session start)
-            end_time: End timestamp in seconds
-            session_id: Client session identifier
-            job_id: Optional job identifier for logging
+            pcm_bytes: Raw 16kHz, mono, 16-bit PCM audio
         
         Returns:
-            ProcessedSegment if successful, None on error
+            WAV file contents
         """
+        import wave
+        
+        wav_io = io.BytesIO()
+        with wave.open(wav_io, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(pcm_bytes)
+        return wav_io.getvalue()
+    
+    def _process_live_audio_chunk(
+        self,
+        audio_bytes: bytes,
+        start_time: float,
+        end_time: float,
+        session_id: str,
+        job_id: Optional[str] = None,
+        arrival_monotonic: Optional[float] = None
+    ) -> Optional[ProcessedSegment]:
+        """Run an admitted live chunk through LangID and fusion, unless it went stale."""
+        # Store session_id for callbacks emitted on this thread
+        self._tls.session_id = session_id
         if job_id is None:
             job_id = f"live_{session_id[:8]}"
         
-        logger.debug(f"[{job_id}] Processing live audio chunk: {start_time:.2f}-{end_time:.2f}s")
+        logger.debug("[%s] Processing live audio chunk: %.2f-%.2fs", job_id, start_time, end_time)
         
         # Phase 7: Denoise audio chunk if enabled for live mode
         working_audio_bytes = audio_bytes
-        if getattr(config, 'LIVE_DENOISE_ENABLED', False):
+        if self._cfg.live_denoise_enabled:
             try:
                 if self.denoiser is None:
                     # Initialize denoiser on-demand for live mode
                     from audio.denoiser import AudioDenoiser
                     self.denoiser = AudioDenoiser(
-                        backend=getattr(config, 'DENOISE_BACKEND', 'noisereduce'),
-                        strength=getattr(config, 'DENOISE_STRENGTH', 'medium'),
-                        sample_rate=getattr(config, 'DENOISE_SAMPLE_RATE', 16000)
+                        backend=self._cfg.denoise_backend,
+                        strength=self._cfg.denoise_strength,
+                        sample_rate=self._cfg.denoise_sample_rate
                     )
-                    logger.debug(f"[{job_id}] AudioDenoiser initialized for live mode")
+                    logger.debug("[%s] AudioDenoiser initialized for live mode", job_id)
                 
                 # Get sample rate from chunk_data or use default
-                sample_rate = getattr(config, 'DENOISE_SAMPLE_RATE', 16000)
+                sample_rate = self._cfg.denoise_sample_rate
                 working_audio_bytes = self.denoiser.denoise_chunk(audio_bytes, sample_rate)
-                logger.debug(f"[{job_id}] Audio chunk denoised")
+                logger.debug("[%s] Audio chunk denoised", job_id)
             except Exception as e:
                 logger.warning(f"[{job_id}] Live denoising failed: {e}. Using original audio.")
                 working_audio_bytes = audio_bytes
         
-        # Create temporary file from audio bytes (ensure it's a valid WAV for faster-whisper)
         try:
-            import io
-            import wave
-            
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                # Wrap raw pcm bytes in a WAV container (assuming 16kHz, mono, 16-bit)
-                with wave.open(tmp_file.name, 'wb') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)
-                    wav_file.setframerate(16000)
-                    wav_file.writeframes(working_audio_bytes)
-                tmp_path = Path(tmp_file.name)
-            
-            # Create AudioChunk
+            # Create AudioChunk over an in-memory WAV (no temp file on the live path)
             duration = end_time - start_time
             chunk = AudioChunk(
                 start_time=start_time,
                 end_time=end_time,
-                audio_path=tmp_path,
-                duration=duration
+                audio_path=None,
+                duration=duration,
+                audio_buffer=self._pcm_to_wav_bytes(working_audio_bytes)
             )
             
             # Identify route
             route = self.langid_service.identify_segment(chunk)
-            language = self.langid_service.get_language_code(route)
+            language = self._language_for_route(route)
+            
+            # Checked just before ASR, after the waits for denoise and LangID
+            if arrival_monotonic is not None:
+                queued_for = time.monotonic() - arrival_monotonic
+                if queued_for > self._cfg.live_stale_threshold_s:
+                    self._drop_live_chunk(session_id, start_time, end_time, "stale", queued_for)
+                    return None
             
             # Process chunk (will emit draft/verified via callback)
             processed_segment = self._process_chunk_with_fusion(
                 chunk, route, language, job_id
             )
             
-            # Clean up temporary file
-            try:
-                tmp_path.unlink()
-            except Exception as e:
-                logger.warning(f"[{job_id}] Failed to delete temp file: {e}")
-            
             return processed_segment
             
         except Exception as e:
@@ -864,7 +1440,7 @@ class Orchestrator:
             logger.info("Shabad detector initialized for shabad mode")
             
             # Initialize semantic praman service
-            semantic_index_path = getattr(config, 'SEMANTIC_INDEX_PATH', None)
+            semantic_index_path = self._cfg.semantic_index_path
             self.semantic_praman_service = get_semantic_praman_service(semantic_index_path)
             
             # Build index if not already built
@@ -912,52 +1488,40 @@ class Orchestrator:
             return None
         
         # Store session_id for callback
-        self._current_session_id = session_id
+        self._tls.session_id = session_id
         
         if job_id is None:
             job_id = f"shabad_{session_id[:8]}"
         
-        logger.debug(f"[{job_id}] Processing shabad audio chunk: {start_time:.2f}-{end_time:.2f}s")
+        logger.debug("[%s] Processing shabad audio chunk: %.2f-%.2fs", job_id, start_time, end_time)
         
         # Apply aggressive denoising for shabad mode (kirtan has musical instruments)
         working_audio_bytes = audio_bytes
-        shabad_denoise_strength = getattr(config, 'SHABAD_MODE_DENOISE_STRENGTH', 'aggressive')
+        shabad_denoise_strength = self._cfg.shabad_mode_denoise_strength
         
         try:
             from audio.denoiser import AudioDenoiser
             denoiser = AudioDenoiser(
-                backend=getattr(config, 'DENOISE_BACKEND', 'noisereduce'),
+                backend=self._cfg.denoise_backend,
                 strength=shabad_denoise_strength,
-                sample_rate=getattr(config, 'DENOISE_SAMPLE_RATE', 16000)
+                sample_rate=self._cfg.denoise_sample_rate
             )
-            sample_rate = getattr(config, 'DENOISE_SAMPLE_RATE', 16000)
+            sample_rate = self._cfg.denoise_sample_rate
             working_audio_bytes = denoiser.denoise_chunk(audio_bytes, sample_rate)
-            logger.debug(f"[{job_id}] Audio denoised with strength: {shabad_denoise_strength}")
+            logger.debug("[%s] Audio denoised with strength: %s", job_id, shabad_denoise_strength)
         except Exception as e:
             logger.warning(f"[{job_id}] Shabad mode denoising failed: {e}. Using original audio.")
             working_audio_bytes = audio_bytes
         
         try:
-            import io
-            import wave
-            
-            # Create temporary file from audio bytes (ensure it's a valid WAV for faster-whisper)
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                # Wrap raw pcm bytes in a WAV container (assuming 16kHz, mono, 16-bit)
-                with wave.open(tmp_file.name, 'wb') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)
-                    wav_file.setframerate(16000)
-                    wav_file.writeframes(working_audio_bytes)
-                tmp_path = Path(tmp_file.name)
-            
-            # Create AudioChunk
+            # Create AudioChunk over an in-memory WAV
             duration = end_time - start_time
             chunk = AudioChunk(
                 start_time=start_time,
                 end_time=end_time,
-                audio_path=tmp_path,
-                duration=duration
+                audio_path=None,
+                duration=duration,
+                audio_buffer=self._pcm_to_wav_bytes(working_audio_bytes)
             )
             
             # Get Gurbani prompt for better ASR
@@ -977,7 +1541,7 @@ class Orchestrator:
             )
             
             transcribed_text = asr_result.text
-            logger.debug(f"[{job_id}] Transcribed: {transcribed_text[:100]}...")
+            logger.debug("[%s] Transcribed: %.100s...", job_id, transcribed_text)
             
             # Detect shabad and match line
             detection_result = self.shabad_detector.detect(transcribed_text)
@@ -1077,8 +1641,8 @@ class Orchestrator:
                         ]
                         
                         logger.debug(
-                            f"[{job_id}] Found {len(result['similar_pramans'])} similar, "
-                            f"{len(result['dissimilar_pramans'])} dissimilar pramans"
+                            "[%s] Found %d similar, %d dissimilar pramans",
+                            job_id, len(result['similar_pramans']), len(result['dissimilar_pramans'])
                         )
                     except Exception as e:
                         logger.warning(f"[{job_id}] Praman search failed: {e}")
@@ -1087,12 +1651,6 @@ class Orchestrator:
             if self.live_callback:
                 self.live_callback("shabad_update", result)
             
-            # Clean up temporary file
-            try:
-                tmp_path.unlink()
-            except Exception as e:
-                logger.warning(f"[{job_id}] Failed to delete temp file: {e}")
-            
             return result
             
         except Exception as e:
@@ -1142,7 +1700,8 @@ class Orchestrator:
         chunk: AudioChunk,
         route: str,
         language: Optional[str],
-        job_id: Optional[str] = None
+        job_id: Optional[str] = None,
+        asr_a_result: Optional[ASRResult] = None
     ) -> ProcessedSegment:
         """
         Process a chunk using multi-ASR ensemble with fusion.
@@ -1157,46 +1716,41 @@ class Orchestrator:
             chunk: AudioChunk to process
             route: Route string (punjabi_speech, english_speech, etc.)
             language: Language code for ASR
+            job_id: Optional job identifier for logging
+            asr_a_result: ASR-A result already produced by a batched call
+                          (ASR-A is run here if None)
         
         Returns:
             ProcessedSegment with fused results
         """
-        # Step 0: Generate Gurbani prompt if enabled
-        gurbani_prompt = None
-        if self.prompt_builder and self._enable_gurbani_prompting:
-            try:
-                # Get domain mode for prompt
-                domain_mode = getattr(self, '_current_domain_mode', self._domain_mode)
-                gurbani_prompt = self.prompt_builder.get_prompt(
-                    mode=domain_mode.value,
-                    context="scripture" if route == ROUTE_SCRIPTURE_QUOTE_LIKELY else None
-                )
-                logger.debug(f"[{job_id}] Gurbani prompt generated ({len(gurbani_prompt)} chars)")
-            except Exception as e:
-                logger.warning(f"[{job_id}] Failed to generate Gurbani prompt: {e}")
-        
         # Step 1: Run ASR-A immediately (primary engine)
-        logger.debug(f"[{job_id}] Running ASR-A (Whisper) for chunk at {chunk.start_time:.2f}s")
+        draft_converted = None
         try:
-            asr_a_result = self.asr_service.transcribe_chunk(
-                chunk,
-                language=language,
-                route=route,
-                initial_prompt=gurbani_prompt  # Use Gurbani prompt
-            )
-            logger.debug(f"[{job_id}] ASR-A completed: confidence={asr_a_result.confidence:.2f}")
+            if asr_a_result is None:
+                # Step 0: Generate Gurbani prompt if enabled
+                gurbani_prompt = self._build_gurbani_prompt(route, job_id)
+                
+                logger.debug("[%s] Running ASR-A (Whisper) for chunk at %.2fs", job_id, chunk.start_time)
+                asr_a_result = self.asr_service.transcribe_chunk(
+                    chunk,
+                    language=language,
+                    route=route,
+                    initial_prompt=gurbani_prompt  # Use Gurbani prompt
+                )
+            logger.debug("[%s] ASR-A completed: confidence=%.2f", job_id, asr_a_result.confidence)
             
             # Phase 6: Emit draft caption for live mode
             if self.live_callback:
                 segment_id = f"seg_{chunk.start_time:.2f}_{chunk.end_time:.2f}"
                 try:
                     # Quick script conversion for draft (may be incomplete)
-                    draft_converted = self.script_converter.convert(
-                        asr_a_result.text,
-                        source_language=asr_a_result.language
-                    )
+                    if route in DRAFT_CONVERSION_ROUTES:
+                        draft_converted = self.script_converter.convert(
+                            asr_a_result.text,
+                            source_language=asr_a_result.language
+                        )
                     self.live_callback("draft", {
-                        "session_id": getattr(self, '_current_session_id', 'unknown'),
+                        "session_id": getattr(self._tls, 'session_id', 'unknown'),
                         "segment_id": segment_id,
                         "start": chunk.start_time,
                         "end": chunk.end_time,
@@ -1217,26 +1771,29 @@ class Orchestrator:
         # Step 3: Run additional engines in parallel (if enabled)
         additional_results = []
         if engines_to_run and self.parallel_execution:
-            logger.debug(f"[{job_id}] Running additional engines in parallel: {', '.join(engines_to_run)}")
+            logger.debug("[%s] Running additional engines in parallel: %s", job_id, engines_to_run)
             additional_results = self._run_additional_engines_parallel(
-                chunk, route, language, engines_to_run, job_id
+                chunk, route, language, engines_to_run, job_id, asr_a_result
             )
         elif engines_to_run:
             # Sequential execution
-            logger.debug(f"[{job_id}] Running additional engines sequentially: {', '.join(engines_to_run)}")
+            logger.debug("[%s] Running additional engines sequentially: %s", job_id, engines_to_run)
             additional_results = self._run_additional_engines_sequential(
                 chunk, route, language, engines_to_run, job_id
             )
         
         # Step 4: Collect all hypotheses
         all_hypotheses = [asr_a_result] + additional_results
-        logger.debug(f"[{job_id}] Collected {len(all_hypotheses)} hypotheses for fusion")
+        logger.debug("[%s] Collected %d hypotheses for fusion", job_id, len(all_hypotheses))
         
         # Step 5: Fuse hypotheses
         try:
             fusion_result = self.fusion_service.fuse_hypotheses(all_hypotheses, chunk)
-            logger.debug(f"[{job_id}] Fusion completed: confidence={fusion_result.fused_confidence:.2f}, "
-                        f"agreement={fusion_result.agreement_score:.2f}, selected={fusion_result.selected_engine}")
+            logger.debug(
+                "[%s] Fusion completed: confidence=%.2f, agreement=%.2f, selected=%s",
+                job_id, fusion_result.fused_confidence,
+                fusion_result.agreement_score, fusion_result.selected_engine
+            )
         except Exception as e:
             logger.error(f"[{job_id}] Fusion failed: {e}")
             raise FusionError(f"Failed to fuse hypotheses: {e}")
@@ -1244,11 +1801,11 @@ class Orchestrator:
         # Step 5a: Check for empty transcription and retry if needed
         retry_enabled = (
             self.current_processing_options.get('segmentRetryEnabled', True) if self.current_processing_options
-            else getattr(config, 'SEGMENT_RETRY_ON_EMPTY', True)
+            else self._cfg.segment_retry_on_empty
         )
         max_retries = (
             self.current_processing_options.get('maxSegmentRetries', 2) if self.current_processing_options
-            else getattr(config, 'SEGMENT_MAX_RETRIES', 2)
+            else self._cfg.segment_max_retries
         )
         
         if retry_enabled and not fusion_result.fused_text.strip() and max_retries > 0:
@@ -1257,9 +1814,7 @@ class Orchestrator:
                 try:
                     logger.info(f"[{job_id}] Retry attempt {attempt + 1}/{max_retries} with increased resources...")
                     # Retry with ASR-B (Indic) which is better for complex vocabulary
-                    if self.asr_indic is None:
-                        self.asr_indic = ASRIndic()
-                    retry_result = self.asr_indic.transcribe_chunk(chunk, language, route)
+                    retry_result = self._get_asr_indic().transcribe_chunk(chunk, language, route)
                     
                     if retry_result.text.strip():
                         # Found transcription in retry
@@ -1277,11 +1832,16 @@ class Orchestrator:
             # If still empty after retries, mark for review
             if not fusion_result.fused_text.strip():
                 logger.error(f"[{job_id}] All retry attempts failed, segment will be marked for review")
-                fusion_result.fused_text = "[Transcription failed - review audio]"
+                fusion_result.fused_text = EMPTY_TRANSCRIPTION_TEXT
                 fusion_result.fused_confidence = 0.0
         
         # Step 6: Apply re-decode policy if needed
-        if self.fusion_service.should_redecode(fusion_result):
+        # Skip when several engines already agree: a third decode rarely changes the outcome
+        engines_agree = (
+            len(fusion_result.hypotheses) > 1 and
+            fusion_result.agreement_score >= self.redecode_min_agreement
+        )
+        if not engines_agree and self.fusion_service.should_redecode(fusion_result):
             logger.warning(f"[{job_id}] Low confidence ({fusion_result.fused_confidence:.2f}), triggering re-decode...")
             redecode_result = self._redecode_chunk(chunk, route, language, job_id)
             if redecode_result:
@@ -1301,9 +1861,9 @@ class Orchestrator:
                 # Update confidence if LM rescoring boosted it
                 if rescored.combined_score > fusion_result.fused_confidence:
                     logger.debug(
-                        f"[{job_id}] N-gram LM boosted confidence: "
-                        f"{fusion_result.fused_confidence:.3f} → {rescored.combined_score:.3f} "
-                        f"(perplexity: {rescored.perplexity:.1f})"
+                        "[%s] N-gram LM boosted confidence: %.3f → %.3f (perplexity: %.1f)",
+                        job_id, fusion_result.fused_confidence,
+                        rescored.combined_score, rescored.perplexity
                     )
                     fusion_result.fused_confidence = rescored.combined_score
             except Exception as e:
@@ -1319,27 +1879,30 @@ class Orchestrator:
                 )
                 if quote_context.is_quote_likely:
                     logger.debug(
-                        f"[{job_id}] Quote context detected: "
-                        f"type={quote_context.context_type}, "
-                        f"confidence={quote_context.quote_confidence:.2f}, "
-                        f"signals={quote_context.detected_signals}"
+                        "[%s] Quote context detected: type=%s, confidence=%.2f, signals=%s",
+                        job_id, quote_context.context_type,
+                        quote_context.quote_confidence, quote_context.detected_signals
                     )
                     # If this is a quote intro, note it for next segment
                     if quote_context.is_quote_intro:
-                        logger.debug(f"[{job_id}] Quote introduction detected")
+                        logger.debug("[%s] Quote introduction detected", job_id)
             except Exception as e:
                 logger.warning(f"[{job_id}] Quote context detection failed: {e}")
         
         # Step 7: Phase 3 - Apply script conversion
-        logger.debug(f"[{job_id}] Applying script conversion to fused text...")
+        logger.debug("[%s] Applying script conversion to fused text...", job_id)
         try:
-            converted = self.script_converter.convert(
-                fusion_result.fused_text,
-                source_language=asr_a_result.language
-            )
+            if draft_converted is not None and fusion_result.fused_text == asr_a_result.text:
+                # Fusion kept ASR-A's text, so the draft conversion already covers it
+                converted = draft_converted
+            else:
+                converted = self.script_converter.convert(
+                    fusion_result.fused_text,
+                    source_language=asr_a_result.language
+                )
             logger.debug(
-                f"[{job_id}] Script conversion: {converted.original_script} → Gurmukhi "
-                f"(confidence: {converted.confidence:.2f})"
+                "[%s] Script conversion: %s → Gurmukhi (confidence: %.2f)",
+                job_id, converted.original_script, converted.confidence
             )
         except Exception as e:
             logger.error(f"[{job_id}] Script conversion failed: {e}", exc_info=True)
@@ -1358,9 +1921,9 @@ class Orchestrator:
             # Step 7b-1: Detect drift
             drift_diagnostic = self.drift_detector.detect(domain_text)
             logger.debug(
-                f"[{job_id}] Drift detection: purity={drift_diagnostic.script_purity:.2f}, "
-                f"latin={drift_diagnostic.latin_ratio:.3f}, oov={drift_diagnostic.oov_ratio:.2f}, "
-                f"severity={drift_diagnostic.severity.value}"
+                "[%s] Drift detection: purity=%.2f, latin=%.3f, oov=%.2f, severity=%s",
+                job_id, drift_diagnostic.script_purity, drift_diagnostic.latin_ratio,
+                drift_diagnostic.oov_ratio, drift_diagnostic.severity.value
             )
             
             # Step 7b-2: Apply script lock if strict mode or drift detected
@@ -1429,15 +1992,15 @@ class Orchestrator:
                             converted.gurmukhi = domain_text
                     elif sggs_alignment_result.alignment_score >= 0.5:
                         logger.debug(
-                            f"[{job_id}] SGGS alignment found candidate (score={sggs_alignment_result.alignment_score:.2f}) "
-                            f"but below threshold"
+                            "[%s] SGGS alignment found candidate (score=%.2f) but below threshold",
+                            job_id, sggs_alignment_result.alignment_score
                         )
                 except Exception as e:
                     logger.warning(f"[{job_id}] SGGS alignment failed: {e}")
         
         # Step 8: Phase 4 - Quote Detection + Matching
-        # Create temporary segment for quote detection
-        temp_segment = ProcessedSegment(
+        # Build the segment once; quote replacement updates it in place
+        segment = ProcessedSegment(
             start=chunk.start_time,
             end=chunk.end_time,
             route=route,
@@ -1459,7 +2022,7 @@ class Orchestrator:
         )
         
         if should_detect_quotes:
-            logger.debug(f"[{job_id}] Detecting quote candidates...")
+            logger.debug("[%s] Detecting quote candidates...", job_id)
             try:
                 # If we already have a SGGS alignment result, use it for quote matching
                 if sggs_alignment_result and sggs_alignment_result.matched_line:
@@ -1471,7 +2034,7 @@ class Orchestrator:
                         line_id=matched_line.line_id,
                         canonical_text=matched_line.gurmukhi,
                         canonical_roman=matched_line.roman,
-                        spoken_text=temp_segment.text,
+                        spoken_text=segment.text,
                         confidence=sggs_alignment_result.confidence,
                         ang=matched_line.ang,
                         raag=matched_line.raag,
@@ -1482,26 +2045,23 @@ class Orchestrator:
                         f"[{job_id}] Using SGGS alignment for quote match: {matched_line.line_id} "
                         f"(confidence: {sggs_alignment_result.confidence:.2f})"
                     )
-                    temp_segment = self.quote_replacer.replace_with_canonical(
-                        temp_segment,
-                        quote_match
-                    )
+                    self.quote_replacer.replace_with_canonical(segment, quote_match)
                 else:
                     # Use traditional quote detection flow
                     candidates = self.quote_detector.detect_candidates(
-                        temp_segment,
+                        segment,
                         hypotheses=fusion_result.hypotheses
                     )
                     
                     if candidates:
-                        logger.debug(f"[{job_id}] Found {len(candidates)} quote candidate(s)")
+                        logger.debug("[%s] Found %d quote candidate(s)", job_id, len(candidates))
                         
                         # Try to find a match using constrained matcher first (more accurate)
                         quote_match = None
                         if self.constrained_matcher:
                             try:
                                 alignment = self.constrained_matcher.find_best_alignment(
-                                    temp_segment.text
+                                    segment.text
                                 )
                                 if alignment and alignment.is_confident_match:
                                     from core.models import QuoteMatch
@@ -1511,7 +2071,7 @@ class Orchestrator:
                                         line_id=matched_line.line_id,
                                         canonical_text=matched_line.gurmukhi,
                                         canonical_roman=matched_line.roman,
-                                        spoken_text=temp_segment.text,
+                                        spoken_text=segment.text,
                                         confidence=alignment.confidence,
                                         ang=matched_line.ang,
                                         raag=matched_line.raag,
@@ -1523,7 +2083,7 @@ class Orchestrator:
                                         f"(score: {alignment.alignment_score:.2f})"
                                     )
                             except Exception as e:
-                                logger.debug(f"[{job_id}] Constrained matcher failed: {e}")
+                                logger.debug("[%s] Constrained matcher failed: %s", job_id, e)
                         
                         # Fall back to traditional quote matcher
                         if not quote_match:
@@ -1539,65 +2099,152 @@ class Orchestrator:
                                 f"(confidence: {quote_match.confidence:.2f})"
                             )
                             # Replace with canonical text
-                            temp_segment = self.quote_replacer.replace_with_canonical(
-                                temp_segment,
-                                quote_match
-                            )
+                            self.quote_replacer.replace_with_canonical(segment, quote_match)
                         else:
-                            logger.debug(f"[{job_id}] No quote match found for candidates")
+                            logger.debug("[%s] No quote match found for candidates", job_id)
                     else:
-                        logger.debug(f"[{job_id}] No quote candidates detected")
+                        logger.debug("[%s] No quote candidates detected", job_id)
             except Exception as e:
                 logger.error(f"[{job_id}] Quote detection/matching failed: {e}", exc_info=True)
                 # Continue with original text - don't fail the whole segment
         
-        # Step 9: Create final processed segment (use temp_segment, update needs_review)
+        # Step 9: Finalize needs_review on the segment
         # Update needs_review based on all factors
         needs_review = (
-            fusion_result.fused_confidence < (
-                config.SEGMENT_CONFIDENCE_THRESHOLD 
-                if hasattr(config, 'SEGMENT_CONFIDENCE_THRESHOLD') 
-                else 0.7
-            ) or
+            fusion_result.fused_confidence < self._cfg.segment_confidence_threshold or
             fusion_result.agreement_score < 0.5 or  # Low agreement also flags review
             (converted and converted.needs_review) or  # Script conversion review flag
-            temp_segment.needs_review  # Quote match review flag
+            segment.needs_review  # Quote match review flag
         )
         
-        temp_segment.needs_review = needs_review
+        segment.needs_review = needs_review
         
         # Phase 6: Emit verified update for live mode
         if self.live_callback:
             segment_id = f"seg_{chunk.start_time:.2f}_{chunk.end_time:.2f}"
             try:
                 quote_match_data = None
-                if temp_segment.quote_match:
+                if segment.quote_match:
                     quote_match_data = {
-                        "source": temp_segment.quote_match.source.value if hasattr(temp_segment.quote_match.source, 'value') else str(temp_segment.quote_match.source),
-                        "line_id": temp_segment.quote_match.line_id,
-                        "ang": temp_segment.quote_match.ang,
-                        "raag": temp_segment.quote_match.raag,
-                        "author": temp_segment.quote_match.author,
-                        "confidence": temp_segment.quote_match.confidence
+                        "source": segment.quote_match.source.value if hasattr(segment.quote_match.source, 'value') else str(segment.quote_match.source),
+                        "line_id": segment.quote_match.line_id,
+                        "ang": segment.quote_match.ang,
+                        "raag": segment.quote_match.raag,
+                        "author": segment.quote_match.author,
+                        "confidence": segment.quote_match.confidence
                     }
                 
                 self.live_callback("verified", {
-                    "session_id": getattr(self, '_current_session_id', 'unknown'),
+                    "session_id": getattr(self._tls, 'session_id', 'unknown'),
                     "segment_id": segment_id,
                     "start": chunk.start_time,
                     "end": chunk.end_time,
-                    "gurmukhi": temp_segment.text,
-                    "roman": temp_segment.roman or "",
-                    "confidence": temp_segment.confidence,
+                    "gurmukhi": segment.text,
+                    "roman": segment.roman or "",
+                    "confidence": segment.confidence,
                     "quote_match": quote_match_data,
-                    "needs_review": temp_segment.needs_review
+                    "needs_review": segment.needs_review
                 })
             except Exception as e:
                 logger.warning(f"[{job_id}] Failed to emit verified update: {e}")
         
-        return temp_segment
+        return segment
+    
+    def _build_gurbani_prompt(self, route: str, job_id: Optional[str] = None) -> Optional[str]:
+        """
+        Build the Gurbani prompt for ASR-A, if prompting is enabled.
+        
+        Args:
+            route: Route string
+            job_id: Optional job identifier for logging
+        
+        Returns:
+            Prompt text, or None if disabled or generation failed
+        """
+        if not (self.prompt_builder and self._enable_gurbani_prompting):
+            return None
+        try:
+            # Get domain mode for prompt
+            domain_mode = getattr(self, '_current_domain_mode', self._domain_mode)
+            gurbani_prompt = self.prompt_builder.get_prompt(
+                mode=domain_mode.value,
+                context="scripture" if route == ROUTE_SCRIPTURE_QUOTE_LIKELY else None
+            )
+            logger.debug("[%s] Gurbani prompt generated (%d chars)", job_id, len(gurbani_prompt))
+            return gurbani_prompt
+        except Exception as e:
+            logger.warning(f"[{job_id}] Failed to generate Gurbani prompt: {e}")
+            return None
+    
+    def _supports_batch_asr(self) -> bool:
+        """Check whether the primary ASR service implements transcribe_batch."""
+        # Looked up on the class so objects answering any attribute (proxies, mocks) don't qualify
+        return callable(getattr(type(self.asr_service), 'transcribe_batch', None))
+    
+    @staticmethod
+    def _iter_asr_batches(
+        routed_chunks: Iterator[Tuple[int, AudioChunk, str, Optional[str]]],
+        batch_size: int
+    ) -> Iterator[List[Tuple[int, AudioChunk, str, Optional[str]]]]:
+        """
+        Group consecutive routed chunks sharing a route and language.
+        
+        Args:
+            routed_chunks: (index, chunk, route, language) tuples in order
+            batch_size: Maximum chunks per group
+        
+        Yields:
+            Lists of consecutive tuples with equal (route, language)
+        """
+        batch = []
+        for item in routed_chunks:
+            if batch and (
+                len(batch) >= batch_size or
+                (item[2], item[3]) != (batch[0][2], batch[0][3])
+            ):
+                yield batch
+                batch = []
+            batch.append(item)
+        if batch:
+            yield batch
+    
+    def _transcribe_primary_batch(
+        self,
+        batch: List[Tuple[int, AudioChunk, str, Optional[str]]],
+        job_id: Optional[str] = None
+    ) -> List[Optional[ASRResult]]:
+        """
+        Run ASR-A once for a group of chunks sharing a route and language.
+        
+        Args:
+            batch: (index, chunk, route, language) tuples from _iter_asr_batches
+            job_id: Optional job identifier for logging
+        
+        Returns:
+            ASR-A result per chunk, or all None if batching is unavailable or
+            failed (chunks then run ASR-A individually)
+        """
+        if len(batch) < 2 or not self._supports_batch_asr():
+            return [None] * len(batch)
+        
+        route, language = batch[0][2], batch[0][3]
+        try:
+            results = self.asr_service.transcribe_batch(
+                [chunk for _, chunk, _, _ in batch],
+                language=language,
+                route=route,
+                initial_prompt=self._build_gurbani_prompt(route, job_id)
+            )
+            results = list(results)
+            if len(results) != len(batch):
+                raise ValueError(f"expected {len(batch)} results, got {len(results)}")
+            logger.debug("[%s] ASR-A batch of %d chunks completed", job_id, len(batch))
+            return results
+        except Exception as e:
+            logger.warning(f"[{job_id}] Batched ASR-A failed, falling back to per-chunk: {e}")
+            return [None] * len(batch)
     
-    def _get_engines_for_route(self, route: str) -> List[str]:
+    def _get_engines_for_route(self, route: str) -> Tuple[str, ...]:
         """
         Determine which additional ASR engines to run based on route.
         
@@ -1605,21 +2252,23 @@ class Orchestrator:
             route: Route string
         
         Returns:
-            List of engine names to run ('asr_b', 'asr_c')
+            Tuple of engine names to run ('asr_b', 'asr_c')
         """
-        engines = []
+        return ROUTE_TO_ENGINES.get(route, ())
+    
+    def _get_engine(self, engine_name: str) -> Any:
+        """
+        Resolve an additional-engine name to the service that runs it.
         
-        if route == ROUTE_PUNJABI_SPEECH:
-            engines.append('asr_b')  # Indic ASR for Punjabi
-        elif route == ROUTE_ENGLISH_SPEECH:
-            engines.append('asr_c')  # English ASR
-        elif route == ROUTE_SCRIPTURE_QUOTE_LIKELY:
-            engines.append('asr_b')  # Indic ASR for Gurbani
-        elif route == ROUTE_MIXED:
-            engines.append('asr_b')  # Indic ASR
-            engines.append('asr_c')  # English ASR
+        Args:
+            engine_name: 'asr_b', 'asr_c', or a provider type (whisper,
+                indicconformer, wav2vec2, commercial, ...)
         
-        return engines
+        Returns:
+            ASR service with a transcribe_chunk method
+        """
+        getter = self._legacy_engine_getters.get(engine_name)
+        return getter() if getter is not None else self.get_provider(engine_name)
     
     def _run_additional_engines_parallel(
         self,
@@ -1627,16 +2276,24 @@ class Orchestrator:
         route: str,
         language: Optional[str],
         engines: List[str],
-        job_id: Optional[str] = None
+        job_id: Optional[str] = None,
+        asr_a_result: Optional[ASRResult] = None
     ) -> List[ASRResult]:
         """
         Run additional ASR engines in parallel.
         
+        When asr_a_result is given and a finished engine already agrees with
+        it at or above ASR_EARLY_ABORT_AGREEMENT, the remaining engines are
+        cancelled instead of waited on, unless engines still running from
+        earlier aborts would then hold every pool worker.
+        
         Args:
             chunk: AudioChunk to process
             route: Route string
             language: Language code
             engines: List of engine names to run (asr_b, asr_c, indicconformer, wav2vec2, commercial)
+            job_id: Optional job identifier for logging
+            asr_a_result: Primary hypothesis used to decide on early abort
         
         Returns:
             List of ASRResult from additional engines
@@ -1646,71 +2303,89 @@ class Orchestrator:
         def run_engine(engine_name: str) -> Optional[ASRResult]:
             """Run a single ASR engine with timeout."""
             try:
-                logger.debug(f"[{job_id}] Starting {engine_name}...")
-                
-                # Legacy engine names
-                if engine_name == 'asr_b':
-                    if self.asr_indic is None:
-                        self.asr_indic = ASRIndic()
-                    result = self.asr_indic.transcribe_chunk(chunk, language, route)
-                elif engine_name == 'asr_c':
-                    if self.asr_english is None:
-                        self.asr_english = ASREnglish()
-                    result = self.asr_english.transcribe_chunk(chunk, language, route)
+                logger.debug("[%s] Starting %s...", job_id, engine_name)
                 
-                # New provider registry engines
-                elif engine_name == 'indicconformer':
-                    provider = self.get_provider('indicconformer')
-                    result = provider.transcribe_chunk(chunk, language, route)
-                elif engine_name == 'wav2vec2':
-                    provider = self.get_provider('wav2vec2')
-                    result = provider.transcribe_chunk(chunk, language, route)
-                elif engine_name == 'commercial':
-                    provider = self.get_provider('commercial')
-                    result = provider.transcribe_chunk(chunk, language, route)
-                elif engine_name == 'whisper':
-                    # Use primary whisper service
-                    result = self.asr_service.transcribe_chunk(chunk, language, route)
-                else:
-                    # Try to get from registry
-                    provider = self.get_provider(engine_name)
-                    result = provider.transcribe_chunk(chunk, language, route)
-                
-                logger.debug(f"[{job_id}] {engine_name} completed: confidence={result.confidence:.2f}")
+                result = self._get_engine(engine_name).transcribe_chunk(chunk, language, route)
+                logger.debug("[%s] %s completed: confidence=%.2f", job_id, engine_name, result.confidence)
                 return result
                 
             except Exception as e:
                 logger.warning(f"[{job_id}] {engine_name} failed: {e}")
                 return None
         
-        # Determine max workers from options or use number of engines
-        max_workers = len(engines)
-        if self.current_processing_options:
-            parallel_workers = self.current_processing_options.get('parallelWorkers')
-            if parallel_workers:
-                max_workers = min(parallel_workers, len(engines))
-        
-        # Run engines in parallel with timeout
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(run_engine, engine): engine 
-                for engine in engines
-            }
-            
-            for future in futures:
+        # Run engines on the shared pool, consuming them as they finish
+        futures = dict(zip(self._submit_to_asr_pool(run_engine, engines), engines))
+        completed = {}
+        try:
+            for future in as_completed(futures, timeout=self.asr_timeout):
+                engine_name = futures[future]
                 try:
-                    result = future.result(timeout=self.asr_timeout)
-                    if result:
-                        results.append(result)
-                except FutureTimeoutError:
-                    engine_name = futures[future]
-                    logger.warning(f"[{job_id}] {engine_name} timed out after {self.asr_timeout}s")
+                    completed[engine_name] = future.result()
                 except Exception as e:
-                    engine_name = futures[future]
                     logger.warning(f"[{job_id}] {engine_name} error: {e}")
+                    continue
+                
+                result = completed[engine_name]
+                if (
+                    asr_a_result is not None and result is not None
+                    and len(completed) < len(futures)
+                    and self.fusion_service.preview_agreement(asr_a_result, result)
+                    >= self._cfg.asr_early_abort_agreement
+                ):
+                    pending = {f: name for f, name in futures.items() if not f.done()}
+                    if self._abandon_engine_futures(list(pending)):
+                        for pending_name in pending.values():
+                            logger.debug(
+                                "[%s] %s agrees with ASR-A, abandoning %s",
+                                job_id, engine_name, pending_name
+                            )
+                        break
+        except FutureTimeoutError:
+            pending = {f: name for f, name in futures.items() if not f.done()}
+            self._abandon_engine_futures(list(pending), force=True)
+            for engine_name in pending.values():
+                logger.warning(f"[{job_id}] {engine_name} timed out after {self.asr_timeout}s")
+        
+        # Keep results in engine order so fusion tie-breaks stay deterministic
+        for engine in engines:
+            result = completed.get(engine)
+            if result:
+                results.append(result)
         
         return results
     
+    def _abandon_engine_futures(self, futures: List[Future], force: bool = False) -> bool:
+        """
+        Stop waiting for engine futures, cancelling those that have not started.
+        
+        An engine that is already running cannot be stopped and keeps its
+        pool worker until it finishes. Unless force is set, nothing is
+        abandoned when that would leave no worker free for other chunks.
+        
+        Args:
+            futures: Futures of engines still pending
+            force: Abandon even if the pool would be saturated (e.g. on timeout)
+        
+        Returns:
+            True if the futures were abandoned
+        """
+        with self._abandoned_lock:
+            running = sum(future.running() for future in futures)
+            if not force and self._abandoned_engines + running >= self._asr_pool_size:
+                return False
+            abandoned = [future for future in futures if not future.cancel()]
+            self._abandoned_engines += len(abandoned)
+        
+        # Outside the lock: the callback runs at once if the engine just finished
+        for future in abandoned:
+            future.add_done_callback(self._release_abandoned_engine)
+        return True
+    
+    def _release_abandoned_engine(self, future: Future) -> None:
+        """Count an abandoned engine's pool worker as free again."""
+        with self._abandoned_lock:
+            self._abandoned_engines -= 1
+    
     def _run_additional_engines_sequential(
         self,
         chunk: AudioChunk,
@@ -1735,40 +2410,8 @@ class Orchestrator:
         
         for engine in engines:
             try:
-                # Legacy engine names
-                if engine == 'asr_b':
-                    if self.asr_indic is None:
-                        self.asr_indic = ASRIndic()
-                    result = self.asr_indic.transcribe_chunk(chunk, language, route)
-                    results.append(result)
-                elif engine == 'asr_c':
-                    if self.asr_english is None:
-                        self.asr_english = ASREnglish()
-                    result = self.asr_english.transcribe_chunk(chunk, language, route)
-                    results.append(result)
-                
-                # New provider registry engines
-                elif engine == 'indicconformer':
-                    provider = self.get_provider('indicconformer')
-                    result = provider.transcribe_chunk(chunk, language, route)
-                    results.append(result)
-                elif engine == 'wav2vec2':
-                    provider = self.get_provider('wav2vec2')
-                    result = provider.transcribe_chunk(chunk, language, route)
-                    results.append(result)
-                elif engine == 'commercial':
-                    provider = self.get_provider('commercial')
-                    result = provider.transcribe_chunk(chunk, language, route)
-                    results.append(result)
-                elif engine == 'whisper':
-                    result = self.asr_service.transcribe_chunk(chunk, language, route)
-                    results.append(result)
-                else:
-                    # Try to get from registry
-                    provider = self.get_provider(engine)
-                    result = provider.transcribe_chunk(chunk, language, route)
-                    results.append(result)
-                    
+                result = self._get_engine(engine).transcribe_chunk(chunk, language, route)
+                results.append(result)
             except Exception as e:
                 logger.warning(f"[{job_id}] {engine} failed: {e}")
         
@@ -1794,11 +2437,9 @@ class Orchestrator:
             ASRResult from re-decode, or None if failed
         """
         try:
-            if self.asr_indic is None:
-                self.asr_indic = ASRIndic()
             # Re-decode with ASR-B (Indic) - it's better for complex vocabulary
-            logger.debug(f"[{job_id}] Re-decoding with ASR-B...")
-            return self.asr_indic.transcribe_chunk(chunk, language, route)
+            logger.debug("[%s] Re-decoding with ASR-B...", job_id)
+            return self._get_asr_indic().transcribe_chunk(chunk, language, route)
         except Exception as e:
             logger.warning(f"[{job_id}] Re-decode failed: {e}")
             return None
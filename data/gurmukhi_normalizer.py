@@ -118,12 +118,14 @@ class GurmukhiNormalizer:
         self.normalization_form = normalization_form
         logger.debug(f"GurmukhiNormalizer initialized with form='{normalization_form}'")
     
-    def normalize(self, text: str) -> str:
+    def normalize(self, text: str, unicode_normalized: bool = False) -> str:
         """
         Normalize Gurmukhi text.
         
         Args:
             text: Input Gurmukhi text
+            unicode_normalized: Text is already in this normalizer's Unicode
+                form, so the Unicode pass can be skipped
         
         Returns:
             Normalized Gurmukhi text
@@ -132,7 +134,10 @@ class GurmukhiNormalizer:
             return text
         
         # Step 1: Apply Unicode normalization
-        normalized = unicodedata.normalize(self.normalization_form, text)
+        if unicode_normalized:
+            normalized = text
+        else:
+            normalized = unicodedata.normalize(self.normalization_form, text)
         
         # Step 2: Normalize Tippi/Bindi based on context
         normalized = self._normalize_nasalization(normalized)
@@ -146,7 +151,7 @@ class GurmukhiNormalizer:
         # Step 5: Order diacritics consistently
         normalized = self._order_diacritics(normalized)
         
-        logger.debug(f"Normalized Gurmukhi text: '{text[:50]}...' → '{normalized[:50]}...'")
+        logger.debug("Normalized Gurmukhi text: '%s...' → '%s...'", text[:50], normalized[:50])
         
         return normalized
     
@@ -6,16 +6,71 @@ Adds structured metadata to segments and generates review queues.
 import logging
 import json
 import csv
+import heapq
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from collections import Counter
+
+import numpy as np
+
+# orjson is optional; it serializes large review dumps much faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from core.models import ProcessedSegment, QuoteMatch
 
 logger = logging.getLogger(__name__)
 
 
+# Quote metadata for segments without a quote match
+NO_QUOTE_METADATA = (None, None, None, None, None)
+
+
+def _quote_metadata(quote_match: Optional[QuoteMatch]) -> tuple:
+    """
+    Extract annotation metadata from a quote match.
+    
+    Args:
+        quote_match: Matched quote, or None
+    
+    Returns:
+        Tuple of (source, ang, raag, author, confidence), all None without a match
+    """
+    if not quote_match:
+        return NO_QUOTE_METADATA
+    return (
+        quote_match.source.value,
+        quote_match.ang,
+        quote_match.raag,
+        quote_match.author,
+        quote_match.confidence
+    )
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to compact JSON, keeping non-ASCII text as-is."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _review_priority(segment: 'AnnotatedSegment') -> float:
+    """Sort key for the review queue."""
+    return segment.review_priority or 0.0
+
+
+# Review queue entry fields, in export column order
+REVIEW_QUEUE_FIELDS = [
+    'start', 'end', 'text', 'confidence', 'review_priority',
+    'reason', 'source', 'ang', 'raag', 'author', 'language', 'route', 'type'
+]
+
+
 @dataclass
 class AnnotatedSegment:
     """An annotated segment with full metadata."""
@@ -46,8 +101,85 @@ class AnnotatedSegment:
     spoken_text: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (fields are scalars, so no deep copy is needed)."""
+        return {
+            'start': self.start,
+            'end': self.end,
+            'route': self.route,
+            'type': self.type,
+            'text': self.text,
+            'confidence': self.confidence,
+            'language': self.language,
+            'needs_review': self.needs_review,
+            'source': self.source,
+            'ang': self.ang,
+            'raag': self.raag,
+            'author': self.author,
+            'quote_match_confidence': self.quote_match_confidence,
+            'processing_timestamp': self.processing_timestamp,
+            'review_priority': self.review_priority,
+            'roman': self.roman,
+            'original_script': self.original_script,
+            'script_confidence': self.script_confidence,
+            'spoken_text': self.spoken_text
+        }
+
+
+@dataclass
+class SegmentColumns:
+    """
+    Column-wise view of a segment batch for vectorized scoring.
+    
+    Numeric fields are NumPy arrays (NaN where a confidence is missing);
+    string fields are plain lists in segment order.
+    """
+    start: np.ndarray
+    end: np.ndarray
+    confidence: np.ndarray
+    quote_confidence: np.ndarray
+    script_confidence: np.ndarray
+    needs_review: np.ndarray
+    text: List[str]
+    route: List[str]
+    language: List[str]
+    
+    @classmethod
+    def from_segments(cls, segments: List[ProcessedSegment]) -> 'SegmentColumns':
+        """
+        Build the columns in a single pass over the segments.
+        
+        Args:
+            segments: ProcessedSegments to lay out column-wise
+        
+        Returns:
+            SegmentColumns with one row per segment
+        """
+        start, end, confidence, quote_confidence, script_confidence = [], [], [], [], []
+        needs_review, text, route, language = [], [], [], []
+        for seg in segments:
+            start.append(seg.start)
+            end.append(seg.end)
+            confidence.append(seg.confidence)
+            quote_confidence.append(seg.quote_match.confidence if seg.quote_match else np.nan)
+            script_confidence.append(seg.script_confidence if seg.script_confidence is not None else np.nan)
+            needs_review.append(seg.needs_review)
+            text.append(seg.text)
+            route.append(seg.route)
+            language.append(seg.language)
+        return cls(
+            start=np.array(start, dtype=np.float64),
+            end=np.array(end, dtype=np.float64),
+            confidence=np.array(confidence, dtype=np.float64),
+            quote_confidence=np.array(quote_confidence, dtype=np.float64),
+            script_confidence=np.array(script_confidence, dtype=np.float64),
+            needs_review=np.array(needs_review, dtype=bool),
+            text=text,
+            route=route,
+            language=language
+        )
+    
+    def __len__(self) -> int:
+        return len(self.text)
 
 
 class Annotator:
@@ -87,38 +219,28 @@ class Annotator:
     
     def annotate_segments(
         self,
-        segments: List[ProcessedSegment]
+        segments: List[ProcessedSegment],
+        columns: Optional[SegmentColumns] = None
     ) -> List[AnnotatedSegment]:
         """
         Annotate segments with full metadata.
         
         Args:
             segments: List of ProcessedSegment objects
+            columns: Column view of the same segments (built if None)
         
         Returns:
             List of AnnotatedSegment objects
         """
         annotated = []
         processing_time = datetime.now().isoformat()
+        if columns is None:
+            columns = SegmentColumns.from_segments(segments)
+        priorities = self._calculate_priorities(columns)
         
-        for seg in segments:
+        for seg, review_priority in zip(segments, priorities):
             # Extract metadata from quote match if present
-            source = None
-            ang = None
-            raag = None
-            author = None
-            quote_match_confidence = None
-            
-            if seg.quote_match:
-                quote_match: QuoteMatch = seg.quote_match
-                source = quote_match.source.value
-                ang = quote_match.ang
-                raag = quote_match.raag
-                author = quote_match.author
-                quote_match_confidence = quote_match.confidence
-            
-            # Calculate review priority
-            review_priority = self._calculate_priority(seg)
+            source, ang, raag, author, quote_match_confidence = _quote_metadata(seg.quote_match)
             
             annotated_seg = AnnotatedSegment(
                 start=seg.start,
@@ -156,60 +278,99 @@ class Annotator:
         Returns:
             Priority score
         """
-        priority = 0.0
+        return self._calculate_priorities(SegmentColumns.from_segments([segment]))[0]
+    
+    def _calculate_priorities(self, columns: SegmentColumns) -> List[float]:
+        """
+        Calculate review priorities for all segments in one columnar pass.
         
-        # Low confidence increases priority
-        if segment.confidence < self.confidence_threshold:
-            priority += 0.4
+        Low confidence adds 0.4, a low-confidence quote match adds 0.3 (a
+        confident one subtracts 0.1), script confidence below 0.7 adds 0.2
+        and an existing review flag adds 0.1; the sum is clamped to [0, 1].
         
-        # Quote match with low confidence increases priority
-        if segment.quote_match:
-            if segment.quote_match.confidence < self.quote_confidence_threshold:
-                priority += 0.3
-            else:
-                # High confidence quote match - lower priority
-                priority -= 0.1
+        Args:
+            columns: Column view of the segments to score
         
-        # Script conversion uncertainty increases priority
-        if segment.script_confidence is not None:
-            if segment.script_confidence < 0.7:
-                priority += 0.2
+        Returns:
+            Priority score per segment
+        """
+        if not len(columns):
+            return []
         
-        # Needs review flag increases priority
-        if segment.needs_review:
-            priority += 0.1
+        quote_confidence = columns.quote_confidence
+        
+        priority = np.where(columns.confidence < self.confidence_threshold, 0.4, 0.0)
+        priority += np.where(
+            np.isnan(quote_confidence), 0.0,
+            np.where(quote_confidence < self.quote_confidence_threshold, 0.3, -0.1)
+        )
+        priority += np.where(columns.script_confidence < 0.7, 0.2, 0.0)  # NaN compares False
+        priority += np.where(columns.needs_review, 0.1, 0.0)
         
-        # Clamp to [0.0, 1.0]
-        return max(0.0, min(1.0, priority))
+        return np.clip(priority, 0.0, 1.0).tolist()
     
     def generate_review_queue(
         self,
-        segments: List[ProcessedSegment]
+        segments: List[ProcessedSegment],
+        annotated: Optional[List[AnnotatedSegment]] = None,
+        top_k: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate review queue from segments.
         
         Args:
             segments: List of ProcessedSegment objects
+            annotated: Annotations of segments, if already computed
+            top_k: Only return the top_k most urgent entries (all if None)
         
         Returns:
             List of review queue entries (dictionaries)
         """
-        annotated = self.annotate_segments(segments)
+        if annotated is None:
+            annotated = self.annotate_segments(segments)
         
-        # Filter segments that need review
-        review_segments = [
-            seg for seg in annotated
-            if seg.needs_review or seg.review_priority > 0.3
-        ]
+        return list(self._iter_review_entries(self._review_segments(annotated, top_k)))
+    
+    @staticmethod
+    def _iter_review_candidates(annotated: List[AnnotatedSegment]) -> Iterator[AnnotatedSegment]:
+        """Yield annotated segments that belong in the review queue, in input order."""
+        for seg in annotated:
+            if seg.needs_review or seg.review_priority > 0.3:
+                yield seg
+    
+    def _review_segments(
+        self,
+        annotated: List[AnnotatedSegment],
+        top_k: Optional[int] = None
+    ) -> List[AnnotatedSegment]:
+        """
+        Select annotated segments that need review, most urgent first.
         
-        # Sort by priority (highest first)
-        review_segments.sort(key=lambda s: s.review_priority or 0.0, reverse=True)
+        Args:
+            annotated: AnnotatedSegment objects
+            top_k: Keep only the top_k most urgent segments (all if None)
+        
+        Returns:
+            Segments for the review queue, sorted by priority (highest first)
+        """
+        candidates = self._iter_review_candidates(annotated)
+        if top_k is not None:
+            # Partial selection; ties keep input order, as with the full sort
+            return heapq.nlargest(top_k, candidates, key=_review_priority)
+        return sorted(candidates, key=_review_priority, reverse=True)
+    
+    def _iter_review_entries(self, review_segments: List[AnnotatedSegment]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield review queue entries one at a time.
+        
+        Args:
+            review_segments: Segments from _review_segments
         
-        # Convert to dictionaries
-        queue = []
+        Yields:
+            Review queue entry (dictionary with REVIEW_QUEUE_FIELDS keys)
+        """
         for seg in review_segments:
-            entry = {
+            yield {
                 'start': seg.start,
                 'end': seg.end,
                 'text': seg.text,
@@ -224,9 +385,6 @@ class Annotator:
                 'route': seg.route,
                 'type': seg.type
             }
-            queue.append(entry)
-        
-        return queue
     
     def _get_review_reason(self, segment: AnnotatedSegment) -> str:
         """
@@ -272,23 +430,45 @@ class Annotator:
             Path to saved file
         """
         annotated = self.annotate_segments(segments)
-        review_queue = self.generate_review_queue(segments)
+        review_segments = self._review_segments(annotated)
         
-        summary = {
+        confidence_sum = 0.0
+        quotes_detected = 0
+        low_confidence_count = 0
+        high_priority_count = 0
+        for seg in annotated:
+            confidence_sum += seg.confidence
+            if seg.source is not None:
+                quotes_detected += 1
+            if seg.confidence < self.confidence_threshold:
+                low_confidence_count += 1
+            if (seg.review_priority or 0.0) > 0.5:
+                high_priority_count += 1
+        
+        header = {
             'generated_at': datetime.now().isoformat(),
             'total_segments': len(segments),
-            'segments_needing_review': len(review_queue),
-            'review_queue': review_queue,
-            'statistics': {
-                'avg_confidence': sum(s.confidence for s in annotated) / len(annotated) if annotated else 0.0,
-                'quotes_detected': sum(1 for s in annotated if s.source is not None),
-                'low_confidence_count': sum(1 for s in annotated if s.confidence < self.confidence_threshold),
-                'high_priority_count': sum(1 for s in annotated if (s.review_priority or 0.0) > 0.5)
-            }
+            'segments_needing_review': len(review_segments)
+        }
+        statistics = {
+            'avg_confidence': confidence_sum / len(annotated) if annotated else 0.0,
+            'quotes_detected': quotes_detected,
+            'low_confidence_count': low_confidence_count,
+            'high_priority_count': high_priority_count
         }
         
+        # Write the review queue entry by entry instead of building the whole summary first
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+            f.write('{\n')
+            for key, value in header.items():
+                f.write(f'  {_dumps(key)}: {_dumps(value)},\n')
+            f.write('  "review_queue": [')
+            for i, entry in enumerate(self._iter_review_entries(review_segments)):
+                f.write(',\n    ' if i else '\n    ')
+                f.write(_dumps(entry))
+            f.write('\n  ],\n' if review_segments else '],\n')
+            f.write(f'  "statistics": {_dumps(statistics)}\n')
+            f.write('}\n')
         
         logger.info(f"Exported review summary: {output_path}")
         return output_path
@@ -308,21 +488,12 @@ class Annotator:
         Returns:
             Path to saved file
         """
-        review_queue = self.generate_review_queue(segments)
-        
-        if not review_queue:
-            # Create empty CSV with headers
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'start', 'end', 'text', 'confidence', 'review_priority',
-                    'reason', 'source', 'ang', 'raag', 'author', 'language', 'route', 'type'
-                ])
-        else:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=review_queue[0].keys())
-                writer.writeheader()
-                writer.writerows(review_queue)
+        review_segments = self._review_segments(self.annotate_segments(segments))
+        
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=REVIEW_QUEUE_FIELDS)
+            writer.writeheader()
+            writer.writerows(self._iter_review_entries(review_segments))
         
         logger.info(f"Exported review queue CSV: {output_path}")
         return output_path
@@ -340,36 +511,33 @@ class Annotator:
         Returns:
             Summary dictionary
         """
-        annotated = self.annotate_segments(segments)
+        columns = SegmentColumns.from_segments(segments)
+        annotated = self.annotate_segments(segments, columns)
         
-        # Count by source
         source_counts = {}
         for seg in annotated:
             source = seg.source or "None"
             source_counts[source] = source_counts.get(source, 0) + 1
         
-        # Count by route
-        route_counts = {}
-        for seg in annotated:
-            route = seg.route
-            route_counts[route] = route_counts.get(route, 0) + 1
-        
         # Confidence distribution
-        confidences = [seg.confidence for seg in annotated]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-        min_confidence = min(confidences) if confidences else 0.0
-        max_confidence = max(confidences) if confidences else 0.0
+        confidence = columns.confidence
+        if len(columns):
+            avg_confidence = float(confidence.mean())
+            min_confidence = float(confidence.min())
+            max_confidence = float(confidence.max())
+        else:
+            avg_confidence = min_confidence = max_confidence = 0.0
         
         return {
             'total_segments': len(annotated),
-            'segments_needing_review': sum(1 for s in annotated if s.needs_review),
-            'quotes_detected': sum(1 for s in annotated if s.source is not None),
+            'segments_needing_review': int(columns.needs_review.sum()),
+            'quotes_detected': int(np.count_nonzero(~np.isnan(columns.quote_confidence))),
             'source_breakdown': source_counts,
-            'route_breakdown': route_counts,
+            'route_breakdown': dict(Counter(columns.route)),
             'confidence_stats': {
                 'average': avg_confidence,
                 'min': min_confidence,
                 'max': max_confidence
             },
-            'review_queue_size': len(self.generate_review_queue(segments))
+            'review_queue_size': sum(1 for _ in self._iter_review_candidates(annotated))
         }
@@ -16,16 +16,20 @@ from core.models import (
     DocumentSection,
     QuoteContent,
     QuoteMatch,
+    ScriptureLine,
     ScriptureSource
 )
 from post.section_classifier import SectionClassifier, ClassifiedSection
-from scripture.sggs_db import SGGSDatabase
-from scripture.dasam_db import DasamDatabase
+from scripture.sggs_db import SGGSDatabase, get_default_sggs_db
+from scripture.dasam_db import DasamDatabase, get_default_dasam_db
 from core.errors import DocumentFormatError
 import config
 
 logger = logging.getLogger(__name__)
 
+# Surrounding scripture lines attached to each quote
+MAX_CONTEXT_LINES = 4
+
 
 class DocumentFormatter:
     """
@@ -46,20 +50,23 @@ class DocumentFormatter:
         
         Args:
             classifier: SectionClassifier instance (created if None)
-            sggs_db: SGGS database instance (created if None, if DB exists)
-            dasam_db: Dasam Granth database instance (created if None, if DB exists)
+            sggs_db: SGGS database instance (shared default if None, if DB exists)
+            dasam_db: Dasam Granth database instance (shared default if None, if DB exists)
         """
         self.classifier = classifier or SectionClassifier()
         
-        # Initialize scripture databases if available
+        # Initialize scripture databases if available. Shared default handles
+        # stay open for other formatters; close() only closes databases passed in.
         self.sggs_db = None
         self.dasam_db = None
+        self._owns_sggs_db = sggs_db is not None
+        self._owns_dasam_db = dasam_db is not None
         
         try:
             if sggs_db is not None:
                 self.sggs_db = sggs_db
             elif config.SCRIPTURE_DB_PATH.exists():
-                self.sggs_db = SGGSDatabase()
+                self.sggs_db = get_default_sggs_db()
                 logger.info("SGGS database initialized for document formatting")
         except Exception as e:
             logger.warning(f"Could not initialize SGGS database: {e}")
@@ -68,7 +75,7 @@ class DocumentFormatter:
             if dasam_db is not None:
                 self.dasam_db = dasam_db
             elif config.DASAM_DB_PATH.exists():
-                self.dasam_db = DasamDatabase()
+                self.dasam_db = get_default_dasam_db()
                 logger.info("Dasam Granth database initialized for document formatting")
         except Exception as e:
             logger.warning(f"Could not initialize Dasam Granth database: {e}")
@@ -96,15 +103,18 @@ class DocumentFormatter:
         # Step 1: Classify segments
         classified = self.classifier.classify_segments(result.segments)
         
-        # Step 2: Build document sections
+        # Step 2: Fetch scripture context for every SGGS quote at once
+        contexts = self._fetch_quote_contexts(classified)
+        
+        # Step 3: Build document sections
         document_sections = []
         
         for classified_section in classified:
-            doc_section = self._build_document_section(classified_section)
+            doc_section = self._build_document_section(classified_section, contexts)
             if doc_section:
                 document_sections.append(doc_section)
         
-        # Step 3: Extract metadata
+        # Step 4: Extract metadata
         title = Path(result.filename).stem
         
         metadata = {
@@ -120,7 +130,7 @@ class DocumentFormatter:
             "has_topic": any(s.section_type == "topic" for s in document_sections)
         }
         
-        # Step 4: Create formatted document
+        # Step 5: Create formatted document
         formatted_doc = FormattedDocument(
             title=title,
             source_file=result.filename,
@@ -136,15 +146,49 @@ class DocumentFormatter:
         
         return formatted_doc
     
+    def _fetch_quote_contexts(
+        self,
+        classified: List[ClassifiedSection]
+    ) -> Optional[Dict[str, List[ScriptureLine]]]:
+        """
+        Look up context lines for all SGGS quotes in one batched query.
+        
+        Args:
+            classified: Classified sections of the document
+        
+        Returns:
+            Context lines keyed by line_id, or None if the lookup is unavailable
+        """
+        if not self.sggs_db:
+            return None
+        
+        line_ids = [
+            section.segment.quote_match.line_id
+            for section in classified
+            if section.section_type in ("opening_gurbani", "quote")
+            and section.segment.quote_match is not None
+            and section.segment.quote_match.source == ScriptureSource.SGGS
+        ]
+        if not line_ids:
+            return {}
+        
+        try:
+            return self.sggs_db.get_contexts_batch(line_ids, window=2)
+        except Exception as e:
+            logger.debug(f"Could not batch-fetch quote context: {e}")
+            return None
+    
     def _build_document_section(
         self,
-        classified: ClassifiedSection
+        classified: ClassifiedSection,
+        contexts: Optional[Dict[str, List[ScriptureLine]]] = None
     ) -> Optional[DocumentSection]:
         """
         Build a DocumentSection from a ClassifiedSection.
         
         Args:
             classified: ClassifiedSection to convert
+            contexts: Prefetched SGGS context lines keyed by line_id (looked up per quote if None)
         
         Returns:
             DocumentSection or None if conversion fails
@@ -159,7 +203,7 @@ class DocumentFormatter:
                 )
                 return None
             
-            quote_content = self._build_quote_content(segment.quote_match)
+            quote_content = self._build_quote_content(segment.quote_match, contexts)
             if quote_content:
                 return DocumentSection(
                     section_type=classified.section_type,
@@ -195,13 +239,16 @@ class DocumentFormatter:
     
     def _build_quote_content(
         self,
-        quote_match: QuoteMatch
+        quote_match: QuoteMatch,
+        contexts: Optional[Dict[str, List[ScriptureLine]]] = None
     ) -> Optional[QuoteContent]:
         """
         Build QuoteContent from a QuoteMatch, enriching with context.
         
         Args:
             quote_match: QuoteMatch to convert
+            contexts: Prefetched SGGS context lines keyed by line_id (looked up
+                      here if None or missing the line)
         
         Returns:
             QuoteContent or None if conversion fails
@@ -209,9 +256,23 @@ class DocumentFormatter:
         # Get context lines if database is available
         context_lines = []
         try:
-            if quote_match.source == ScriptureSource.SGGS and self.sggs_db:
-                context = self.sggs_db.get_context(quote_match.line_id, window=2)
-                context_lines = [line.gurmukhi for line in context if line.gurmukhi != quote_match.canonical_text]
+            # A line missing from the batch (failed query or unknown id) is looked up on its own
+            if (
+                quote_match.source == ScriptureSource.SGGS and contexts is not None
+                and quote_match.line_id in contexts
+            ):
+                context_lines = [
+                    line.gurmukhi for line in contexts[quote_match.line_id]
+                    if line.gurmukhi != quote_match.canonical_text
+                ][:MAX_CONTEXT_LINES]
+            elif quote_match.source == ScriptureSource.SGGS and self.sggs_db:
+                context = self.sggs_db.get_context(
+                    quote_match.line_id,
+                    window=2,
+                    exclude_text=quote_match.canonical_text,
+                    limit=MAX_CONTEXT_LINES
+                )
+                context_lines = [line.gurmukhi for line in context]
             elif quote_match.source == ScriptureSource.DasamGranth and self.dasam_db:
                 # Dasam DB might have similar method
                 context_lines = []
@@ -226,7 +287,7 @@ class DocumentFormatter:
             ang=quote_match.ang,
             raag=quote_match.raag,
             author=quote_match.author,
-            context_lines=context_lines[:4],  # Limit to 4 context lines
+            context_lines=context_lines,
             line_id=quote_match.line_id,
             shabad_id=None  # Could be extracted from quote_match if available
         )
@@ -238,13 +299,13 @@ class DocumentFormatter:
         return quote_content
     
     def close(self):
-        """Close database connections."""
-        if self.sggs_db:
+        """Close database connections passed to the constructor (shared defaults stay open)."""
+        if self.sggs_db and self._owns_sggs_db:
             try:
                 self.sggs_db.close()
             except Exception:
                 pass
-        if self.dasam_db:
+        if self.dasam_db and self._owns_dasam_db:
             try:
                 self.dasam_db.close()
             except Exception:
@@ -10,13 +10,15 @@ Consolidated from:
 - section_classifier.py
 """
 # Re-export from original modules for backward compatibility
-from post.transcript_merger import TranscriptMerger
-from post.annotator import Annotator
+from post.transcript_merger import TranscriptMerger, merge_overlapping_texts
+from post.annotator import Annotator, SegmentColumns
 from post.section_classifier import SectionClassifier
 
 __all__ = [
     'TranscriptMerger',
+    'merge_overlapping_texts',
     'Annotator',
+    'SegmentColumns',
     'SectionClassifier',
 ]
 
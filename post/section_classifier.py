@@ -10,16 +10,53 @@ Analyzes transcription segments and classifies them into semantic sections:
 """
 import logging
 import re
-from typing import List, Optional, Dict, Any
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 from core.models import ProcessedSegment, QuoteMatch
 import config
 
 logger = logging.getLogger(__name__)
 
+# Keywords that suggest a segment announces the katha topic (Gurmukhi/Roman)
+TOPIC_KEYWORDS = (
+    "katha", "ਕਥਾ", "about", "subject", "topic", "theme",
+    "today", "ਅੱਜ", "discuss", "discussion"
+)
+TOPIC_KEYWORD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in TOPIC_KEYWORDS),
+    re.IGNORECASE | re.UNICODE
+)
+
+
+@lru_cache(maxsize=8)
+def _compile_fateh_patterns(
+    patterns: Tuple[str, ...]
+) -> Tuple[Tuple[re.Pattern, ...], Optional[re.Pattern]]:
+    """
+    Compile Fateh patterns for case-insensitive matching.
+    
+    Args:
+        patterns: Fateh regex patterns, in priority order
+    
+    Returns:
+        Tuple of (compiled patterns, alternation of all patterns or None if empty)
+    """
+    flags = re.IGNORECASE | re.UNICODE
+    regexes = tuple(re.compile(pattern, flags) for pattern in patterns)
+    # All patterns in one alternation, so segments without a Fateh
+    # (nearly all of them) are rejected in a single search
+    combined = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in patterns), flags
+    ) if patterns else None
+    return regexes, combined
+
 
-@dataclass
+@dataclass(slots=True)
 class ClassifiedSection:
     """A classified section with its type and metadata."""
     section_type: str  # "opening_gurbani", "fateh", "topic", "quote", "katha"
@@ -65,11 +102,12 @@ class SectionClassifier:
             fateh_patterns or config.FATEH_PATTERNS
         )
         
-        # Compile regex patterns for case-insensitive matching
-        self.fateh_regexes = [
-            re.compile(pattern, re.IGNORECASE | re.UNICODE)
-            for pattern in self.fateh_patterns
-        ]
+        # Compile regex patterns for case-insensitive matching (shared
+        # between classifiers built from the same patterns)
+        fateh_regexes, self._fateh_any = _compile_fateh_patterns(
+            tuple(self.fateh_patterns)
+        )
+        self.fateh_regexes = list(fateh_regexes)
         
         logger.info(
             f"SectionClassifier initialized: "
@@ -98,29 +136,55 @@ class SectionClassifier:
         # Sort segments by start time to ensure chronological order
         sorted_segments = sorted(segments, key=lambda s: s.start)
         
-        classified = []
+        # Run the Fateh patterns at most once per segment; later segments only
+        # need to know whether any Fateh came before them
+        texts_lower = [segment.text.lower() for segment in sorted_segments]
+        fateh_matches = []
+        first_fateh = len(sorted_segments)
+        for i, (segment, text_lower) in enumerate(zip(sorted_segments, texts_lower)):
+            # Quotes are classified before the Fateh check, so once the first
+            # Fateh is known a quote segment's own match is never used
+            if segment.quote_match is not None and first_fateh < i:
+                fateh_matches.append(None)
+                continue
+            match = self._detect_fateh(segment, text_lower)
+            if match is not None and first_fateh > i:
+                first_fateh = i
+            fateh_matches.append(match)
+        
+        # Segments are sorted, so each time window is a prefix of the list
+        starts = np.fromiter(
+            (segment.start for segment in sorted_segments),
+            dtype=np.float64, count=len(sorted_segments)
+        )
+        opening_end, topic_end = np.searchsorted(
+            starts, [self.opening_window, self.topic_window], side='left'
+        ).tolist()
+        
+        classified: List[ClassifiedSection] = [None] * len(sorted_segments)
         
         for i, segment in enumerate(sorted_segments):
             section_type, confidence, metadata = self._classify_segment(
-                segment, i, sorted_segments
+                segment, i, fateh_matches[i], first_fateh < i, texts_lower[i],
+                in_opening_window=i < opening_end,
+                in_topic_window=i < topic_end
             )
             
-            classified_section = ClassifiedSection(
+            classified[i] = ClassifiedSection(
                 section_type=section_type,
                 segment=segment,
                 confidence=confidence,
                 metadata=metadata
             )
-            
-            classified.append(classified_section)
         
+        counts = Counter(c.section_type for c in classified)
         logger.info(
             f"Classified {len(segments)} segments: "
-            f"{sum(1 for c in classified if c.section_type == 'opening_gurbani')} opening_gurbani, "
-            f"{sum(1 for c in classified if c.section_type == 'fateh')} fateh, "
-            f"{sum(1 for c in classified if c.section_type == 'topic')} topic, "
-            f"{sum(1 for c in classified if c.section_type == 'quote')} quote, "
-            f"{sum(1 for c in classified if c.section_type == 'katha')} katha"
+            f"{counts['opening_gurbani']} opening_gurbani, "
+            f"{counts['fateh']} fateh, "
+            f"{counts['topic']} topic, "
+            f"{counts['quote']} quote, "
+            f"{counts['katha']} katha"
         )
         
         return classified
@@ -129,7 +193,11 @@ class SectionClassifier:
         self,
         segment: ProcessedSegment,
         index: int,
-        all_segments: List[ProcessedSegment]
+        fateh_match: Optional[str],
+        fateh_found_before: bool,
+        text_lower: Optional[str] = None,
+        in_opening_window: Optional[bool] = None,
+        in_topic_window: Optional[bool] = None
     ) -> tuple[str, float, Dict[str, Any]]:
         """
         Classify a single segment.
@@ -137,25 +205,24 @@ class SectionClassifier:
         Args:
             segment: ProcessedSegment to classify
             index: Index of segment in sorted list
-            all_segments: All segments for context
+            fateh_match: Fateh pattern matched in this segment, if any
+            fateh_found_before: Whether an earlier segment contains a Fateh
+            text_lower: Lowercased segment text, if already computed
+            in_opening_window: Whether the segment starts in the opening window, if already computed
+            in_topic_window: Whether the segment starts in the topic window, if already computed
         
         Returns:
             Tuple of (section_type, confidence, metadata)
         """
-        # First, find if there's a fateh before this segment
-        fateh_found_before = False
-        for prev_seg in all_segments[:index]:
-            if self._detect_fateh(prev_seg):
-                fateh_found_before = True
-                break
+        if in_opening_window is None:
+            in_opening_window = segment.start < self.opening_window
+        if in_topic_window is None:
+            in_topic_window = segment.start < self.topic_window
         
         # Priority 1: Check if it's a quote (already detected by Phase 4)
         if segment.quote_match is not None:
             # Opening Gurbani: quotes BEFORE fateh (or if no fateh, in first window)
-            is_opening = (
-                not fateh_found_before and
-                segment.start < self.opening_window
-            )
+            is_opening = in_opening_window and not fateh_found_before
             
             if is_opening:
                 return ("opening_gurbani", 0.95, {
@@ -169,7 +236,6 @@ class SectionClassifier:
                 })
         
         # Priority 2: Check for Fateh patterns
-        fateh_match = self._detect_fateh(segment)
         if fateh_match:
             return ("fateh", 0.90, {
                 "matched_pattern": fateh_match,
@@ -177,8 +243,8 @@ class SectionClassifier:
             })
         
         # Priority 3: Check if it's in topic window and looks like topic
-        if segment.start < self.topic_window:
-            topic_score = self._score_topic_likelihood(segment, index, all_segments)
+        if in_topic_window:
+            topic_score = self._score_topic_likelihood(segment, index, fateh_found_before, text_lower)
             if topic_score > 0.6:
                 return ("topic", topic_score, {
                     "topic_text": segment.text,
@@ -191,18 +257,28 @@ class SectionClassifier:
             "type": segment.type
         })
     
-    def _detect_fateh(self, segment: ProcessedSegment) -> Optional[str]:
+    def _detect_fateh(
+        self,
+        segment: ProcessedSegment,
+        text_lower: Optional[str] = None
+    ) -> Optional[str]:
         """
         Detect if segment contains Fateh/greeting patterns.
         
         Args:
             segment: ProcessedSegment to check
+            text_lower: Lowercased segment text, if already computed
         
         Returns:
             Matched pattern string if found, None otherwise
         """
-        text = segment.text.lower().strip()
+        if text_lower is None:
+            text_lower = segment.text.lower()
+        text = text_lower.strip()
+        if self._fateh_any is None or not self._fateh_any.search(text):
+            return None
         
+        # Report the first pattern in list order, as before
         for pattern, regex in zip(self.fateh_patterns, self.fateh_regexes):
             if regex.search(text):
                 logger.debug(f"Fateh pattern matched: {pattern} in segment at {segment.start:.2f}s")
@@ -214,7 +290,8 @@ class SectionClassifier:
         self,
         segment: ProcessedSegment,
         index: int,
-        all_segments: List[ProcessedSegment]
+        has_fateh_before: bool,
+        text_lower: Optional[str] = None
     ) -> float:
         """
         Score how likely a segment is to contain the topic/theme.
@@ -222,7 +299,8 @@ class SectionClassifier:
         Args:
             segment: ProcessedSegment to score
             index: Index in sorted segments
-            all_segments: All segments for context
+            has_fateh_before: Whether an earlier segment contains a Fateh
+            text_lower: Lowercased segment text, if already computed
         
         Returns:
             Score between 0.0 and 1.0
@@ -230,13 +308,6 @@ class SectionClassifier:
         score = 0.0
         
         # Topic usually comes after fateh
-        # Check if there's a fateh before this segment
-        has_fateh_before = False
-        for prev_seg in all_segments[:index]:
-            if self._detect_fateh(prev_seg):
-                has_fateh_before = True
-                break
-        
         if has_fateh_before:
             score += 0.3
         
@@ -245,15 +316,10 @@ class SectionClassifier:
             score += 0.2
         
         # Topic often contains certain keywords (in Gurmukhi/Roman)
-        topic_keywords = [
-            "katha", "ਕਥਾ", "about", "subject", "topic", "theme",
-            "today", "ਅੱਜ", "discuss", "discussion"
-        ]
-        text_lower = segment.text.lower()
-        for keyword in topic_keywords:
-            if keyword in text_lower:
-                score += 0.2
-                break
+        if text_lower is None:
+            text_lower = segment.text.lower()
+        if TOPIC_KEYWORD_RE.search(text_lower):
+            score += 0.2
         
         # Topic is usually longer than a single word
         word_count = len(segment.text.split())
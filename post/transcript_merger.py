@@ -4,15 +4,147 @@ Transcript Merger.
 Combines segments into coherent transcript with proper formatting.
 Supports plain text, JSON, SRT, and VTT formats.
 """
+import json
 import logging
+from difflib import SequenceMatcher
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-from datetime import timedelta
+
+import numpy as np
 
 from core.models import ProcessedSegment
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it serializes long transcripts much faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Words compared at each chunk boundary when removing overlap repeats
+OVERLAP_MERGE_WINDOW = 20
+
+# Shortest shared run treated as an overlap repeat; a single common word
+# (e.g. "ji") is too likely to be genuine speech
+OVERLAP_MIN_WORDS = 2
+
+# Silences longer than this (seconds) get a gap marker segment
+GAP_MARKER_MIN_DURATION = 1.0
+
+
+def _dumps(value: Any, indent: Optional[int] = None) -> str:
+    """
+    Serialize a value to JSON, keeping non-ASCII text as-is.
+    
+    Args:
+        value: JSON-compatible value
+        indent: Indentation width (None for compact output)
+    
+    Returns:
+        JSON string
+    """
+    # orjson only supports two-space indentation
+    if ORJSON_AVAILABLE and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        return orjson.dumps(value, option=option).decode('utf-8')
+    return json.dumps(value, indent=indent, ensure_ascii=False)
+
+
+def _sorted_by_start(segments: List[ProcessedSegment]) -> List[ProcessedSegment]:
+    """
+    Return segments ordered by start time, skipping the sort if already ordered.
+    
+    ASR output is normally in time order, so one linear check avoids
+    re-sorting the same list in every merger method. The input list itself
+    is returned when it is already ordered; callers must not mutate it.
+    
+    Args:
+        segments: List of ProcessedSegment objects
+    
+    Returns:
+        Segments sorted by start time
+    """
+    if all(a.start <= b.start for a, b in zip(segments, islice(segments, 1, None))):
+        return segments
+    return sorted(segments, key=attrgetter('start'))
+
+
+def _format_timestamp(seconds: float, millis_separator: str) -> str:
+    """
+    Format a time in seconds as HH:MM:SS plus milliseconds.
+    
+    Works on whole milliseconds, rounded to the nearest one, so float
+    error such as 0.29 * 1000 == 289.99... does not drop a millisecond.
+    
+    Args:
+        seconds: Time in seconds
+        millis_separator: Separator before the milliseconds ("," for SRT, "." for VTT)
+    
+    Returns:
+        Formatted timestamp string
+    """
+    millis = int(seconds * 1000 + 0.5)
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{millis_separator}{millis:03d}"
+
+
+def _gap_segment(start: float, end: float, gap_marker: str) -> ProcessedSegment:
+    """Create a silence marker segment covering a gap between segments."""
+    return ProcessedSegment(
+        start=start,
+        end=end,
+        route="silence",
+        type="gap",
+        text=gap_marker,
+        confidence=1.0,
+        language="unknown"
+    )
+
+
+def merge_overlapping_texts(
+    prev_tokens: List[str],
+    next_tokens: List[str],
+    overlap_window: int = OVERLAP_MERGE_WINDOW,
+    min_words: int = OVERLAP_MIN_WORDS
+) -> List[str]:
+    """
+    Drop the words at the start of a segment that repeat the previous one.
+    
+    VAD chunks overlap, so the words spoken in the overlap are transcribed
+    at the end of one chunk and again at the start of the next. The longest
+    common run between the previous tail and the next head is treated as
+    such a repeat only if it is at least min_words long, reaches the end of
+    the previous segment and starts at the head of the next one (one cut-off
+    word is allowed on each side), so genuine repetition inside a segment is
+    kept. Only the matched run is removed; a cut-off word is kept.
+    
+    Args:
+        prev_tokens: Words of the previous segment
+        next_tokens: Words of the next segment
+        overlap_window: Number of boundary words to compare on each side
+        min_words: Minimum length of the shared run to remove
+    
+    Returns:
+        Words of the next segment with the repeated run removed
+    """
+    tail = prev_tokens[-overlap_window:]
+    head = next_tokens[:overlap_window]
+    if not tail or not head:
+        return list(next_tokens)
+    
+    match = SequenceMatcher(None, tail, head, autojunk=False).find_longest_match(
+        0, len(tail), 0, len(head)
+    )
+    if match.size >= min_words and match.a + match.size >= len(tail) - 1 and match.b <= 1:
+        return next_tokens[:match.b] + next_tokens[match.b + match.size:]
+    return list(next_tokens)
+
 
 class TranscriptMerger:
     """
@@ -32,7 +164,8 @@ class TranscriptMerger:
     def merge_segments(
         self,
         segments: List[ProcessedSegment],
-        format: str = "text"
+        format: str = "text",
+        json_indent: Optional[int] = 2
     ) -> str:
         """
         Merge segments into a single transcript string.
@@ -40,6 +173,7 @@ class TranscriptMerger:
         Args:
             segments: List of ProcessedSegment objects
             format: Output format ("text", "gurmukhi", "roman", "json")
+            json_indent: Indentation for "json" output (None for compact output)
         
         Returns:
             Merged transcript string
@@ -48,39 +182,72 @@ class TranscriptMerger:
             return ""
         
         # Sort segments by start time
-        sorted_segments = sorted(segments, key=lambda s: s.start)
+        sorted_segments = _sorted_by_start(segments)
         
         if format == "text" or format == "gurmukhi":
             # Plain text - Gurmukhi only
-            return " ".join(seg.text for seg in sorted_segments)
+            return self._join_segment_texts(sorted_segments, [seg.text for seg in sorted_segments])
         
         elif format == "roman":
             # Plain text - Roman only
-            return " ".join(
-                seg.roman if seg.roman else seg.text
-                for seg in sorted_segments
+            return self._join_segment_texts(
+                sorted_segments,
+                [seg.roman if seg.roman else seg.text for seg in sorted_segments]
             )
         
         elif format == "json":
-            # JSON format
-            import json
-            return json.dumps(
+            # JSON format - collect all three outputs in one pass
+            segment_dicts = []
+            texts = []
+            romans = []
+            for seg in sorted_segments:
+                segment_dicts.append(seg.to_dict())
+                texts.append(seg.text)
+                romans.append(seg.roman or "")
+            return _dumps(
                 {
-                    "segments": [seg.to_dict() for seg in sorted_segments],
-                    "full_text_gurmukhi": " ".join(seg.text for seg in sorted_segments),
-                    "full_text_roman": " ".join(
-                        seg.roman if seg.roman else ""
-                        for seg in sorted_segments
-                        if seg.roman
-                    )
+                    "segments": segment_dicts,
+                    "full_text_gurmukhi": self._join_segment_texts(sorted_segments, texts),
+                    "full_text_roman": self._join_segment_texts(sorted_segments, romans)
                 },
-                indent=2,
-                ensure_ascii=False
+                indent=json_indent
             )
         
         else:
             raise ValueError(f"Unknown format: {format}")
     
+    def _join_segment_texts(
+        self,
+        sorted_segments: List[ProcessedSegment],
+        texts: List[str]
+    ) -> str:
+        """
+        Join segment texts, removing words repeated across overlapping chunks.
+        
+        Args:
+            sorted_segments: Segments sorted by start time
+            texts: Text to join for each segment
+        
+        Returns:
+            Joined transcript string
+        """
+        parts = []
+        prev_seg = None
+        prev_text = ""
+        for seg, text in zip(sorted_segments, texts):
+            # Segments without text (e.g. no roman) are skipped entirely, so
+            # overlap is judged against the segment whose words are compared
+            if not text:
+                continue
+            if prev_seg is not None and seg.start < prev_seg.end:
+                text = " ".join(merge_overlapping_texts(prev_text.split(), text.split()))
+                if not text:
+                    continue
+            parts.append(text)
+            prev_text = text
+            prev_seg = seg
+        return " ".join(parts)
+    
     def generate_srt(
         self,
         segments: List[ProcessedSegment],
@@ -96,22 +263,23 @@ class TranscriptMerger:
         Returns:
             Path to generated SRT file
         """
-        sorted_segments = sorted(segments, key=lambda s: s.start)
+        sorted_segments = _sorted_by_start(segments)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, seg in enumerate(sorted_segments, 1):
-                # SRT format: index, timestamps, text
-                start_time = self._format_srt_timestamp(seg.start)
-                end_time = self._format_srt_timestamp(seg.end)
-                
-                # Use Gurmukhi text, fallback to Roman if available
-                text = seg.text
-                if not text and seg.roman:
-                    text = seg.roman
-                
-                f.write(f"{i}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
+        # Build the whole file in memory, encode it once and write the bytes
+        parts = []
+        for i, seg in enumerate(sorted_segments, 1):
+            # SRT format: index, timestamps, text
+            start_time = self._format_srt_timestamp(seg.start)
+            end_time = self._format_srt_timestamp(seg.end)
+            
+            # Use Gurmukhi text, fallback to Roman if available
+            text = seg.text
+            if not text and seg.roman:
+                text = seg.roman
+            
+            parts.append(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
+        
+        Path(output_path).write_bytes("".join(parts).encode('utf-8'))
         
         logger.info(f"Generated SRT file: {output_path}")
         return output_path
@@ -131,29 +299,29 @@ class TranscriptMerger:
         Returns:
             Path to generated VTT file
         """
-        sorted_segments = sorted(segments, key=lambda s: s.start)
+        sorted_segments = _sorted_by_start(segments)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # VTT header
-            f.write("WEBVTT\n\n")
+        # VTT header
+        parts = ["WEBVTT\n\n"]
+        
+        for seg in sorted_segments:
+            # VTT format: timestamps, text
+            start_time = self._format_vtt_timestamp(seg.start)
+            end_time = self._format_vtt_timestamp(seg.end)
             
-            for seg in sorted_segments:
-                # VTT format: timestamps, text
-                start_time = self._format_vtt_timestamp(seg.start)
-                end_time = self._format_vtt_timestamp(seg.end)
-                
-                # Use Gurmukhi text, fallback to Roman if available
-                text = seg.text
-                if not text and seg.roman:
-                    text = seg.roman
-                
-                # Add metadata as cue settings (optional)
-                cue_settings = ""
-                if seg.quote_match:
-                    cue_settings = f" class=\"quote\""
-                
-                f.write(f"{start_time} --> {end_time}{cue_settings}\n")
-                f.write(f"{text}\n\n")
+            # Use Gurmukhi text, fallback to Roman if available
+            text = seg.text
+            if not text and seg.roman:
+                text = seg.roman
+            
+            # Add metadata as cue settings (optional)
+            cue_settings = ""
+            if seg.quote_match:
+                cue_settings = f" class=\"quote\""
+            
+            parts.append(f"{start_time} --> {end_time}{cue_settings}\n{text}\n\n")
+        
+        Path(output_path).write_bytes("".join(parts).encode('utf-8'))
         
         logger.info(f"Generated VTT file: {output_path}")
         return output_path
@@ -168,14 +336,7 @@ class TranscriptMerger:
         Returns:
             Formatted timestamp string
         """
-        td = timedelta(seconds=seconds)
-        total_seconds = int(td.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        secs = total_seconds % 60
-        millis = int((seconds - total_seconds) * 1000)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return _format_timestamp(seconds, ',')
     
     def _format_vtt_timestamp(self, seconds: float) -> str:
         """
@@ -187,14 +348,77 @@ class TranscriptMerger:
         Returns:
             Formatted timestamp string
         """
-        td = timedelta(seconds=seconds)
-        total_seconds = int(td.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        secs = total_seconds % 60
-        millis = int((seconds - total_seconds) * 1000)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+        return _format_timestamp(seconds, '.')
+    
+    def normalize_segments(
+        self,
+        segments: List[ProcessedSegment],
+        gap_marker: str = "[...]",
+        resolve_overlaps: bool = True,
+        mark_gaps: bool = True
+    ) -> List[ProcessedSegment]:
+        """
+        Resolve overlaps and fill gaps between segments in a single pass.
+        
+        Args:
+            segments: List of ProcessedSegment objects
+            gap_marker: Text to insert in gaps
+            resolve_overlaps: Whether to trim or drop overlapping segments
+            mark_gaps: Whether to insert gap marker segments
+        
+        Returns:
+            List of ProcessedSegment objects in time order
+        """
+        sorted_segments = _sorted_by_start(segments)
+        
+        # Fast path: with no overlaps to resolve, gaps depend only on adjacent
+        # start/end columns and can be found without a per-segment loop
+        starts = np.fromiter(
+            (seg.start for seg in sorted_segments),
+            dtype=np.float64, count=len(sorted_segments)
+        )
+        ends = np.fromiter(
+            (seg.end for seg in sorted_segments),
+            dtype=np.float64, count=len(sorted_segments)
+        )
+        if not (resolve_overlaps and np.any(starts[1:] < ends[:-1])):
+            if not mark_gaps:
+                return list(sorted_segments)
+            normalized = []
+            prev_index = 0
+            for i in np.flatnonzero(starts[1:] - ends[:-1] > GAP_MARKER_MIN_DURATION).tolist():
+                normalized.extend(sorted_segments[prev_index:i + 1])
+                normalized.append(_gap_segment(
+                    sorted_segments[i].end, sorted_segments[i + 1].start, gap_marker
+                ))
+                prev_index = i + 1
+            normalized.extend(sorted_segments[prev_index:])
+            return normalized
+        
+        normalized = []
+        prev_seg = None
+        
+        for seg in sorted_segments:
+            if prev_seg is not None:
+                # Overlap detected - merge based on confidence
+                if resolve_overlaps and seg.start < prev_seg.end:
+                    if seg.confidence > prev_seg.confidence:
+                        # Current segment has higher confidence - cut previous end
+                        prev_seg.end = seg.start
+                    else:
+                        # Previous segment has higher confidence - skip current start
+                        seg.start = prev_seg.end
+                        if seg.start >= seg.end:
+                            continue
+                
+                # If gap is significant, add marker
+                if mark_gaps and seg.start - prev_seg.end > GAP_MARKER_MIN_DURATION:
+                    normalized.append(_gap_segment(prev_seg.end, seg.start, gap_marker))
+            
+            normalized.append(seg)
+            prev_seg = seg
+        
+        return normalized
     
     def handle_overlaps(
         self,
@@ -209,32 +433,7 @@ class TranscriptMerger:
         Returns:
             List of ProcessedSegment objects with overlaps resolved
         """
-        sorted_segments = sorted(segments, key=lambda s: s.start)
-        merged = []
-        
-        for seg in sorted_segments:
-            if not merged:
-                merged.append(seg)
-                continue
-            
-            prev_seg = merged[-1]
-            
-            # Check for overlap
-            if seg.start < prev_seg.end:
-                # Overlap detected - merge based on confidence
-                if seg.confidence > prev_seg.confidence:
-                    # Current segment has higher confidence - extend previous end
-                    prev_seg.end = seg.start
-                    merged.append(seg)
-                else:
-                    # Previous segment has higher confidence - skip current start
-                    seg.start = prev_seg.end
-                    if seg.start < seg.end:
-                        merged.append(seg)
-            else:
-                merged.append(seg)
-        
-        return merged
+        return self.normalize_segments(segments, mark_gaps=False)
     
     def fill_gaps(
         self,
@@ -251,28 +450,4 @@ class TranscriptMerger:
         Returns:
             List of ProcessedSegment objects with gaps filled
         """
-        sorted_segments = sorted(segments, key=lambda s: s.start)
-        filled = []
-        
-        for i, seg in enumerate(sorted_segments):
-            filled.append(seg)
-            
-            # Check for gap before next segment
-            if i < len(sorted_segments) - 1:
-                next_seg = sorted_segments[i + 1]
-                gap_duration = next_seg.start - seg.end
-                
-                # If gap is significant (> 1 second), add marker
-                if gap_duration > 1.0:
-                    gap_seg = ProcessedSegment(
-                        start=seg.end,
-                        end=next_seg.start,
-                        route="silence",
-                        type="gap",
-                        text=gap_marker,
-                        confidence=1.0,
-                        language="unknown"
-                    )
-                    filled.append(gap_seg)
-        
-        return filled
+        return self.normalize_segments(segments, gap_marker, resolve_overlaps=False)
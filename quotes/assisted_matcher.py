@@ -8,9 +8,17 @@ Implements a 3-stage matching process:
 
 Phase 5: Added Unicode normalization support
 """
+import copy
 import logging
+import re
+import threading
 import unicodedata
-from typing import List, Optional, Dict, Any, Set
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, FrozenSet, Set, Tuple
+
+import numpy as np
+
 from core.models import QuoteMatch, QuoteCandidate, ScriptureLine, ScriptureSource
 from scripture.scripture_service import ScriptureService
 from scripture.gurmukhi_to_ascii import try_ascii_search
@@ -47,6 +55,94 @@ except ImportError:
     fuzz = FuzzFallback()
 
 
+# Common Gurbani words in the ASCII transliteration the database uses
+CRITICAL_KEYWORDS = frozenset({
+    'vwhgurU', 'siqgurU', 'gurU', 'bwxI', 'sbd',
+    'pRBU', 'rwm', 'hir', 'goibMd', 'kirpw', 'mihr',
+    'siq', 'nwmu', 'krqw', 'purKu'  # Common words
+})
+
+# Important words that should survive from the spoken text into the matched line
+IMPORTANT_WORDS = frozenset({
+    'ਵਾਹਿਗੁਰੂ', 'ਸਤਿਗੁਰੂ', 'ਗੁਰੂ', 'ਬਾਣੀ', 'ਸ਼ਬਦ',
+    'ਪ੍ਰਭੂ', 'ਰਾਮ', 'ਹਰਿ', 'ਗੋਬਿੰਦ'
+})
+
+# Number of recent find_match results kept per matcher
+MATCH_CACHE_SIZE = 1024
+
+# Number of recent scripture_service.search_candidates results kept per matcher
+SEARCH_CACHE_SIZE = 2048
+
+# Stage B weights for (fuzzy, word overlap, keyword match / embedding similarity)
+STAGE_B_WEIGHTS = (0.5, 0.3, 0.2)
+STAGE_B_EMBEDDING_WEIGHTS = (0.4, 0.2, 0.4)
+
+# When the best Stage A score reaches this, Stage B first verifies only the
+# top few candidates and skips the rest if none of them could win
+EARLY_EXIT_FUZZY_SCORE = 0.95
+EARLY_EXIT_CANDIDATES = 3
+
+_PUNCTUATION_RE = re.compile(r'[^\w\s]', flags=re.UNICODE)
+
+
+@lru_cache(maxsize=8192)
+def _tokenize(text: str, unicode_form: str) -> Tuple[str, ...]:
+    """
+    Normalize and tokenize text, memoized by text and normalization form.
+    
+    Scripture lines and search texts are tokenized again every time a
+    candidate is revisited, so repeat calls are served from the cache.
+    
+    Args:
+        text: Text to normalize
+        unicode_form: Unicode normalization form (NFC, NFD, NFKC, NFKD)
+    
+    Returns:
+        Tuple of normalized tokens
+    """
+    if not text:
+        return ()
+    
+    # Phase 5: Apply Unicode normalization (scripture text is usually stored
+    # normalized already, so check first and skip the copy)
+    if not unicodedata.is_normalized(unicode_form, text):
+        text = unicodedata.normalize(unicode_form, text)
+    
+    # Remove punctuation; split() also collapses whitespace
+    return tuple(_PUNCTUATION_RE.sub(' ', text).split())
+
+
+@lru_cache(maxsize=8192)
+def _word_set(text: str, unicode_form: str) -> FrozenSet[str]:
+    """
+    Distinct normalized tokens of a text, memoized like _tokenize.
+    
+    Args:
+        text: Text to normalize
+        unicode_form: Unicode normalization form (NFC, NFD, NFKC, NFKD)
+    
+    Returns:
+        Frozenset of normalized tokens
+    """
+    return frozenset(_tokenize(text, unicode_form))
+
+
+@lru_cache(maxsize=8192)
+def _critical_keywords(text: str, unicode_form: str) -> FrozenSet[str]:
+    """
+    Critical keywords present in a text, memoized like _word_set.
+    
+    Args:
+        text: Text to normalize
+        unicode_form: Unicode normalization form (NFC, NFD, NFKC, NFKD)
+    
+    Returns:
+        Frozenset of the text's tokens that are in CRITICAL_KEYWORDS
+    """
+    return _word_set(text, unicode_form) & CRITICAL_KEYWORDS
+
+
 class AssistedMatcher:
     """
     Multi-stage matcher for finding canonical scripture matches.
@@ -70,6 +166,13 @@ class AssistedMatcher:
         self.scripture_service = scripture_service or ScriptureService()
         self.confidence_threshold = config.QUOTE_MATCH_CONFIDENCE_THRESHOLD
         self.review_threshold = 0.70  # Below this, no replacement
+        self.unicode_form = getattr(config, 'UNICODE_NORMALIZATION_FORM', 'NFC')
+        # Recent find_match results keyed by (search texts, source), oldest first
+        self._match_cache = OrderedDict()
+        self._match_cache_lock = threading.Lock()
+        # Candidate lookups keyed by (text, source, top_k); hypotheses and
+        # repeated segments often query the same phrase again
+        self._search_cache = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._raw_search)
         
         # Initialize embedding index if enabled
         self.embedding_index = None
@@ -125,7 +228,42 @@ class AssistedMatcher:
                     if alt_text and alt_text != primary_candidate.text:
                         search_texts.append(alt_text)
         
-        logger.debug(f"Searching for match with {len(search_texts)} text variants")
+        # Repeated phrases (refrains, common quotes) are served from the cache
+        cache_key = (tuple(search_texts), source)
+        with self._match_cache_lock:
+            if cache_key in self._match_cache:
+                self._match_cache.move_to_end(cache_key)
+                cached = self._match_cache[cache_key]
+                return copy.copy(cached) if cached is not None else None
+        
+        best_match = self._find_match_uncached(primary_candidate.text, search_texts, source)
+        
+        with self._match_cache_lock:
+            self._match_cache[cache_key] = best_match
+            self._match_cache.move_to_end(cache_key)
+            if len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        
+        return copy.copy(best_match) if best_match is not None else None
+    
+    def _find_match_uncached(
+        self,
+        primary_text: str,
+        search_texts: List[str],
+        source: Optional[ScriptureSource]
+    ) -> Optional[QuoteMatch]:
+        """
+        Run the three matching stages for a set of text variants.
+        
+        Args:
+            primary_text: Text of the highest confidence candidate
+            search_texts: Primary text followed by alternative hypotheses
+            source: Optional scripture source to search (None = search all)
+        
+        Returns:
+            QuoteMatch if a good match is found, None otherwise
+        """
+        logger.debug("Searching for match with %d text variants", len(search_texts))
         
         # Stage A: Fast fuzzy retrieval
         stage_a_results = self._stage_a_fuzzy_retrieval(
@@ -138,29 +276,31 @@ class AssistedMatcher:
             logger.debug("Stage A: No fuzzy matches found")
             return None
         
-        logger.debug(f"Stage A: Found {len(stage_a_results)} fuzzy matches")
+        logger.debug("Stage A: Found %d fuzzy matches", len(stage_a_results))
         
         # Stage B: Semantic verification
-        stage_b_results = self._stage_b_semantic_verification(
-            search_texts,
-            stage_a_results
-        )
+        stage_b_results = self._stage_b_early_exit(search_texts, stage_a_results)
+        if stage_b_results is None:
+            stage_b_results = self._stage_b_semantic_verification(
+                search_texts,
+                stage_a_results
+            )
         
         if not stage_b_results:
             logger.debug("Stage B: No matches passed semantic verification")
             return None
         
-        logger.debug(f"Stage B: {len(stage_b_results)} matches passed semantic verification")
+        logger.debug("Stage B: %d matches passed semantic verification", len(stage_b_results))
         
         # Stage C: Verifier rules
         best_match = self._stage_c_verifier(
-            primary_candidate.text,
+            primary_text,
             stage_b_results,
             search_texts
         )
         
         if best_match:
-            logger.info(f"Found match: {best_match.line_id} (confidence: {best_match.confidence:.2f})")
+            logger.info("Found match: %s (confidence: %.2f)", best_match.line_id, best_match.confidence)
         else:
             logger.debug("Stage C: No match passed verifier rules")
         
@@ -183,7 +323,8 @@ class AssistedMatcher:
         Returns:
             List of (ScriptureLine, similarity_score) tuples, sorted by score
         """
-        all_matches: List[tuple] = []
+        ascii_queries: List[str] = []
+        candidate_lines: Dict[str, ScriptureLine] = {}
         
         # Search scripture database for each text variant
         for search_text in search_texts:
@@ -191,39 +332,109 @@ class AssistedMatcher:
                 continue
             
             # Get candidates from scripture service
-            scripture_lines = self.scripture_service.search_candidates(
-                text=search_text,
-                source=source,
-                top_k=top_k,
-                fuzzy=True
-            )
+            scripture_lines = self._search_cache(search_text, source, top_k)
             
-            # Calculate fuzzy similarity scores
             # Convert search_text to ASCII for comparison (database uses ASCII)
-            ascii_search_text = try_ascii_search(search_text)
+            ascii_queries.append(try_ascii_search(search_text))
             for line in scripture_lines:
-                # Use token_sort_ratio for better handling of word order differences
-                similarity = fuzz.token_sort_ratio(
-                    ascii_search_text,
-                    line.gurmukhi,
-                    score_cutoff=50  # Minimum 50% similarity
-                )
-                
-                if similarity > 0:
-                    all_matches.append((line, similarity / 100.0))  # Convert to 0-1 scale
+                candidate_lines.setdefault(line.line_id, line)
+        
+        if not ascii_queries or not candidate_lines:
+            return []
+        
+        # Score every text variant against every candidate line in one batch and
+        # keep each line's best score. token_sort_ratio handles word order
+        # differences; scores below 50% similarity come back as 0.
+        lines = list(candidate_lines.values())
+        choices = [line.gurmukhi for line in lines]
+        if RAPIDFUZZ_AVAILABLE:
+            best_scores = process.cdist(
+                ascii_queries,
+                choices,
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=50,
+                dtype=np.float64
+            ).max(axis=0)
+        else:
+            best_scores = np.asarray([
+                max(fuzz.token_sort_ratio(query, choice, score_cutoff=50) for query in ascii_queries)
+                for choice in choices
+            ], dtype=np.float64)
+        
+        # Rank by similarity (highest first, ties keep retrieval order), drop
+        # the lines under the cutoff and keep the top K, converted to 0-1 scale
+        order = np.argsort(-best_scores, kind="stable")
+        order = order[best_scores[order] > 0][:top_k]
+        
+        return list(zip(
+            [lines[i] for i in order.tolist()],
+            (best_scores[order] / 100.0).tolist()
+        ))
+    
+    def _raw_search(
+        self,
+        text: str,
+        source: Optional[ScriptureSource],
+        top_k: int
+    ) -> Tuple[ScriptureLine, ...]:
+        """
+        Look up candidate lines in the scripture service (uncached).
         
-        # Sort by similarity (highest first) and remove duplicates
-        all_matches.sort(key=lambda x: x[1], reverse=True)
+        Args:
+            text: Text to search for
+            source: Optional scripture source
+            top_k: Maximum number of results per source
+        
+        Returns:
+            Tuple of matching ScriptureLine objects
+        """
+        return tuple(self.scripture_service.search_candidates(
+            text=text,
+            source=source,
+            top_k=top_k,
+            fuzzy=True
+        ))
+    
+    def _stage_b_early_exit(
+        self,
+        search_texts: List[str],
+        fuzzy_matches: List[tuple]
+    ) -> Optional[List[tuple]]:
+        """
+        Verify only the top Stage A hits when a near-exact match leads.
         
-        # Deduplicate by line_id
-        seen = set()
-        unique_matches = []
-        for line, score in all_matches:
-            if line.line_id not in seen:
-                seen.add(line.line_id)
-                unique_matches.append((line, score))
+        Stage A results are sorted by fuzzy score, so a remaining candidate
+        can at best score its fuzzy share plus full overlap and keyword
+        credit. If the best verified head candidate beats that bound, the
+        full Stage B pass would pick the same winner.
         
-        return unique_matches[:top_k]  # Return top K
+        Args:
+            search_texts: Original search texts
+            fuzzy_matches: Results from Stage A, sorted by score
+        
+        Returns:
+            Stage B results for the head candidates, or None to verify all
+        """
+        if (
+            self.embedding_index is not None
+            or len(fuzzy_matches) <= EARLY_EXIT_CANDIDATES
+            or fuzzy_matches[0][1] < EARLY_EXIT_FUZZY_SCORE
+        ):
+            return None
+        
+        head_results = self._stage_b_semantic_verification(
+            search_texts,
+            fuzzy_matches[:EARLY_EXIT_CANDIDATES]
+        )
+        if not head_results:
+            return None
+        
+        fuzzy_weight, overlap_weight, keyword_weight = STAGE_B_WEIGHTS
+        next_fuzzy = fuzzy_matches[EARLY_EXIT_CANDIDATES][1]
+        best_possible = next_fuzzy * fuzzy_weight + 1.0 * overlap_weight + 1.0 * keyword_weight
+        if head_results[0][1] > best_possible:
+            return head_results
+        return None
     
     def _stage_b_semantic_verification(
         self,
@@ -242,79 +453,84 @@ class AssistedMatcher:
         """
         verified_matches = []
         
+        # Search words are the same for every candidate: convert the search
+        # texts to ASCII (the database uses ASCII) and tokenize them once
+        search_words = frozenset(
+            word
+            for text in search_texts
+            for word in _tokenize(try_ascii_search(text), self.unicode_form)
+        )
+        if not search_words:
+            # No word can overlap, so no candidate can be verified
+            return verified_matches
+        
+        # Check for critical keywords (common Gurbani words in ASCII format)
+        search_keywords = search_words.intersection(CRITICAL_KEYWORDS)
+        
+        # Optional: embedding similarity is looked up once for the primary text
+        # and shared by every candidate
+        embedding_scores: Dict[str, float] = {}
+        if self.embedding_index is not None:
+            try:
+                primary_text = search_texts[0] if search_texts else ""
+                if primary_text:
+                    for result_line_id, similarity in self.embedding_index.search(primary_text, top_k=5):
+                        embedding_scores.setdefault(result_line_id, similarity)
+            except Exception as e:
+                logger.debug("Embedding search failed: %s", e)
+        
+        # Gather per-candidate features; the scores are combined below in one
+        # vectorized pass
+        lines: List[ScriptureLine] = []
+        fuzzy_scores: List[float] = []
+        overlap_ratios: List[float] = []
+        third_scores: List[float] = []
+        
         for line, fuzzy_score in fuzzy_matches:
-            # Calculate word overlap score
-            # Convert search texts to ASCII for comparison with database (which uses ASCII)
-            search_words = set()
-            for text in search_texts:
-                # Convert to ASCII for word comparison
-                ascii_text = try_ascii_search(text)
-                words = self._normalize_and_tokenize(ascii_text)
-                search_words.update(words)
-            
             # Database text is already in ASCII format
-            line_words = set(self._normalize_and_tokenize(line.gurmukhi))
+            line_words = _word_set(line.gurmukhi, self.unicode_form)
             
-            if not search_words or not line_words:
+            if not line_words:
                 continue
             
-            # Word overlap ratio
-            overlap = search_words.intersection(line_words)
-            overlap_ratio = len(overlap) / max(len(search_words), len(line_words))
-            
-            # Check for critical keywords (common Gurbani words in ASCII format)
-            # Database uses ASCII transliteration, so use ASCII keywords
-            critical_keywords = {
-                'vwhgurU', 'siqgurU', 'gurU', 'bwxI', 'sbd',
-                'pRBU', 'rwm', 'hir', 'goibMd', 'kirpw', 'mihr',
-                'siq', 'nwmu', 'krqw', 'purKu'  # Common words
-            }
-            
-            search_keywords = search_words.intersection(critical_keywords)
-            line_keywords = line_words.intersection(critical_keywords)
-            
-            keyword_match = 1.0 if search_keywords == line_keywords else 0.5
-            
-            # Optional: Add embedding similarity if available
-            embedding_similarity = 0.0
-            if self.embedding_index is not None:
-                try:
-                    # Get embedding similarity for this line
-                    primary_text = search_texts[0] if search_texts else ""
-                    if primary_text:
-                        # Search in embedding index
-                        results = self.embedding_index.search(primary_text, top_k=5)
-                        for result_line_id, similarity in results:
-                            if result_line_id == line.line_id:
-                                embedding_similarity = similarity
-                                break
-                except Exception as e:
-                    logger.debug(f"Embedding search failed: {e}")
+            # Word overlap ratio (only the size of the overlap is needed)
+            overlap_count = len(search_words & line_words)
+            lines.append(line)
+            fuzzy_scores.append(fuzzy_score)
+            overlap_ratios.append(overlap_count / max(len(search_words), len(line_words)))
             
-            # Combined score: adjust weights based on whether embeddings are available
             if self.embedding_index is not None:
-                # With embeddings: fuzzy + word overlap + embedding similarity
-                combined_score = (
-                    fuzzy_score * 0.4 +  # Fuzzy similarity weight
-                    overlap_ratio * 0.2 +  # Word overlap weight
-                    embedding_similarity * 0.4  # Embedding similarity weight
-                )
+                third_scores.append(embedding_scores.get(line.line_id, 0.0))
             else:
-                # Without embeddings: fuzzy + word overlap + keyword match
-                combined_score = (
-                    fuzzy_score * 0.5 +  # Fuzzy similarity weight
-                    overlap_ratio * 0.3 +  # Word overlap weight
-                    keyword_match * 0.2  # Keyword match weight
-                )
-            
-            # Only keep matches with combined score >= 0.6
-            if combined_score >= 0.6:
-                verified_matches.append((line, combined_score))
-                logger.debug(
-                    f"Stage B: Verified match {line.line_id} "
-                    f"(fuzzy: {fuzzy_score:.2f}, overlap: {overlap_ratio:.2f}, "
-                    f"combined: {combined_score:.2f})"
-                )
+                line_keywords = _critical_keywords(line.gurmukhi, self.unicode_form)
+                third_scores.append(1.0 if search_keywords == line_keywords else 0.5)
+        
+        if not lines:
+            return verified_matches
+        
+        # Combined score: adjust weights based on whether embeddings are available
+        if self.embedding_index is not None:
+            # With embeddings: fuzzy + word overlap + embedding similarity
+            weights = STAGE_B_EMBEDDING_WEIGHTS
+        else:
+            # Without embeddings: fuzzy + word overlap + keyword match
+            weights = STAGE_B_WEIGHTS
+        fuzzy_arr = np.asarray(fuzzy_scores, dtype=np.float64)
+        overlap_arr = np.asarray(overlap_ratios, dtype=np.float64)
+        combined = (
+            fuzzy_arr * weights[0] +
+            overlap_arr * weights[1] +
+            np.asarray(third_scores, dtype=np.float64) * weights[2]
+        )
+        
+        # Only keep matches with combined score >= 0.6
+        for i in np.flatnonzero(combined >= 0.6).tolist():
+            combined_score = float(combined[i])
+            verified_matches.append((lines[i], combined_score))
+            logger.debug(
+                "Stage B: Verified match %s (fuzzy: %.2f, overlap: %.2f, combined: %.2f)",
+                lines[i].line_id, fuzzy_scores[i], overlap_ratios[i], combined_score
+            )
         
         # Sort by combined score
         verified_matches.sort(key=lambda x: x[1], reverse=True)
@@ -351,31 +567,27 @@ class AssistedMatcher:
             word_count_ratio = min(primary_words, line_words) / max(primary_words, line_words)
             if word_count_ratio < 0.8:  # More than 20% difference
                 logger.debug(
-                    f"Stage C: Word count mismatch "
-                    f"(primary: {primary_words}, line: {line_words}, ratio: {word_count_ratio:.2f})"
+                    "Stage C: Word count mismatch (primary: %d, line: %d, ratio: %.2f)",
+                    primary_words, line_words, word_count_ratio
                 )
                 # Don't reject, but lower confidence
                 combined_score *= 0.8
         
-        # Rule 2: Key vocabulary presence
-        primary_words_set = set(self._normalize_and_tokenize(primary_text))
-        line_words_set = set(self._normalize_and_tokenize(best_line.gurmukhi))
+        # Rule 2: Key vocabulary presence (the line's word set was already
+        # built by Stage B and comes back from the _word_set cache)
+        primary_words_set = _word_set(primary_text, self.unicode_form)
+        line_words_set = _word_set(best_line.gurmukhi, self.unicode_form)
         
         # Check if important words from primary appear in line
-        important_words = {
-            'ਵਾਹਿਗੁਰੂ', 'ਸਤਿਗੁਰੂ', 'ਗੁਰੂ', 'ਬਾਣੀ', 'ਸ਼ਬਦ',
-            'ਪ੍ਰਭੂ', 'ਰਾਮ', 'ਹਰਿ', 'ਗੋਬਿੰਦ'
-        }
-        
-        primary_important = primary_words_set.intersection(important_words)
-        line_important = line_words_set.intersection(important_words)
+        primary_important = primary_words_set.intersection(IMPORTANT_WORDS)
+        line_important = line_words_set.intersection(IMPORTANT_WORDS)
         
         if primary_important:
             if not primary_important.issubset(line_important):
                 # Some important words missing
                 logger.debug(
-                    f"Stage C: Important words mismatch "
-                    f"(primary: {primary_important}, line: {line_important})"
+                    "Stage C: Important words mismatch (primary: %s, line: %s)",
+                    primary_important, line_important
                 )
                 combined_score *= 0.9
         
@@ -385,7 +597,7 @@ class AssistedMatcher:
         
         # Rule 4: Final confidence threshold check
         if combined_score < self.review_threshold:
-            logger.debug(f"Stage C: Confidence too low ({combined_score:.2f} < {self.review_threshold})")
+            logger.debug("Stage C: Confidence too low (%.2f < %s)", combined_score, self.review_threshold)
             return None
         
         # Create QuoteMatch
@@ -405,8 +617,8 @@ class AssistedMatcher:
         )
         
         logger.info(
-            f"Stage C: Match verified - {best_line.line_id} "
-            f"(confidence: {combined_score:.2f}, method: {match_method})"
+            "Stage C: Match verified - %s (confidence: %.2f, method: %s)",
+            best_line.line_id, combined_score, match_method
         )
         
         return quote_match
@@ -421,31 +633,13 @@ class AssistedMatcher:
         Returns:
             List of normalized tokens
         """
-        if not text:
-            return []
-        
         # Phase 5: Apply Unicode normalization using config
-        try:
-            unicode_form = getattr(config, 'UNICODE_NORMALIZATION_FORM', 'NFC')
-        except (ImportError, AttributeError):
-            unicode_form = 'NFC'
-        
-        text = unicodedata.normalize(unicode_form, text)
-        
-        # Remove punctuation and normalize whitespace
-        import re
-        normalized = re.sub(r'[^\w\s]', ' ', text, flags=re.UNICODE)
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        # Split into words
-        words = normalized.strip().split()
-        
-        # Remove empty strings
-        words = [w for w in words if w]
-        
-        return words
+        return list(_tokenize(text, self.unicode_form))
     
     def close(self) -> None:
         """Close scripture service connections."""
+        self._search_cache.cache_clear()
+        with self._match_cache_lock:
+            self._match_cache.clear()
         if self.scripture_service:
             self.scripture_service.close()
@@ -39,10 +39,12 @@ class CanonicalReplacer:
         Returns:
             Updated ProcessedSegment with canonical text
         """
-        if quote_match.confidence < self.confidence_threshold:
+        confidence = quote_match.confidence
+        confidence_threshold = self.confidence_threshold
+        if confidence < confidence_threshold:
             logger.warning(
-                f"Match confidence ({quote_match.confidence:.2f}) below threshold "
-                f"({self.confidence_threshold}), not replacing"
+                "Match confidence (%.2f) below threshold (%s), not replacing",
+                confidence, confidence_threshold
             )
             # Still update segment with match info, but don't replace text
             segment.quote_match = quote_match
@@ -52,8 +54,8 @@ class CanonicalReplacer:
         
         # Replace text with canonical
         logger.info(
-            f"Replacing text with canonical: {quote_match.line_id} "
-            f"(confidence: {quote_match.confidence:.2f})"
+            "Replacing text with canonical: %s (confidence: %.2f)",
+            quote_match.line_id, confidence
         )
         
         # Preserve original spoken text
@@ -75,22 +77,22 @@ class CanonicalReplacer:
         segment.quote_match = quote_match
         
         # Update confidence (use match confidence, but don't lower it)
-        if quote_match.confidence > segment.confidence:
-            segment.confidence = quote_match.confidence
+        if confidence > segment.confidence:
+            segment.confidence = confidence
         
         # Set needs_review based on confidence
-        if quote_match.confidence < 0.95:
+        if confidence < 0.95:
             # High confidence but not perfect - flag for review
             segment.needs_review = True
-            logger.debug(f"Flagging for review (confidence: {quote_match.confidence:.2f})")
+            logger.debug("Flagging for review (confidence: %.2f)", confidence)
         else:
             # Very high confidence - auto-replace
             segment.needs_review = False
         
         logger.debug(
-            f"Replaced: '{original_text[:50]}...' -> "
-            f"'{quote_match.canonical_text[:50]}...' "
-            f"(source: {quote_match.source.value}, ang: {quote_match.ang})"
+            "Replaced: '%s...' -> '%s...' (source: %s, ang: %s)",
+            original_text[:50], quote_match.canonical_text[:50],
+            quote_match.source.value, quote_match.ang
         )
         
         return segment
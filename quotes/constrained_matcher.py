@@ -7,7 +7,10 @@ to find the best canonical match for quote segments.
 import logging
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
 
 from core.models import ScriptureLine, ScriptureSource
 from scripture.scripture_service import ScriptureService
@@ -15,6 +18,18 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# rapidfuzz is optional; without it edit distances use a pure-Python DP
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Number of normalized scripture lines (and their word sets) memoized; the
+# same candidate lines come back for many segments
+CANDIDATE_CACHE_SIZE = 8192
+
 
 @dataclass
 class AlignmentResult:
@@ -31,46 +46,71 @@ class AlignmentResult:
 
 def levenshtein_distance(s1: str, s2: str) -> int:
     """Calculate Levenshtein edit distance between two strings."""
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.distance(s1, s2)
+    return _levenshtein_distance_py(s1, s2)
+
+
+def _levenshtein_distance_py(s1: str, s2: str) -> int:
+    """Pure-Python Levenshtein distance, used when rapidfuzz is not installed."""
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
     
     if len(s2) == 0:
         return len(s1)
     
-    previous_row = range(len(s2) + 1)
+    # Two preallocated rows, swapped after each character of s1; zip walks
+    # the columns without indexing previous_row twice per cell
+    previous_row = list(range(len(s2) + 1))
+    current_row = [0] * (len(s2) + 1)
+    columns = range(1, len(s2) + 1)
     
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+    for i, c1 in enumerate(s1, 1):
+        current_row[0] = left = i
+        diagonal = i - 1
+        for j, c2, above in zip(columns, s2, previous_row[1:]):
+            left = min(above + 1, left + 1, diagonal + (c1 != c2))
+            current_row[j] = left
+            diagonal = above
+        previous_row, current_row = current_row, previous_row
     
     return previous_row[-1]
 
 
 def normalized_edit_distance(s1: str, s2: str) -> float:
     """Calculate normalized edit distance (0-1)."""
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.normalized_distance(s1, s2)
     max_len = max(len(s1), len(s2))
     if max_len == 0:
         return 0.0
     return levenshtein_distance(s1, s2) / max_len
 
 
+_GURMUKHI_WORD_RE = re.compile(r'[\u0A00-\u0A7F]+')
+
+
+@lru_cache(maxsize=CANDIDATE_CACHE_SIZE)
+def _gurmukhi_words(text: str) -> FrozenSet[str]:
+    """Extract the set of Gurmukhi words in a text (memoized)."""
+    # Gurmukhi has no case, so the text is matched as-is
+    return frozenset(_GURMUKHI_WORD_RE.findall(text))
+
+
 def word_overlap_score(text1: str, text2: str) -> float:
     """Calculate word overlap score between two texts."""
-    words1 = set(re.findall(r'[\u0A00-\u0A7F]+', text1.lower()))
-    words2 = set(re.findall(r'[\u0A00-\u0A7F]+', text2.lower()))
-    
+    return _word_set_overlap(_gurmukhi_words(text1), _gurmukhi_words(text2))
+
+
+def _word_set_overlap(words1: Set[str], words2: Set[str]) -> float:
+    """Jaccard overlap of two word sets (0 if either is empty)."""
     if not words1 or not words2:
         return 0.0
     
-    intersection = words1.intersection(words2)
-    union = words1.union(words2)
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, so no union set is built
+    shared = len(words1 & words2)
     
-    return len(intersection) / len(union)
+    return shared / (len(words1) + len(words2) - shared)
 
 
 class ConstrainedQuoteMatcher:
@@ -110,6 +150,12 @@ class ConstrainedQuoteMatcher:
             getattr(config, 'QUOTE_ALIGNMENT_THRESHOLD', 0.85)
         )
         self._service_initialized = False
+        self._normalization_regexes = [
+            (re.compile(pattern), replacement)
+            for pattern, replacement in self.NORMALIZATION_RULES
+        ]
+        # Candidate lines are normalized once, then served from this cache
+        self._normalize_candidate = lru_cache(maxsize=CANDIDATE_CACHE_SIZE)(self._normalize_text)
     
     def _ensure_service(self) -> Optional[ScriptureService]:
         """Ensure scripture service is initialized."""
@@ -128,8 +174,8 @@ class ConstrainedQuoteMatcher:
         text = ' '.join(text.split())
         
         # Apply normalization rules
-        for pattern, replacement in self.NORMALIZATION_RULES:
-            text = re.sub(pattern, replacement, text)
+        for regex, replacement in self._normalization_regexes:
+            text = regex.sub(replacement, text)
         
         return text
     
@@ -192,7 +238,7 @@ class ConstrainedQuoteMatcher:
         """
         # Normalize both texts
         norm_trans = self._normalize_text(transcription)
-        norm_canon = self._normalize_text(candidate.gurmukhi)
+        norm_canon = self._normalize_candidate(candidate.gurmukhi)
         
         # Calculate edit distance
         edit_dist = levenshtein_distance(norm_trans, norm_canon)
@@ -251,17 +297,35 @@ class ConstrainedQuoteMatcher:
         if not candidates:
             return None
         
-        # Align to each candidate
-        alignments = []
-        for candidate in candidates:
-            result = self.align_to_candidate(transcription, candidate)
-            alignments.append(result)
-        
-        # Sort by alignment score
-        alignments.sort(key=lambda a: a.alignment_score, reverse=True)
+        if RAPIDFUZZ_AVAILABLE:
+            # Score every candidate in one batch and align only the winner
+            norm_trans = self._normalize_text(transcription)
+            norm_cands = [self._normalize_candidate(c.gurmukhi) for c in candidates]
+            edit_similarity = process.cdist(
+                [norm_trans],
+                norm_cands,
+                scorer=Levenshtein.normalized_similarity,
+                dtype=np.float64
+            )[0]
+            trans_words = _gurmukhi_words(norm_trans)
+            word_scores = np.fromiter(
+                (_word_set_overlap(trans_words, _gurmukhi_words(c)) for c in norm_cands),
+                dtype=np.float64, count=len(norm_cands)
+            )
+            scores = edit_similarity * 0.6 + word_scores * 0.4
+            best = self.align_to_candidate(transcription, candidates[int(scores.argmax())])
+        else:
+            # Align to each candidate
+            alignments = []
+            for candidate in candidates:
+                result = self.align_to_candidate(transcription, candidate)
+                alignments.append(result)
+            
+            # Sort by alignment score
+            alignments.sort(key=lambda a: a.alignment_score, reverse=True)
+            best = alignments[0]
         
         # Return best if it meets threshold
-        best = alignments[0]
         if best.alignment_score >= 0.5:  # Minimum threshold to return anything
             return best
         
@@ -16,6 +16,40 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# Character classes for quote screening, counted with C-level regex scans.
+# Matching runs rather than single characters keeps findall's lists short.
+GURMUKHI_RUN_RE = re.compile('[\u0A00-\u0A7F]+')
+ALNUM_RUN_RE = re.compile(r'[^\W_]+')  # Same characters as str.isalnum()
+
+# Common phrase patterns that indicate a quote is coming
+QUOTE_INTRO_PATTERNS = (
+    r'ਜਿਵੇਂ\s+ਬਾਣੀ\s+ਚ\s+ਕਿਹਾ',
+    r'ਗੁਰਬਾਣੀ\s+ਫੁਰਮਾਉਂਦੀ',
+    r'ਬਾਣੀ\s+ਚ\s+ਕਿਹਾ',
+    r'ਗੁਰੂ\s+ਸਾਹਿਬ\s+ਫੁਰਮਾਉਂਦੇ',
+    r'ਅੰਗ\s+\d+\s+ਚ',
+    r'ਰਾਗ\s+\w+\s+ਚ',
+    r'ਜਿਵੇਂ\s+ਕਿਹਾ\s+ਹੈ',
+    r'ਬਾਣੀ\s+ਚ\s+ਆਇਆ',
+)
+
+# Compiled once at import and shared by every detector
+_COMPILED_INTRO_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.UNICODE)
+    for pattern in QUOTE_INTRO_PATTERNS
+]
+
+# Common Gurmukhi vocabulary markers (archaic words, Sant Bhasha)
+# These are words that are more common in Gurbani than modern speech
+GURBANI_VOCABULARY = frozenset({
+    'ਵਾਹਿਗੁਰੂ', 'ਸਤਿਗੁਰੂ', 'ਗੁਰੂ', 'ਬਾਣੀ', 'ਸ਼ਬਦ',
+    'ਅੰਗ', 'ਰਾਗ', 'ਪਾਤਸ਼ਾਹ', 'ਮਹਲਾ', 'ਚਰਨ', 'ਪਦ',
+    'ਭਗਤ', 'ਸੰਤ', 'ਗੁਰਮੁਖ', 'ਮਨਮੁਖ', 'ਮਾਇਆ', 'ਮੋਹ',
+    'ਅਹੰਕਾਰ', 'ਮਮਤਾ', 'ਵਿਸਾਰ', 'ਸਿਮਰਨ', 'ਨਾਮ', 'ਧਿਆਨ',
+    'ਧਰਮ', 'ਕਰਮ', 'ਪ੍ਰਭੂ', 'ਰਾਮ', 'ਹਰਿ', 'ਗੋਬਿੰਦ',
+    'ਕਿਰਪਾ', 'ਦਇਆ', 'ਮਿਹਰ', 'ਭਾਣਾ', 'ਹੁਕਮ', 'ਚਿਤ'
+})
+
 
 class QuoteCandidateDetector:
     """
@@ -27,34 +61,9 @@ class QuoteCandidateDetector:
     
     def __init__(self):
         """Initialize quote candidate detector."""
-        # Common phrase patterns that indicate a quote is coming
-        self.quote_intro_patterns = [
-            r'ਜਿਵੇਂ\s+ਬਾਣੀ\s+ਚ\s+ਕਿਹਾ',
-            r'ਗੁਰਬਾਣੀ\s+ਫੁਰਮਾਉਂਦੀ',
-            r'ਬਾਣੀ\s+ਚ\s+ਕਿਹਾ',
-            r'ਗੁਰੂ\s+ਸਾਹਿਬ\s+ਫੁਰਮਾਉਂਦੇ',
-            r'ਅੰਗ\s+\d+\s+ਚ',
-            r'ਰਾਗ\s+\w+\s+ਚ',
-            r'ਜਿਵੇਂ\s+ਕਿਹਾ\s+ਹੈ',
-            r'ਬਾਣੀ\s+ਚ\s+ਆਇਆ',
-        ]
-        
-        # Compile regex patterns
-        self.compiled_patterns = [
-            re.compile(pattern, re.IGNORECASE | re.UNICODE)
-            for pattern in self.quote_intro_patterns
-        ]
-        
-        # Common Gurmukhi vocabulary markers (archaic words, Sant Bhasha)
-        # These are words that are more common in Gurbani than modern speech
-        self.gurbani_vocabulary = {
-            'ਵਾਹਿਗੁਰੂ', 'ਸਤਿਗੁਰੂ', 'ਗੁਰੂ', 'ਬਾਣੀ', 'ਸ਼ਬਦ',
-            'ਅੰਗ', 'ਰਾਗ', 'ਪਾਤਸ਼ਾਹ', 'ਮਹਲਾ', 'ਚਰਨ', 'ਪਦ',
-            'ਭਗਤ', 'ਸੰਤ', 'ਗੁਰਮੁਖ', 'ਮਨਮੁਖ', 'ਮਾਇਆ', 'ਮੋਹ',
-            'ਅਹੰਕਾਰ', 'ਮਮਤਾ', 'ਵਿਸਾਰ', 'ਸਿਮਰਨ', 'ਨਾਮ', 'ਧਿਆਨ',
-            'ਧਰਮ', 'ਕਰਮ', 'ਪ੍ਰਭੂ', 'ਰਾਮ', 'ਹਰਿ', 'ਗੋਬਿੰਦ',
-            'ਕਿਰਪਾ', 'ਦਇਆ', 'ਮਿਹਰ', 'ਭਾਣਾ', 'ਹੁਕਮ', 'ਚਿਤ'
-        }
+        self.quote_intro_patterns = QUOTE_INTRO_PATTERNS
+        self.compiled_patterns = _COMPILED_INTRO_PATTERNS
+        self.gurbani_vocabulary = GURBANI_VOCABULARY
         
         self.min_words = config.QUOTE_CANDIDATE_MIN_WORDS
     
@@ -74,6 +83,7 @@ class QuoteCandidateDetector:
             List of QuoteCandidate objects
         """
         candidates: List[QuoteCandidate] = []
+        words = segment.text.split()
         
         # Signal 1: Route hint (already identified as scripture_quote_likely)
         if segment.route == ROUTE_SCRIPTURE_QUOTE_LIKELY:
@@ -81,7 +91,7 @@ class QuoteCandidateDetector:
             reason = "route_hint"
             
             # Check if text matches quote characteristics
-            if self._has_quote_characteristics(segment.text):
+            if self._has_quote_characteristics(segment.text, words):
                 confidence = 0.85
                 reason = "route_hint + quote_characteristics"
             
@@ -112,8 +122,8 @@ class QuoteCandidateDetector:
                 logger.debug(f"Detected candidate via phrase pattern: {pattern_name}")
         
         # Signal 3: Gurmukhi vocabulary markers
-        gurbani_word_count = self._count_gurbani_vocabulary(segment.text)
-        total_words = len(segment.text.split())
+        gurbani_word_count = self._count_gurbani_vocabulary(segment.text, words)
+        total_words = len(words)
         
         if total_words > 0:
             gurbani_ratio = gurbani_word_count / total_words
@@ -130,7 +140,7 @@ class QuoteCandidateDetector:
                 logger.debug(f"Detected candidate via Gurbani vocabulary: {gurbani_ratio:.2f}")
         
         # Signal 4: Segment length (quotes typically 5-30 words)
-        word_count = len(segment.text.split())
+        word_count = total_words
         if self.min_words <= word_count <= 30:
             # This is a weak signal, only add if not already detected
             if not candidates:
@@ -150,12 +160,13 @@ class QuoteCandidateDetector:
         logger.info(f"Detected {len(candidates)} quote candidate(s) in segment {segment.start:.2f}-{segment.end:.2f}s")
         return candidates
     
-    def _has_quote_characteristics(self, text: str) -> bool:
+    def _has_quote_characteristics(self, text: str, words: Optional[List[str]] = None) -> bool:
         """
         Check if text has characteristics of a quote.
         
         Args:
             text: Text to check
+            words: Pre-split words of text (split here if None)
         
         Returns:
             True if text appears quote-like
@@ -164,27 +175,24 @@ class QuoteCandidateDetector:
             return False
         
         # Check for Gurmukhi script (quotes are in Gurmukhi)
-        gurmukhi_chars = sum(1 for char in text if '\u0A00' <= char <= '\u0A7F')
-        total_chars = len([c for c in text if c.isalnum()])
-        
-        if total_chars > 0:
-            gurmukhi_ratio = gurmukhi_chars / total_chars
-            if gurmukhi_ratio < 0.5:  # Less than 50% Gurmukhi
+        if not GURMUKHI_RUN_RE.search(text):
+            # No Gurmukhi at all: any letter or digit puts the ratio at 0
+            if ALNUM_RUN_RE.search(text):
                 return False
+        else:
+            gurmukhi_chars = sum(map(len, GURMUKHI_RUN_RE.findall(text)))
+            total_chars = sum(map(len, ALNUM_RUN_RE.findall(text)))
+            
+            if total_chars > 0:
+                gurmukhi_ratio = gurmukhi_chars / total_chars
+                if gurmukhi_ratio < 0.5:  # Less than 50% Gurmukhi
+                    return False
         
         # Check for poetic structure (repetition, meter hints)
-        # Simple check: look for repeated phrases or words
-        words = text.split()
-        if len(words) >= 3:
-            # Check for repetition (common in Gurbani)
-            word_counts = {}
-            for word in words:
-                word_counts[word] = word_counts.get(word, 0) + 1
-            max_repetition = max(word_counts.values()) if word_counts else 1
-            if max_repetition >= 2 and len(words) <= 15:
-                return True
-        
-        return False
+        # Simple check: look for repeated words (common in Gurbani)
+        if words is None:
+            words = text.split()
+        return 3 <= len(words) <= 15 and len(set(words)) < len(words)
     
     def _check_phrase_patterns(self, text: str) -> List[tuple]:
         """
@@ -203,19 +211,20 @@ class QuoteCandidateDetector:
                 matches.append((match.group(), self.quote_intro_patterns[i]))
         return matches
     
-    def _count_gurbani_vocabulary(self, text: str) -> int:
+    def _count_gurbani_vocabulary(self, text: str, words: Optional[List[str]] = None) -> int:
         """
         Count how many Gurbani vocabulary words appear in text.
         
         Args:
             text: Text to analyze
+            words: Pre-split words of text (split here if None)
         
         Returns:
             Number of Gurbani vocabulary words found
         """
-        words = set(text.split())
-        gurbani_words = words.intersection(self.gurbani_vocabulary)
-        return len(gurbani_words)
+        if words is None:
+            words = text.split()
+        return len(self.gurbani_vocabulary.intersection(words))
     
     def _deduplicate_candidates(self, candidates: List[QuoteCandidate]) -> List[QuoteCandidate]:
         """
@@ -105,15 +105,11 @@ class QuoteContextDetector:
     
     def __init__(self):
         """Initialize quote context detector."""
-        # Compile patterns
-        self.intro_patterns = [
-            (re.compile(pattern, re.UNICODE | re.IGNORECASE), name)
-            for pattern, name in self.INTRO_PATTERNS
-        ]
-        self.internal_patterns = [
-            (re.compile(pattern, re.UNICODE), name)
-            for pattern, name in self.QUOTE_INTERNAL_PATTERNS
-        ]
+        # Patterns are compiled once at import and shared by every detector
+        self.intro_patterns = _INTRO_COMPILED
+        self.internal_patterns = _INTERNAL_COMPILED
+        self._intro_combined = _INTRO_COMBINED
+        self._internal_combined = _INTERNAL_COMBINED
         
         # Context tracking
         self._previous_was_intro = False
@@ -196,19 +192,17 @@ class QuoteContextDetector:
     
     def _check_intro_patterns(self, text: str) -> List[str]:
         """Check for intro patterns in text."""
-        matches = []
-        for pattern, name in self.intro_patterns:
-            if pattern.search(text):
-                matches.append(name)
-        return matches
+        if not self._intro_combined.search(text):
+            return []
+        # Name every pattern that matches; matches may overlap, so each
+        # pattern is checked on its own
+        return [name for pattern, name in self.intro_patterns if pattern.search(text)]
     
     def _check_internal_patterns(self, text: str) -> List[str]:
         """Check for quote-internal patterns."""
-        matches = []
-        for pattern, name in self.internal_patterns:
-            if pattern.search(text):
-                matches.append(name)
-        return matches
+        if not self._internal_combined.search(text):
+            return []
+        return [name for pattern, name in self.internal_patterns if pattern.search(text)]
     
     def _calculate_vocab_density(self, text: str) -> float:
         """Calculate Gurbani vocabulary density in text."""
@@ -262,6 +256,27 @@ class QuoteContextDetector:
         return None
 
 
+# Compiled QuoteContextDetector patterns. Each list also gets one combined
+# alternation, so text without any signal (most katha) is rejected in a
+# single scan.
+_INTRO_COMPILED = [
+    (re.compile(pattern, re.UNICODE | re.IGNORECASE), name)
+    for pattern, name in QuoteContextDetector.INTRO_PATTERNS
+]
+_INTERNAL_COMPILED = [
+    (re.compile(pattern, re.UNICODE), name)
+    for pattern, name in QuoteContextDetector.QUOTE_INTERNAL_PATTERNS
+]
+_INTRO_COMBINED = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern, _ in QuoteContextDetector.INTRO_PATTERNS),
+    re.UNICODE | re.IGNORECASE
+)
+_INTERNAL_COMBINED = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern, _ in QuoteContextDetector.QUOTE_INTERNAL_PATTERNS),
+    re.UNICODE
+)
+
+
 def detect_quote_context(
     text: str,
     previous_text: Optional[str] = None
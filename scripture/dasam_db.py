@@ -4,8 +4,10 @@ Dasam Granth Database Connector.
 Provides access to Dasam Granth database for searching and retrieving
 canonical text with metadata.
 """
+import atexit
 import logging
 import sqlite3
+import threading
 from pathlib import Path
 from typing import List, Optional
 from core.models import ScriptureLine, ScriptureSource
@@ -23,17 +25,20 @@ class DasamDatabase:
     with full metadata.
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, check_same_thread: bool = True):
         """
         Initialize Dasam Granth database connector.
         
         Args:
             db_path: Path to Dasam Granth SQLite database file.
                     Defaults to config.DASAM_DB_PATH
+            check_same_thread: Restrict the connection to the creating thread
+                    (pass False for handles shared across threads)
         
         Raises:
             DatabaseNotFoundError: If database file does not exist
         """
+        self._check_same_thread = check_same_thread
         self.db_path = db_path or config.DASAM_DB_PATH
         if not self.db_path.exists():
             # Dasam database may not exist yet - log warning but don't raise
@@ -51,7 +56,7 @@ class DasamDatabase:
             try:
                 # Create parent directory if needed
                 self.db_path.parent.mkdir(parents=True, exist_ok=True)
-                self._connection = sqlite3.connect(str(self.db_path))
+                self._connection = sqlite3.connect(str(self.db_path), check_same_thread=self._check_same_thread)
                 self._connection.row_factory = sqlite3.Row
                 self._create_tables_if_needed()
                 logger.debug("Dasam Granth database connection established")
@@ -343,3 +348,39 @@ class DasamDatabase:
         except Exception as e:
             logger.debug(f"Failed to convert row to ScriptureLine: {e}")
             return None
+
+
+# Shared instance, opened on first use
+_default_dasam_db: Optional[DasamDatabase] = None
+_default_dasam_db_lock = threading.Lock()
+
+
+def get_default_dasam_db() -> DasamDatabase:
+    """
+    Get the shared Dasam Granth database handle.
+    
+    The connection may be used from any thread, so one handle can serve
+    every formatter and job in the process.
+    
+    Returns:
+        DasamDatabase instance
+    """
+    global _default_dasam_db
+    
+    with _default_dasam_db_lock:
+        if _default_dasam_db is None:
+            _default_dasam_db = DasamDatabase(check_same_thread=False)
+        return _default_dasam_db
+
+
+def close_default_dasam_db() -> None:
+    """Close the shared Dasam Granth database handle, if it was opened."""
+    global _default_dasam_db
+    
+    with _default_dasam_db_lock:
+        if _default_dasam_db is not None:
+            _default_dasam_db.close()
+            _default_dasam_db = None
+
+
+atexit.register(close_default_dasam_db)
@@ -5,6 +5,7 @@ Converts Unicode Gurmukhi (ਸਤਿ ਨਾਮੁ) to ASCII transliteration form
 as used in ShabadOS database.
 """
 import logging
+from functools import lru_cache
 from typing import Dict
 
 logger = logging.getLogger(__name__)
@@ -74,12 +75,14 @@ def gurmukhi_to_ascii(text: str) -> str:
     return ' '.join(converted_words)
 
 
+@lru_cache(maxsize=4096)
 def try_ascii_search(text: str) -> str:
     """
     Try to convert text to ASCII format for database search.
     
     If text is already ASCII, returns as-is.
     If text is Unicode Gurmukhi, converts to ASCII.
+    Results are memoized, since the same phrases are searched repeatedly.
     
     Args:
         text: Input text (Unicode Gurmukhi or ASCII)
@@ -4,8 +4,10 @@ ShabadOS SGGS (Sri Guru Granth Sahib Ji) Database Connector.
 Provides access to the ShabadOS SQLite database for searching and retrieving
 canonical Gurbani text with metadata.
 """
+import atexit
 import logging
 import sqlite3
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from core.models import ScriptureLine, ScriptureSource
@@ -15,6 +17,12 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# Columns that give the reading order of lines, in order of preference
+CONTEXT_ORDER_COLUMNS = ('line_order', 'order_id', 'order', 'sequence', 'line_number', 'id')
+
+# Line ids per IN (...) query, under SQLite's default host-parameter limit
+CONTEXT_BATCH_SIZE = 900
+
 
 class SGGSDatabase:
     """
@@ -24,17 +32,20 @@ class SGGSDatabase:
     with full metadata (Ang, Raag, Author, etc.).
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, check_same_thread: bool = True):
         """
         Initialize SGGS database connector.
         
         Args:
             db_path: Path to ShabadOS SQLite database file.
                     Defaults to config.SCRIPTURE_DB_PATH
+            check_same_thread: Restrict the connection to the creating thread
+                    (pass False for handles shared across threads)
         
         Raises:
             DatabaseNotFoundError: If database file does not exist
         """
+        self._check_same_thread = check_same_thread
         self.db_path = db_path or config.SCRIPTURE_DB_PATH
         if not self.db_path.exists():
             raise DatabaseNotFoundError(
@@ -50,7 +61,7 @@ class SGGSDatabase:
         """Ensure database connection is open."""
         if self._connection is None:
             try:
-                self._connection = sqlite3.connect(str(self.db_path))
+                self._connection = sqlite3.connect(str(self.db_path), check_same_thread=self._check_same_thread)
                 self._connection.row_factory = sqlite3.Row  # Enable column access by name
                 logger.debug("SGGS database connection established")
             except sqlite3.Error as e:
@@ -123,11 +134,11 @@ class SGGSDatabase:
             row = cursor.fetchone()
             if row:
                 # Prefer English name, fallback to name, then Gurmukhi
-                if row.get('name_english'):
+                if row['name_english']:
                     return str(row['name_english'])
-                elif row.get('name'):
+                elif row['name']:
                     return str(row['name'])
-                elif row.get('name_gurmukhi'):
+                elif row['name_gurmukhi']:
                     return str(row['name_gurmukhi'])
         except sqlite3.Error as e:
             logger.debug(f"Failed to resolve raag name for section_id {section_id}: {e}")
@@ -529,7 +540,9 @@ class SGGSDatabase:
     def get_context(
         self,
         line_id: str,
-        window: int = 2
+        window: int = 2,
+        exclude_text: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[ScriptureLine]:
         """
         Get surrounding context lines for a given line.
@@ -537,10 +550,18 @@ class SGGSDatabase:
         Args:
             line_id: Line identifier
             window: Number of lines before and after to retrieve
+            exclude_text: Skip lines whose Gurmukhi equals this text (filtered in SQL)
+            limit: Maximum number of lines to return
         
         Returns:
             List of ScriptureLine objects (context lines, sorted by order)
         """
+        def finish(lines: List[ScriptureLine]) -> List[ScriptureLine]:
+            # Same filtering as the SQL path, for the fallback paths
+            if exclude_text is not None:
+                lines = [line for line in lines if line.gurmukhi != exclude_text]
+            return lines[:limit] if limit is not None else lines
+        
         # First, get the current line to find its shabad_id and order
         current_line = self.get_line_by_id(line_id)
         if not current_line:
@@ -554,9 +575,9 @@ class SGGSDatabase:
             )
             row = cursor.fetchone()
             if not row:
-                return [current_line]
+                return finish([current_line])
             
-            shabad_id = row.get('shabad_id')
+            shabad_id = row['shabad_id']
             
             # Try to find ordering field (common names: line_order, order, sequence, line_number)
             # First, check what columns exist in the lines table
@@ -564,7 +585,7 @@ class SGGSDatabase:
             columns = [col[1] for col in cursor.fetchall()]
             
             order_column = None
-            for col_name in ['line_order', 'order', 'sequence', 'line_number', 'id']:
+            for col_name in CONTEXT_ORDER_COLUMNS:
                 if col_name in columns:
                     order_column = col_name
                     break
@@ -575,7 +596,7 @@ class SGGSDatabase:
                     current_order = int(line_id.split('_')[-1]) if '_' in line_id else int(line_id)
                 except ValueError:
                     # Can't determine order, return just the line
-                    return [current_line]
+                    return finish([current_line])
                 
                 # Query surrounding lines by numeric ID
                 context_lines = []
@@ -586,7 +607,7 @@ class SGGSDatabase:
                         if line:
                             context_lines.append(line)
                 
-                return sorted(context_lines, key=lambda l: int(l.line_id.split('_')[-1]) if '_' in l.line_id else int(l.line_id))
+                return finish(sorted(context_lines, key=lambda l: int(l.line_id.split('_')[-1]) if '_' in l.line_id else int(l.line_id)))
             
             # Get current line's order value
             cursor = self._connection.execute(
@@ -595,26 +616,27 @@ class SGGSDatabase:
             )
             order_row = cursor.fetchone()
             if not order_row:
-                return [current_line]
+                return finish([current_line])
             
             current_order = order_row[order_column]
             
             # Query surrounding lines within the same shabad
             if shabad_id:
-                query = f"""
-                    SELECT * FROM lines
-                    WHERE shabad_id = ? AND {order_column} >= ? AND {order_column} <= ?
-                    ORDER BY {order_column}
-                """
-                params = (shabad_id, current_order - window, current_order + window)
+                conditions = f"shabad_id = ? AND {order_column} >= ? AND {order_column} <= ?"
+                params = [shabad_id, current_order - window, current_order + window]
             else:
                 # No shabad_id, query by order only
-                query = f"""
-                    SELECT * FROM lines
-                    WHERE {order_column} >= ? AND {order_column} <= ?
-                    ORDER BY {order_column}
-                """
-                params = (current_order - window, current_order + window)
+                conditions = f"{order_column} >= ? AND {order_column} <= ?"
+                params = [current_order - window, current_order + window]
+            # Exclusion and limit go into the query when the text column is known
+            filter_in_sql = exclude_text is None or 'gurmukhi' in columns
+            if filter_in_sql and exclude_text is not None:
+                conditions += " AND gurmukhi IS NOT ?"
+                params.append(exclude_text)
+            query = f"SELECT * FROM lines WHERE {conditions} ORDER BY {order_column}"
+            if filter_in_sql and limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
             
             cursor = self._connection.execute(query, params)
             context_lines = []
@@ -625,11 +647,72 @@ class SGGSDatabase:
                 if line:
                     context_lines.append(line)
             
-            return context_lines if context_lines else [current_line]
+            if not context_lines:
+                return finish([current_line])
+            return context_lines if filter_in_sql else finish(context_lines)
             
         except sqlite3.Error as e:
             logger.error(f"Database error getting context for line {line_id}: {e}")
-            return [current_line]
+            return finish([current_line])
+    
+    def get_contexts_batch(
+        self,
+        line_ids: List[str],
+        window: int = 2
+    ) -> Dict[str, List[ScriptureLine]]:
+        """
+        Get surrounding context lines for many lines with batched queries.
+        
+        Each line's context is selected the same way as get_context (lines
+        within `window` positions in the same shabad), but all lines are
+        looked up with one self-join per CONTEXT_BATCH_SIZE ids.
+        
+        Args:
+            line_ids: Line identifiers
+            window: Number of lines before and after to retrieve
+        
+        Returns:
+            Dictionary mapping each found line_id to its context lines (sorted by order)
+        """
+        self._ensure_connection()
+        unique_ids = list(dict.fromkeys(line_ids))
+        if not unique_ids:
+            return {}
+        
+        try:
+            cursor = self._connection.execute("PRAGMA table_info(lines)")
+            columns = [col[1] for col in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"Database error reading lines schema: {e}")
+            return {}
+        
+        order_column = next((col for col in CONTEXT_ORDER_COLUMNS if col in columns), None)
+        if order_column in (None, 'id') or 'shabad_id' not in columns:
+            # No numeric ordering column to join on; look lines up one at a time
+            return {line_id: self.get_context(line_id, window) for line_id in unique_ids}
+        
+        contexts: Dict[str, List[ScriptureLine]] = {}
+        for i in range(0, len(unique_ids), CONTEXT_BATCH_SIZE):
+            batch = unique_ids[i:i + CONTEXT_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            query = f"""
+                SELECT l.*, c.id AS context_anchor_id FROM lines c
+                JOIN lines l
+                  ON l."{order_column}" BETWEEN c."{order_column}" - ? AND c."{order_column}" + ?
+                 AND (COALESCE(c.shabad_id, '') = '' OR l.shabad_id = c.shabad_id)
+                WHERE c.id IN ({placeholders})
+                ORDER BY c.id, l."{order_column}"
+            """
+            try:
+                cursor = self._connection.execute(query, (window, window, *batch))
+                for row in cursor.fetchall():
+                    line = self._row_to_scripture_line(row)
+                    if line:
+                        contexts.setdefault(str(row['context_anchor_id']), []).append(line)
+            except sqlite3.Error as e:
+                logger.error(f"Database error getting batched context: {e}")
+        
+        return contexts
     
     def _row_to_scripture_line(self, row: sqlite3.Row) -> Optional[ScriptureLine]:
         """
@@ -644,7 +727,7 @@ class SGGSDatabase:
         try:
             row_keys = row.keys()
             line_id = str(row['id'] if 'id' in row_keys else '')
-            gurmukhi = str(row.get('gurmukhi', ''))
+            gurmukhi = str(row['gurmukhi'] if 'gurmukhi' in row_keys else '')
             
             # Get ang
             ang = None
@@ -657,8 +740,8 @@ class SGGSDatabase:
                         continue
             
             # Get writer_id and section_id
-            writer_id = row.get('writer_id') if 'writer_id' in row_keys else None
-            section_id = row.get('section_id') if 'section_id' in row_keys else None
+            writer_id = row['writer_id'] if 'writer_id' in row_keys else None
+            section_id = row['section_id'] if 'section_id' in row_keys else None
             
             # Resolve names
             author = self._resolve_writer_name(writer_id) if writer_id else None
@@ -673,7 +756,7 @@ class SGGSDatabase:
                         break
             
             # Get shabad_id
-            shabad_id = row.get('shabad_id') if 'shabad_id' in row_keys else None
+            shabad_id = row['shabad_id'] if 'shabad_id' in row_keys else None
             
             return ScriptureLine(
                 line_id=line_id,
@@ -799,4 +882,40 @@ class SGGSDatabase:
                 logger.debug(f"Error getting translation from {lines_table}: {e}")
         
         logger.debug(f"No English translation found for line_id: {line_id}")
-        return None
\ No newline at end of file
+        return None
+
+
+# Shared instance, opened on first use
+_default_sggs_db: Optional[SGGSDatabase] = None
+_default_sggs_db_lock = threading.Lock()
+
+
+def get_default_sggs_db() -> SGGSDatabase:
+    """
+    Get the shared SGGS database handle.
+    
+    The connection may be used from any thread, so one handle can serve
+    every formatter and job in the process.
+    
+    Returns:
+        SGGSDatabase instance
+    """
+    global _default_sggs_db
+    
+    with _default_sggs_db_lock:
+        if _default_sggs_db is None:
+            _default_sggs_db = SGGSDatabase(check_same_thread=False)
+        return _default_sggs_db
+
+
+def close_default_sggs_db() -> None:
+    """Close the shared SGGS database handle, if it was opened."""
+    global _default_sggs_db
+    
+    with _default_sggs_db_lock:
+        if _default_sggs_db is not None:
+            _default_sggs_db.close()
+            _default_sggs_db = None
+
+
+atexit.register(close_default_sggs_db)
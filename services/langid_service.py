@@ -6,16 +6,30 @@ to route them to appropriate ASR engines.
 
 Phase 1: Rule-based detection (can be enhanced with ML later).
 """
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Hashable
 from core.models import AudioChunk
 
+logger = logging.getLogger(__name__)
+
 # Route types
 ROUTE_PUNJABI_SPEECH = "punjabi_speech"
 ROUTE_ENGLISH_SPEECH = "english_speech"
 ROUTE_SCRIPTURE_QUOTE_LIKELY = "scripture_quote_likely"
 ROUTE_MIXED = "mixed"
 
+# Language code passed to ASR for each route (None lets the engine auto-detect)
+ROUTE_LANGUAGES = {
+    ROUTE_PUNJABI_SPEECH: 'pa',
+    ROUTE_ENGLISH_SPEECH: 'en',
+    ROUTE_SCRIPTURE_QUOTE_LIKELY: 'pa',  # Gurbani is in Punjabi/Sant Bhasha
+    ROUTE_MIXED: None  # Auto-detect
+}
+
 
 class LangIDService:
     """
@@ -29,7 +43,8 @@ class LangIDService:
         self,
         quick_asr_service: Optional[object] = None,
         punjabi_threshold: float = 0.6,
-        english_threshold: float = 0.6
+        english_threshold: float = 0.6,
+        cache_size: int = 512
     ):
         """
         Initialize LangID service.
@@ -38,15 +53,24 @@ class LangIDService:
             quick_asr_service: Optional ASR service for quick language detection
             punjabi_threshold: Threshold for Punjabi detection (0.0-1.0)
             english_threshold: Threshold for English detection (0.0-1.0)
+            cache_size: Number of identified routes to remember (0 disables caching)
         """
         self.quick_asr_service = quick_asr_service
         self.punjabi_threshold = punjabi_threshold
         self.english_threshold = english_threshold
+        
+        # LRU of routes from the quick ASR pass, keyed by chunk audio
+        self.cache_size = cache_size
+        self._route_cache: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def identify_segment(self, audio_chunk: AudioChunk) -> str:
         """
         Identify language/domain for an audio segment.
         
+        Routes from the quick ASR pass are cached, so identifying the same
+        audio again (e.g. a retried live chunk) skips the ASR call.
+        
         Args:
             audio_chunk: AudioChunk to identify
         
@@ -54,6 +78,63 @@ class LangIDService:
             Route string: "punjabi_speech", "english_speech", 
                           "scripture_quote_likely", or "mixed"
         """
+        if self.quick_asr_service is None or self.cache_size <= 0:
+            return self._identify_uncached(audio_chunk)
+        
+        key = self._cache_key(audio_chunk)
+        with self._cache_lock:
+            route = self._route_cache.get(key)
+            if route is not None:
+                self._route_cache.move_to_end(key)
+                return route
+        
+        route = self._identify_with_asr(audio_chunk)
+        if route is None:
+            # Quick ASR failed; don't cache the heuristic fallback
+            return ROUTE_PUNJABI_SPEECH
+        
+        with self._cache_lock:
+            self._route_cache[key] = route
+            self._route_cache.move_to_end(key)
+            if len(self._route_cache) > self.cache_size:
+                self._route_cache.popitem(last=False)
+        return route
+    
+    def clear_cache(self) -> None:
+        """Forget all cached routes."""
+        with self._cache_lock:
+            self._route_cache.clear()
+    
+    @staticmethod
+    def _cache_key(audio_chunk: AudioChunk) -> Hashable:
+        """
+        Build the route cache key for a chunk.
+        
+        Buffered chunks are keyed by a digest of their audio; file chunks by
+        their path and time range.
+        """
+        if audio_chunk.audio_buffer is not None:
+            return hashlib.blake2b(audio_chunk.audio_buffer, digest_size=16).digest()
+        return (str(audio_chunk.audio_path), audio_chunk.start_time, audio_chunk.end_time)
+    
+    def _identify_uncached(self, audio_chunk: AudioChunk) -> str:
+        """Identify a segment without consulting the route cache."""
+        route = self._identify_with_asr(audio_chunk)
+        # Strategy 2: Heuristic-based detection (fallback)
+        # For Phase 1, default to Punjabi speech (most common case)
+        # This can be enhanced with audio feature analysis later
+        return route if route is not None else ROUTE_PUNJABI_SPEECH
+    
+    def _identify_with_asr(self, audio_chunk: AudioChunk) -> Optional[str]:
+        """
+        Identify a segment with a quick ASR pass.
+        
+        Args:
+            audio_chunk: AudioChunk to identify
+        
+        Returns:
+            Route string, or None if no quick ASR is available or it failed
+        """
         # Strategy 1: Use quick ASR pass if available
         if self.quick_asr_service is not None:
             try:
@@ -86,13 +167,10 @@ class LangIDService:
                     return ROUTE_MIXED
                     
             except Exception as e:
-                print(f"Warning: Quick ASR pass failed for language detection: {e}")
+                logger.warning("Quick ASR pass failed for language detection: %s", e)
                 # Fall through to heuristic-based detection
         
-        # Strategy 2: Heuristic-based detection (fallback)
-        # For Phase 1, default to Punjabi speech (most common case)
-        # This can be enhanced with audio feature analysis later
-        return ROUTE_PUNJABI_SPEECH
+        return None
     
     def _looks_like_scripture(self, text: str) -> bool:
         """
@@ -150,10 +228,4 @@ class LangIDService:
         Returns:
             Language code (e.g., 'pa', 'en') or None
         """
-        route_to_lang = {
-            ROUTE_PUNJABI_SPEECH: 'pa',
-            ROUTE_ENGLISH_SPEECH: 'en',
-            ROUTE_SCRIPTURE_QUOTE_LIKELY: 'pa',  # Gurbani is in Punjabi/Sant Bhasha
-            ROUTE_MIXED: None  # Auto-detect
-        }
-        return route_to_lang.get(route)
+        return ROUTE_LANGUAGES.get(route)
@@ -615,6 +615,15 @@ class ScriptConverter:
         self.gurmukhi_normalizer = GurmukhiNormalizer()  # Phase 5: Gurmukhi diacritic normalization
         self.enable_dictionary = enable_dictionary_lookup
         
+        # Resolve config once; convert() runs for every segment
+        try:
+            import config
+            self.unicode_form = getattr(config, 'UNICODE_NORMALIZATION_FORM', 'NFC')
+            self.confidence_threshold = getattr(config, 'SCRIPT_CONVERSION_CONFIDENCE_THRESHOLD', 0.7)
+        except ImportError:
+            self.unicode_form = 'NFC'
+            self.confidence_threshold = 0.7
+        
         logger.info(f"ScriptConverter initialized with scheme='{roman_scheme}', dictionary={enable_dictionary_lookup}")
     
     def convert(
@@ -649,13 +658,7 @@ class ScriptConverter:
         
         try:
             # Step 0: Apply Unicode normalization (Phase 5)
-            try:
-                import config
-                unicode_form = getattr(config, 'UNICODE_NORMALIZATION_FORM', 'NFC')
-            except ImportError:
-                unicode_form = 'NFC'
-            
-            text = unicodedata.normalize(unicode_form, text)
+            text = unicodedata.normalize(self.unicode_form, text)
             
             # Step 1: Detect script
             script, detect_confidence = self.detector.detect_script_with_language_hint(
@@ -693,8 +696,15 @@ class ScriptConverter:
             
             # Step 2.5: Normalize Gurmukhi text (Phase 5)
             if script == "gurmukhi" or (script in ["shahmukhi", "mixed"] and gurmukhi_text):
-                # Apply Gurmukhi-specific normalization
-                gurmukhi_text = self.gurmukhi_normalizer.normalize(gurmukhi_text)
+                # Apply Gurmukhi-specific normalization; Gurmukhi input already had
+                # Step 0's Unicode pass, so skip repeating it when the forms match
+                gurmukhi_text = self.gurmukhi_normalizer.normalize(
+                    gurmukhi_text,
+                    unicode_normalized=(
+                        script == "gurmukhi"
+                        and self.gurmukhi_normalizer.normalization_form == self.unicode_form
+                    )
+                )
                 logger.debug("Applied Gurmukhi normalization")
             
             # Step 3: Romanize
@@ -708,14 +718,7 @@ class ScriptConverter:
             overall_confidence = detect_confidence * convert_confidence
             
             # Determine if review is needed
-            # Import config threshold (will be added in milestone 3.7)
-            try:
-                import config
-                threshold = getattr(config, 'SCRIPT_CONVERSION_CONFIDENCE_THRESHOLD', 0.7)
-            except ImportError:
-                threshold = 0.7
-            
-            needs_review = overall_confidence < threshold
+            needs_review = overall_confidence < self.confidence_threshold
             
             if needs_review:
                 logger.warning(
@@ -4,25 +4,29 @@ Voice Activity Detection (VAD) service for audio chunking.
 This service uses WebRTC VAD to detect speech segments and chunk audio
 into sentence-like segments with overlap buffers for better accuracy.
 """
+import logging
 import os
 from pathlib import Path
 from typing import List, Optional
 import numpy as np
 from core.models import AudioChunk
 
+logger = logging.getLogger(__name__)
+
 try:
     import webrtcvad
     WEBRTCVAD_AVAILABLE = True
 except ImportError:
     WEBRTCVAD_AVAILABLE = False
-    print("Warning: webrtcvad not available. Install with: pip install webrtcvad")
+    logger.warning("webrtcvad not available. Install with: pip install webrtcvad")
 
 try:
     from pydub import AudioSegment
+    from pydub.audio_segment import read_wav_audio
     PYDUB_AVAILABLE = True
 except ImportError:
     PYDUB_AVAILABLE = False
-    print("Warning: pydub not available. Install with: pip install pydub")
+    logger.warning("pydub not available. Install with: pip install pydub")
 
 try:
     import soundfile as sf
@@ -71,12 +75,41 @@ class VADService:
         if frame_duration_ms not in [10, 20, 30]:
             raise ValueError(f"frame_duration_ms must be 10, 20, or 30, got {frame_duration_ms}")
     
+    @staticmethod
+    def _wav_from_buffer(audio_bytes: memoryview) -> Optional['AudioSegment']:
+        """
+        Wrap the samples of an in-memory 16-bit PCM WAV without copying them.
+        
+        Args:
+            audio_bytes: WAV file contents
+        
+        Returns:
+            AudioSegment over a slice of audio_bytes, or None if the data is
+            not plain 16-bit PCM and must be decoded from the file instead
+        """
+        try:
+            wav_data = read_wav_audio(audio_bytes)
+        except Exception:
+            return None
+        if wav_data.audio_format != 1 or wav_data.bits_per_sample != 16 or not wav_data.channels:
+            return None
+        
+        frame_width = 2 * wav_data.channels
+        raw_data = wav_data.raw_data
+        return AudioSegment(
+            data=raw_data[:len(raw_data) - len(raw_data) % frame_width],
+            sample_width=2,
+            frame_rate=wav_data.sample_rate,
+            channels=wav_data.channels
+        )
+    
     def chunk_audio(
         self,
         audio_path: Path,
         min_chunk_duration: Optional[float] = None,
         max_chunk_duration: Optional[float] = None,
-        overlap_seconds: Optional[float] = None
+        overlap_seconds: Optional[float] = None,
+        audio_bytes: Optional[memoryview] = None
     ) -> List[AudioChunk]:
         """
         Chunk audio into speech segments with overlap.
@@ -86,11 +119,14 @@ class VADService:
             min_chunk_duration: Override minimum chunk duration
             max_chunk_duration: Override maximum chunk duration
             overlap_seconds: Override overlap duration
+            audio_bytes: Optional prefetched contents of audio_path; 16-bit PCM
+                         WAV is read in place instead of re-reading the file,
+                         other formats are decoded from the path
         
         Returns:
             List of AudioChunk objects with timing information
         """
-        if not audio_path.exists():
+        if audio_bytes is None and not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
         min_dur = min_chunk_duration or self.min_chunk_duration
@@ -99,7 +135,12 @@ class VADService:
         
         # Load audio file
         try:
-            audio = AudioSegment.from_file(str(audio_path))
+            audio = None
+            if audio_bytes is not None and audio_path.suffix.lower() in ('.wav', '.wave'):
+                audio = self._wav_from_buffer(audio_bytes)
+            if audio is None:
+                # ffmpeg needs a seekable input for containers such as m4a/mp4
+                audio = AudioSegment.from_file(str(audio_path))
         except Exception as e:
             raise RuntimeError(f"Failed to load audio file: {e}")
         
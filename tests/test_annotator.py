@@ -0,0 +1,247 @@
+"""
+Annotator tests.
+
+Tests for:
+- Review priority scoring
+- Review queue generation
+- Column-wise segment view
+"""
+import sys
+from pathlib import Path
+import unittest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.models import ProcessedSegment, QuoteMatch, ScriptureSource
+from post.annotator import Annotator, SegmentColumns
+
+
+def create_segment(confidence: float, needs_review: bool = False, quote_confidence=None,
+                   script_confidence=None) -> ProcessedSegment:
+    """Create a ProcessedSegment for annotation tests."""
+    quote_match = None
+    if quote_confidence is not None:
+        quote_match = QuoteMatch(
+            source=ScriptureSource.SGGS,
+            line_id="sggs_001",
+            canonical_text="ਸਤਿ ਨਾਮੁ",
+            spoken_text="ਸਤਿ ਨਾਮੁ",
+            confidence=quote_confidence
+        )
+    return ProcessedSegment(
+        start=0.0, end=1.0, route="punjabi_speech", type="speech", text="ਸਤਿ ਨਾਮੁ",
+        confidence=confidence, language="pa", needs_review=needs_review,
+        quote_match=quote_match, script_confidence=script_confidence
+    )
+
+
+class TestReviewPriority(unittest.TestCase):
+    """Test review priority scoring."""
+    
+    def setUp(self):
+        self.annotator = Annotator(confidence_threshold=0.7, quote_confidence_threshold=0.9)
+    
+    def test_priorities_match_per_segment_scoring(self):
+        """Test the columnar scores equal the per-segment scores."""
+        segments = [
+            create_segment(0.95),
+            create_segment(0.5, needs_review=True),
+            create_segment(0.5, quote_confidence=0.8, script_confidence=0.5, needs_review=True),
+            create_segment(0.95, quote_confidence=0.95),
+            create_segment(0.95, script_confidence=0.9)
+        ]
+        
+        priorities = self.annotator._calculate_priorities(SegmentColumns.from_segments(segments))
+        
+        self.assertEqual(priorities, [self.annotator._calculate_priority(s) for s in segments])
+        self.assertEqual(priorities[0], 0.0)
+        self.assertAlmostEqual(priorities[2], 1.0)
+        self.assertEqual(priorities[3], 0.0)  # High-confidence quote clamps at zero
+    
+    def test_single_segment_priority(self):
+        """Test a missing quote or script confidence adds nothing to the score."""
+        self.assertAlmostEqual(self.annotator._calculate_priority(create_segment(0.5, needs_review=True)), 0.5)
+        self.assertEqual(self.annotator._calculate_priority(create_segment(0.95, quote_confidence=0.95)), 0.0)
+    
+    def test_review_queue_sorted_by_priority(self):
+        """Test the review queue holds flagged segments, most urgent first."""
+        segments = [
+            create_segment(0.95),
+            create_segment(0.5, needs_review=True),
+            create_segment(0.5, quote_confidence=0.8, needs_review=True)
+        ]
+        
+        queue = self.annotator.generate_review_queue(segments)
+        
+        self.assertEqual(len(queue), 2)
+        self.assertAlmostEqual(queue[0]['review_priority'], 0.8)
+        self.assertAlmostEqual(queue[1]['review_priority'], 0.5)
+
+    
+    def test_review_queue_top_k(self):
+        """Test top_k keeps the most urgent entries in full-queue order."""
+        segments = [
+            create_segment(0.5),
+            create_segment(0.5, needs_review=True),
+            create_segment(0.95, needs_review=True),
+            create_segment(0.5, quote_confidence=0.8, needs_review=True),
+            create_segment(0.5, needs_review=True)
+        ]
+        
+        full_queue = self.annotator.generate_review_queue(segments)
+        
+        for top_k in (0, 2, 3, 10):
+            self.assertEqual(self.annotator.generate_review_queue(segments, top_k=top_k), full_queue[:top_k])
+    
+    def test_summaries_annotate_once(self):
+        """Test export and annotation summaries annotate the segments only once."""
+        import json
+        import tempfile
+        from unittest.mock import patch
+        
+        segments = [
+            create_segment(0.95, quote_confidence=0.95),
+            create_segment(0.5, needs_review=True)
+        ]
+        
+        with patch.object(self.annotator, 'annotate_segments', wraps=self.annotator.annotate_segments) as annotate:
+            summary = self.annotator.generate_annotation_summary(segments)
+            self.assertEqual(annotate.call_count, 1)
+            
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                output_path = self.annotator.export_review_summary(segments, Path(tmp_dir) / "summary.json")
+                exported = json.loads(output_path.read_text(encoding='utf-8'))
+            self.assertEqual(annotate.call_count, 2)
+        
+        self.assertEqual(summary['segments_needing_review'], 1)
+        self.assertEqual(summary['quotes_detected'], 1)
+        self.assertEqual(summary['source_breakdown'], {ScriptureSource.SGGS.value: 1, 'None': 1})
+        self.assertEqual(summary['review_queue_size'], 1)
+        self.assertEqual(summary['route_breakdown'], {'punjabi_speech': 2})
+        self.assertEqual(summary['confidence_stats']['max'], 0.95)
+        self.assertEqual(exported['statistics']['low_confidence_count'], 1)
+        self.assertAlmostEqual(exported['statistics']['avg_confidence'], 0.725)
+    
+    def test_streamed_summary_is_valid_json(self):
+        """Test the streamed review summary parses, with and without queue entries."""
+        import json
+        import tempfile
+        
+        segments = [
+            create_segment(0.5, needs_review=True),
+            create_segment(0.5, quote_confidence=0.8, needs_review=True)
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self.annotator.export_review_summary(segments, Path(tmp_dir) / "summary.json")
+            summary = json.loads(path.read_text(encoding='utf-8'))
+            empty_path = self.annotator.export_review_summary([create_segment(0.95)], Path(tmp_dir) / "empty.json")
+            empty = json.loads(empty_path.read_text(encoding='utf-8'))
+        
+        self.assertEqual(list(summary), ['generated_at', 'total_segments', 'segments_needing_review', 'review_queue', 'statistics'])
+        self.assertEqual(summary['review_queue'], self.annotator.generate_review_queue(segments))
+        self.assertEqual(summary['review_queue'][0]['text'], "ਸਤਿ ਨਾਮੁ")
+        self.assertEqual(empty['review_queue'], [])
+        self.assertEqual(empty['segments_needing_review'], 0)
+    
+    def test_summary_without_orjson(self):
+        """Test the stdlib json fallback writes the same summary."""
+        import json
+        import tempfile
+        from unittest.mock import patch
+        
+        segments = [create_segment(0.5, quote_confidence=0.8, needs_review=True)]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self.annotator.export_review_summary(segments, Path(tmp_dir) / "fast.json")
+            fast = json.loads(path.read_text(encoding='utf-8'))
+            with patch('post.annotator.ORJSON_AVAILABLE', False):
+                path = self.annotator.export_review_summary(segments, Path(tmp_dir) / "stdlib.json")
+            stdlib = json.loads(path.read_text(encoding='utf-8'))
+        
+        fast.pop('generated_at')
+        stdlib.pop('generated_at')
+        self.assertEqual(fast, stdlib)
+    
+    def test_review_queue_csv(self):
+        """Test the CSV export writes a header and one row per queue entry."""
+        import csv
+        import tempfile
+        from post.annotator import REVIEW_QUEUE_FIELDS
+        
+        segments = [create_segment(0.95), create_segment(0.5, needs_review=True)]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self.annotator.export_review_queue_csv(segments, Path(tmp_dir) / "queue.csv")
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+        
+        self.assertEqual(rows[0], REVIEW_QUEUE_FIELDS)
+        self.assertEqual(len(rows), 2)
+
+
+class TestSegmentColumns(unittest.TestCase):
+    """Test the column-wise segment view."""
+    
+    def test_from_segments(self):
+        """Test columns line up with segments, with NaN for missing confidences."""
+        import math
+        
+        segments = [
+            create_segment(0.5, needs_review=True),
+            create_segment(0.9, quote_confidence=0.8, script_confidence=0.6)
+        ]
+        
+        columns = SegmentColumns.from_segments(segments)
+        
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(columns.confidence.tolist(), [0.5, 0.9])
+        self.assertTrue(math.isnan(columns.quote_confidence[0]))
+        self.assertEqual(columns.quote_confidence[1], 0.8)
+        self.assertTrue(math.isnan(columns.script_confidence[0]))
+        self.assertEqual(columns.needs_review.tolist(), [True, False])
+        self.assertEqual(columns.route, ['punjabi_speech', 'punjabi_speech'])
+    
+    def test_empty_batch(self):
+        """Test an empty batch scores and summarizes to empty results."""
+        annotator = Annotator()
+        
+        self.assertEqual(annotator._calculate_priorities(SegmentColumns.from_segments([])), [])
+        summary = annotator.generate_annotation_summary([])
+        self.assertEqual(summary['total_segments'], 0)
+        self.assertEqual(summary['confidence_stats']['average'], 0.0)
+
+
+class TestAnnotatedSegment(unittest.TestCase):
+    """Test AnnotatedSegment serialization."""
+    
+    def test_to_dict_matches_all_fields(self):
+        """Test to_dict covers every dataclass field with its value."""
+        from dataclasses import asdict
+        
+        annotated = Annotator().annotate_segments([
+            create_segment(0.5, needs_review=True, quote_confidence=0.8, script_confidence=0.6)
+        ])[0]
+        
+        self.assertEqual(annotated.to_dict(), asdict(annotated))
+
+def run_tests():
+    """Run all annotator tests."""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    
+    suite.addTests(loader.loadTestsFromTestCase(TestReviewPriority))
+    suite.addTests(loader.loadTestsFromTestCase(TestSegmentColumns))
+    suite.addTests(loader.loadTestsFromTestCase(TestAnnotatedSegment))
+    
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    
+    return result.wasSuccessful()
+
+
+if __name__ == '__main__':
+    success = run_tests()
+    sys.exit(0 if success else 1)
@@ -68,6 +68,17 @@ class TestASRModels(unittest.TestCase):
         self.assertEqual(chunk.end_time, 10.0)
         self.assertEqual(chunk.duration, 10.0)
     
+    def test_audio_chunk_buffer_source(self):
+        """Test a buffered AudioChunk reads from memory instead of a path."""
+        from core.models import AudioChunk
+        
+        chunk = AudioChunk(start_time=5.0, end_time=6.0, audio_path=None, duration=1.0, audio_buffer=b"RIFF")
+        self.assertEqual(chunk.audio_source().read(), b"RIFF")
+        self.assertEqual(create_sample_audio_chunk().audio_source(), str(create_sample_audio_chunk().audio_path))
+        
+        with self.assertRaises(ValueError):
+            AudioChunk(start_time=0.0, end_time=1.0, audio_path=None, duration=1.0)
+    
     def test_segment(self):
         """Test Segment creation and serialization."""
         segment = create_sample_segment()
@@ -164,6 +175,241 @@ class TestASRRouteMapping(unittest.TestCase):
         self.assertEqual(asr._get_language_for_route(None, 'mixed'), 'en')
 
 
+class TestASRBatchTranscription(unittest.TestCase):
+    """Test BaseASR.transcribe_batch."""
+    
+    def test_batch_decodes_once_and_slices_chunks(self):
+        """Test the file is decoded once and each chunk gets its own samples."""
+        from unittest.mock import Mock, patch
+        from types import SimpleNamespace
+        import numpy as np
+        from asr.asr_whisper import ASRWhisper
+        
+        asr = object.__new__(ASRWhisper)
+        asr.model = Mock()
+        asr.model.transcribe.side_effect = lambda samples, **kwargs: (
+            [SimpleNamespace(start=0.0, end=1.0, text=f' {len(samples)}', no_speech_prob=0.1)],
+            SimpleNamespace(language='pa', language_probability=0.9)
+        )
+        chunks = [
+            create_sample_audio_chunk(start_time=0.0, end_time=1.0),
+            create_sample_audio_chunk(start_time=1.0, end_time=3.0)
+        ]
+        
+        with patch('asr.base_asr.decode_audio', return_value=np.zeros(16000 * 4, dtype=np.float32)) as decode:
+            results = asr.transcribe_batch(chunks, route='punjabi_speech')
+        
+        decode.assert_called_once()
+        self.assertEqual([r.text for r in results], ['16000', '32000'])
+        self.assertEqual(results[0].language, 'pa')
+        self.assertAlmostEqual(results[1].confidence, 0.9)
+    
+    def test_batched_pipeline_maps_segments_to_chunks(self):
+        """Test one batched call serves all chunks, even when chunks overlap."""
+        from unittest.mock import Mock, patch
+        from types import SimpleNamespace
+        import numpy as np
+        from asr.asr_whisper import ASRWhisper
+        
+        asr = object.__new__(ASRWhisper)
+        asr.model = Mock()
+        asr.model.feature_extractor.chunk_length = 30
+        asr._batched_pipeline = Mock()
+        # Chunks are laid end to end: 1.0s at 0.0, then 1.5s at 1.0
+        asr._batched_pipeline.transcribe.return_value = (
+            iter([
+                SimpleNamespace(start=0.0, end=1.0, text=' ਸਤਿ', no_speech_prob=0.1),
+                SimpleNamespace(start=1.0, end=2.5, text=' ਨਾਮੁ', no_speech_prob=0.3)
+            ]),
+            SimpleNamespace(language='pa', language_probability=0.9)
+        )
+        chunks = [
+            create_sample_audio_chunk(start_time=0.0, end_time=1.0),
+            create_sample_audio_chunk(start_time=0.5, end_time=2.0)
+        ]
+        
+        with patch('asr.base_asr.decode_audio', return_value=np.ones(16000 * 3, dtype=np.float32)):
+            results = asr.transcribe_batch(chunks, route='punjabi_speech')
+        
+        asr._batched_pipeline.transcribe.assert_called_once()
+        asr.model.transcribe.assert_not_called()
+        audio = asr._batched_pipeline.transcribe.call_args[0][0]
+        self.assertEqual(len(audio), 16000 * 2.5)
+        self.assertEqual([r.text for r in results], ['ਸਤਿ', 'ਨਾਮੁ'])
+        self.assertAlmostEqual(results[1].segments[0].start, 0.0)
+        self.assertAlmostEqual(results[1].confidence, 0.7)
+    
+    def test_batched_pipeline_failure_falls_back(self):
+        """Test chunks are decoded one by one if the batched call fails."""
+        from unittest.mock import Mock, patch
+        from types import SimpleNamespace
+        import numpy as np
+        from asr.asr_whisper import ASRWhisper
+        
+        asr = object.__new__(ASRWhisper)
+        asr.model = Mock()
+        asr.model.feature_extractor.chunk_length = 30
+        asr.model.transcribe.return_value = (
+            [SimpleNamespace(start=0.0, end=1.0, text=' ਸਤਿ', no_speech_prob=0.1)],
+            SimpleNamespace(language='pa', language_probability=0.9)
+        )
+        asr._batched_pipeline = Mock()
+        asr._batched_pipeline.transcribe.side_effect = RuntimeError("out of memory")
+        chunks = [
+            create_sample_audio_chunk(start_time=0.0, end_time=1.0),
+            create_sample_audio_chunk(start_time=1.0, end_time=2.0)
+        ]
+        
+        with patch('asr.base_asr.decode_audio', return_value=np.ones(16000 * 2, dtype=np.float32)):
+            results = asr.transcribe_batch(chunks, route='punjabi_speech')
+        
+        self.assertEqual(asr.model.transcribe.call_count, 2)
+        self.assertEqual([r.text for r in results], ['ਸਤਿ', 'ਸਤਿ'])
+    
+    def test_chunk_longer_than_window_skips_batched_pipeline(self):
+        """Test a chunk past the 30 s window is decoded whole instead of truncated."""
+        from unittest.mock import Mock, patch
+        from types import SimpleNamespace
+        import numpy as np
+        from asr.asr_whisper import ASRWhisper
+        
+        asr = object.__new__(ASRWhisper)
+        asr.model = Mock()
+        asr.model.feature_extractor.chunk_length = 30
+        asr.model.transcribe.side_effect = lambda samples, **kwargs: (
+            [SimpleNamespace(start=0.0, end=1.0, text=f' {len(samples)}', no_speech_prob=0.1)],
+            SimpleNamespace(language='pa', language_probability=0.9)
+        )
+        asr._batched_pipeline = Mock()
+        chunks = [
+            create_sample_audio_chunk(start_time=0.0, end_time=1.0),
+            create_sample_audio_chunk(start_time=1.0, end_time=32.0)
+        ]
+        
+        with patch('asr.base_asr.decode_audio', return_value=np.ones(16000 * 32, dtype=np.float32)):
+            results = asr.transcribe_batch(chunks, route='punjabi_speech')
+        
+        asr._batched_pipeline.transcribe.assert_not_called()
+        self.assertEqual([r.text for r in results], ['16000', str(16000 * 31)])
+    
+    def test_buffered_chunk_uses_own_timeline(self):
+        """Test a buffered live chunk keeps segments timed from its own start."""
+        from unittest.mock import Mock
+        from types import SimpleNamespace
+        from core.models import AudioChunk
+        from asr.asr_whisper import ASRWhisper
+        
+        asr = object.__new__(ASRWhisper)
+        asr.model = Mock()
+        asr.model.transcribe.return_value = (
+            [SimpleNamespace(start=0.2, end=0.9, text=' ਸਤਿ ਨਾਮੁ', no_speech_prob=0.1)],
+            SimpleNamespace(language='pa', language_probability=0.9)
+        )
+        chunk = AudioChunk(start_time=30.0, end_time=31.0, audio_path=None, duration=1.0, audio_buffer=b"RIFF")
+        
+        result = asr.transcribe_chunk(chunk, route='punjabi_speech')
+        
+        self.assertEqual(result.text, 'ਸਤਿ ਨਾਮੁ')
+        self.assertAlmostEqual(result.segments[0].start, 0.2)
+        self.assertEqual(asr.model.transcribe.call_args[0][0].read(), b"RIFF")
+
+
+class TestLangIDCache(unittest.TestCase):
+    """Test LangID route caching."""
+    
+    def setUp(self):
+        from unittest.mock import Mock
+        from services.langid_service import LangIDService
+        
+        self.quick_asr = Mock()
+        self.quick_asr.transcribe_chunk.return_value = create_sample_asr_result(text="hello", language="en")
+        self.langid = LangIDService(quick_asr_service=self.quick_asr, cache_size=2)
+    
+    def _buffered_chunk(self, data: bytes):
+        from core.models import AudioChunk
+        return AudioChunk(start_time=0.0, end_time=1.0, audio_path=None, duration=1.0, audio_buffer=data)
+    
+    def test_repeat_audio_skips_quick_asr(self):
+        """Test identical buffered audio is only transcribed once."""
+        first = self.langid.identify_segment(self._buffered_chunk(b"abc"))
+        second = self.langid.identify_segment(self._buffered_chunk(b"abc"))
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.quick_asr.transcribe_chunk.call_count, 1)
+    
+    def test_file_chunks_keyed_by_range(self):
+        """Test file chunks with different time ranges are identified separately."""
+        self.langid.identify_segment(create_sample_audio_chunk(0.0, 1.0))
+        self.langid.identify_segment(create_sample_audio_chunk(1.0, 2.0))
+        self.langid.identify_segment(create_sample_audio_chunk(0.0, 1.0))
+        
+        self.assertEqual(self.quick_asr.transcribe_chunk.call_count, 2)
+    
+    def test_cache_evicts_and_clears(self):
+        """Test the cache is bounded and can be cleared."""
+        for data in (b"a", b"b", b"c"):
+            self.langid.identify_segment(self._buffered_chunk(data))
+        self.assertEqual(len(self.langid._route_cache), 2)
+        
+        self.langid.identify_segment(self._buffered_chunk(b"a"))  # Evicted, so re-identified
+        self.assertEqual(self.quick_asr.transcribe_chunk.call_count, 4)
+        
+        self.langid.clear_cache()
+        self.assertEqual(len(self.langid._route_cache), 0)
+    
+    def test_failed_quick_asr_not_cached(self):
+        """Test the fallback route after an ASR failure is not remembered."""
+        from services.langid_service import ROUTE_PUNJABI_SPEECH
+        
+        self.quick_asr.transcribe_chunk.side_effect = RuntimeError("boom")
+        with self.assertLogs('services.langid_service', level='WARNING') as logs:
+            self.assertEqual(self.langid.identify_segment(self._buffered_chunk(b"x")), ROUTE_PUNJABI_SPEECH)
+        self.assertIn("boom", logs.output[0])
+        self.assertEqual(len(self.langid._route_cache), 0)
+
+
+class TestASRFusionSingleHypothesis(unittest.TestCase):
+    """Test ASRFusion's fast path for a single hypothesis."""
+    
+    def test_single_hypothesis_skips_agreement_scoring(self):
+        """Test one hypothesis is returned as-is without pairwise scoring."""
+        from unittest.mock import patch
+        from asr.asr_fusion import ASRFusion
+        
+        fusion = ASRFusion()
+        hypothesis = create_sample_asr_result(text="ਸਤਿ ਨਾਮੁ", confidence=0.92, engine="asr_a_whisper")
+        
+        with patch.object(fusion, '_calculate_agreement_scores') as scoring:
+            result = fusion.fuse_hypotheses([hypothesis])
+        
+        scoring.assert_not_called()
+        self.assertEqual(result.fused_text, "ਸਤਿ ਨਾਮੁ")
+        self.assertEqual(result.fused_confidence, 0.92)
+        self.assertEqual(result.agreement_score, 1.0)
+        self.assertEqual(result.selected_engine, "asr_a_whisper")
+
+
+class TestASRFusionAgreement(unittest.TestCase):
+    """Test pairwise agreement scoring in ASRFusion."""
+    
+    def test_matrix_matches_pairwise_similarity(self):
+        """Test the agreement matrix equals per-pair _text_similarity."""
+        from asr.asr_fusion import ASRFusion
+        
+        fusion = ASRFusion()
+        texts = ["ਸਤਿ ਨਾਮੁ", "ਸਤਿ  ਨਾਮੁ ਕਰਤਾ", "", "  ", "waheguru"]
+        hypotheses = [create_sample_asr_result(text=text) for text in texts]
+        
+        matrix = fusion._calculate_agreement_scores(hypotheses)
+        
+        for i, text1 in enumerate(texts):
+            self.assertEqual(matrix[i][i], 1.0)
+            for j, text2 in enumerate(texts):
+                if i != j:
+                    self.assertAlmostEqual(matrix[i][j], fusion._text_similarity(text1, text2))
+        self.assertEqual(matrix[2][3], 0.0)  # Empty never agrees with non-empty
+
+
 def run_tests():
     """Run all ASR tests."""
     loader = unittest.TestLoader()
@@ -173,6 +419,10 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestASRModels))
     suite.addTests(loader.loadTestsFromTestCase(TestASRConfiguration))
     suite.addTests(loader.loadTestsFromTestCase(TestASRRouteMapping))
+    suite.addTests(loader.loadTestsFromTestCase(TestASRBatchTranscription))
+    suite.addTests(loader.loadTestsFromTestCase(TestLangIDCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestASRFusionSingleHypothesis))
+    suite.addTests(loader.loadTestsFromTestCase(TestASRFusionAgreement))
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
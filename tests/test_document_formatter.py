@@ -193,12 +193,53 @@ def test_empty_segments():
     formatter.close()
 
 
+def test_shared_scripture_databases():
+    """Test formatters share one scripture DB handle that outlives close()."""
+    import sqlite3
+    import tempfile
+    import threading
+    from unittest.mock import patch
+    from scripture.sggs_db import close_default_sggs_db
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "sggs.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE lines (id TEXT PRIMARY KEY, gurmukhi TEXT NOT NULL)")
+        conn.execute("INSERT INTO lines VALUES ('1', 'ਵਾਹਿਗੁਰੂ')")
+        conn.commit()
+        conn.close()
+        
+        close_default_sggs_db()
+        try:
+            with patch('config.SCRIPTURE_DB_PATH', db_path), \
+                 patch('config.DASAM_DB_PATH', Path(tmp_dir) / "missing.db"):
+                first = DocumentFormatter()
+                second = DocumentFormatter()
+            
+            assert first.sggs_db is second.sggs_db, "Formatters should share the SGGS handle"
+            assert first.dasam_db is None
+            
+            first.close()
+            
+            # The shared handle stays open and is usable from other threads
+            lines = []
+            worker = threading.Thread(target=lambda: lines.append(second.sggs_db.get_line_by_id('1')))
+            worker.start()
+            worker.join()
+            assert lines[0] is not None and lines[0].gurmukhi == "ਵਾਹਿਗੁਰੂ"
+            
+            print("[PASS] Shared scripture databases test passed")
+        finally:
+            close_default_sggs_db()
+
+
 def main():
     """Run all tests."""
     print("Testing DocumentFormatter...\n")
     
     test_document_formatting()
     test_empty_segments()
+    test_shared_scripture_databases()
     
     print("\n[SUCCESS] All DocumentFormatter tests passed!")
 
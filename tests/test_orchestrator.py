@@ -18,6 +18,8 @@ import unittest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from tests.fixtures import create_sample_asr_result
+
 
 class TestOrchestratorImports(unittest.TestCase):
     """Test orchestrator imports."""
@@ -27,6 +29,20 @@ class TestOrchestratorImports(unittest.TestCase):
         from core.orchestrator import Orchestrator
         self.assertTrue(hasattr(Orchestrator, 'transcribe_file'))
     
+    def test_import_skips_engine_dependencies(self):
+        """Test importing the orchestrator does not load faster-whisper or webrtcvad."""
+        import subprocess
+        
+        code = (
+            "import sys; import core.orchestrator; "
+            "print(sorted(m for m in ('faster_whisper', 'webrtcvad') if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=str(project_root),
+            capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "[]")
+    
     def test_import_models(self):
         """Test pipeline model imports."""
         from core.models import (
@@ -198,6 +214,845 @@ class TestScriptConversion(unittest.TestCase):
         self.assertTrue(hasattr(config, 'ROMAN_TRANSLITERATION_SCHEME'))
 
 
+class TestEngineRouting(unittest.TestCase):
+    """Test route-based selection of additional ASR engines."""
+    
+    def setUp(self):
+        from unittest.mock import Mock
+        from core.orchestrator import Orchestrator
+        self.orchestrator = Orchestrator(asr_service=Mock(), langid_service=Mock())
+    
+    def test_engines_for_known_routes(self):
+        """Test each route maps to its additional engines."""
+        from services.langid_service import (
+            ROUTE_PUNJABI_SPEECH, ROUTE_ENGLISH_SPEECH,
+            ROUTE_SCRIPTURE_QUOTE_LIKELY, ROUTE_MIXED
+        )
+        
+        self.assertEqual(self.orchestrator._get_engines_for_route(ROUTE_PUNJABI_SPEECH), ('asr_b',))
+        self.assertEqual(self.orchestrator._get_engines_for_route(ROUTE_ENGLISH_SPEECH), ('asr_c',))
+        self.assertEqual(self.orchestrator._get_engines_for_route(ROUTE_SCRIPTURE_QUOTE_LIKELY), ('asr_b',))
+        self.assertEqual(self.orchestrator._get_engines_for_route(ROUTE_MIXED), ('asr_b', 'asr_c'))
+    
+    def test_engines_for_unknown_route(self):
+        """Test unknown routes run no additional engines."""
+        self.assertEqual(self.orchestrator._get_engines_for_route('unknown'), ())
+    
+    def test_route_languages_resolved_once(self):
+        """Test known routes use the precomputed language map and others ask LangID."""
+        from unittest.mock import Mock
+        from core.orchestrator import Orchestrator
+        from services.langid_service import LangIDService, ROUTE_ENGLISH_SPEECH, ROUTE_MIXED
+        
+        langid = Mock(wraps=LangIDService())
+        orchestrator = Orchestrator(asr_service=Mock(), langid_service=langid)
+        init_calls = langid.get_language_code.call_count
+        
+        self.assertEqual(orchestrator._language_for_route(ROUTE_ENGLISH_SPEECH), 'en')
+        self.assertIsNone(orchestrator._language_for_route(ROUTE_MIXED))
+        self.assertEqual(langid.get_language_code.call_count, init_calls)
+        
+        self.assertIsNone(orchestrator._language_for_route('unknown'))
+        self.assertEqual(langid.get_language_code.call_count, init_calls + 1)
+        orchestrator.close()
+    
+    def test_engine_names_resolve_to_services(self):
+        """Test legacy names map to ASR-B/C and others go through get_provider."""
+        from unittest.mock import Mock, patch
+        
+        self.orchestrator.asr_indic = Mock()
+        self.orchestrator.asr_english = Mock()
+        
+        self.assertIs(self.orchestrator._get_engine('asr_b'), self.orchestrator.asr_indic)
+        self.assertIs(self.orchestrator._get_engine('asr_c'), self.orchestrator.asr_english)
+        self.assertIs(self.orchestrator._get_engine('whisper'), self.orchestrator.asr_service)
+        with patch.object(self.orchestrator, 'get_provider', return_value='provider') as get_provider:
+            self.assertEqual(self.orchestrator._get_engine('wav2vec2'), 'provider')
+        get_provider.assert_called_once_with('wav2vec2')
+
+
+class TestAudioPrefetch(unittest.TestCase):
+    """Test audio file prefetching."""
+    
+    def setUp(self):
+        import tempfile
+        import wave
+        from unittest.mock import Mock
+        from core.orchestrator import Orchestrator
+        self.orchestrator = Orchestrator(asr_service=Mock(), langid_service=Mock())
+        
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
+            self.audio_path = Path(tmp_file.name)
+        with wave.open(str(self.audio_path), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(b'\x00\x00' * 16000)
+    
+    def tearDown(self):
+        self.audio_path.unlink()
+    
+    def test_prefetch_maps_file_contents(self):
+        """Test prefetch returns the file bytes."""
+        buffer = self.orchestrator.prefetch(self.audio_path)
+        try:
+            self.assertEqual(bytes(buffer), self.audio_path.read_bytes())
+        finally:
+            self.orchestrator._release_prefetch(buffer)
+    
+    def test_prefetch_missing_file(self):
+        """Test prefetch raises FileNotFoundError for missing files."""
+        with self.assertRaises(FileNotFoundError):
+            self.orchestrator.prefetch(self.audio_path.with_name('missing.wav'))
+    
+    def test_vad_chunks_prefetched_audio(self):
+        """Test VAD decodes from a prefetched buffer."""
+        from services.vad_service import VADService
+        
+        vad = VADService()
+        buffer = self.orchestrator.prefetch(self.audio_path)
+        try:
+            from_buffer = vad.chunk_audio(self.audio_path, audio_bytes=buffer)
+        finally:
+            self.orchestrator._release_prefetch(buffer)
+        
+        self.assertEqual(from_buffer, vad.chunk_audio(self.audio_path))
+    
+    def test_wav_buffer_wrapped_in_place(self):
+        """Test a 16-bit PCM WAV buffer is read without copying the samples."""
+        from services.vad_service import VADService
+        
+        buffer = self.orchestrator.prefetch(self.audio_path)
+        try:
+            audio = VADService._wav_from_buffer(buffer)
+            self.assertIsInstance(audio.raw_data, memoryview)
+            self.assertEqual(audio.frame_rate, 16000)
+            self.assertEqual(len(audio.raw_data), 32000)
+        finally:
+            del audio
+            self.orchestrator._release_prefetch(buffer)
+    
+    def test_prefetch_released_on_early_error(self):
+        """Test the mapped file is released when job setup fails before VAD."""
+        from unittest.mock import patch
+        
+        with patch.object(self.orchestrator, '_release_prefetch') as release:
+            with self.assertRaises(ValueError):
+                self.orchestrator._prepare_chunks(
+                    self.audio_path, "batch", "test", None, None, "not-a-mode", None
+                )
+        release.assert_called_once()
+
+
+class TestRedecodeGate(unittest.TestCase):
+    """Test the re-decode policy in chunk processing."""
+    
+    def setUp(self):
+        from unittest.mock import Mock
+        from core.models import AudioChunk
+        from core.orchestrator import Orchestrator
+        
+        self.asr_a = Mock()
+        self.asr_b = Mock()
+        self.orchestrator = Orchestrator(
+            asr_service=self.asr_a,
+            langid_service=Mock(),
+            asr_indic=self.asr_b
+        )
+        self.chunk = AudioChunk(start_time=0.0, end_time=2.0, audio_path=Path('chunk.wav'), duration=2.0)
+    
+    def test_agreeing_engines_skip_redecode(self):
+        """Test low-confidence chunks are not re-decoded when engines agree."""
+        self.asr_a.transcribe_chunk.return_value = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ ਕਰਤਾ', confidence=0.4, engine='asr_a')
+        self.asr_b.transcribe_chunk.return_value = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ ਕਰਤਾ', confidence=0.4, engine='asr_b')
+        
+        self.orchestrator._process_chunk_with_fusion(self.chunk, 'punjabi_speech', 'pa', 'test')
+        
+        # ASR-B ran once as an additional engine, never as a re-decode
+        self.assertEqual(self.asr_b.transcribe_chunk.call_count, 1)
+    
+    def test_single_hypothesis_still_redecodes(self):
+        """Test a lone low-confidence hypothesis is still re-decoded."""
+        self.asr_a.transcribe_chunk.return_value = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ ਕਰਤਾ', confidence=0.4, engine='asr_a')
+        self.asr_b.transcribe_chunk.return_value = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ ਕਰਤਾ', confidence=0.8, engine='asr_b')
+        
+        # Unknown routes run no additional engines, so ASR-B is only used for re-decode
+        self.orchestrator._process_chunk_with_fusion(self.chunk, 'unknown', 'pa', 'test')
+        
+        self.assertEqual(self.asr_b.transcribe_chunk.call_count, 1)
+
+
+class TestParallelEngines(unittest.TestCase):
+    """Test running additional ASR engines on the shared pool."""
+    
+    def setUp(self):
+        from unittest.mock import Mock
+        from core.models import AudioChunk
+        from core.orchestrator import Orchestrator
+        
+        self.asr_b = Mock()
+        self.asr_c = Mock()
+        self.orchestrator = Orchestrator(
+            asr_service=Mock(),
+            langid_service=Mock(),
+            asr_indic=self.asr_b,
+            asr_english=self.asr_c
+        )
+        self.chunk = AudioChunk(start_time=0.0, end_time=2.0, audio_path=Path('chunk.wav'), duration=2.0)
+    
+    def tearDown(self):
+        self.orchestrator.close()
+    
+    def test_results_in_engine_order(self):
+        """Test results keep engine order regardless of completion order."""
+        import time
+        
+        def slow_result(*args, **kwargs):
+            time.sleep(0.05)
+            return create_sample_asr_result(text='ਸਤਿ', confidence=0.9, engine='asr_b')
+        
+        self.asr_b.transcribe_chunk.side_effect = slow_result
+        self.asr_c.transcribe_chunk.return_value = create_sample_asr_result(text='sat', confidence=0.8, engine='asr_c')
+        
+        results = self.orchestrator._run_additional_engines_parallel(
+            self.chunk, 'mixed', None, ('asr_b', 'asr_c'), 'test'
+        )
+        
+        self.assertEqual([r.engine for r in results], ['asr_b', 'asr_c'])
+    
+    def test_timed_out_engine_is_dropped(self):
+        """Test an engine exceeding the timeout is left out of the results."""
+        import time
+        
+        def hung_result(*args, **kwargs):
+            time.sleep(0.5)
+            return create_sample_asr_result(text='sat', confidence=0.8, engine='asr_c')
+        
+        self.asr_b.transcribe_chunk.return_value = create_sample_asr_result(text='ਸਤਿ', confidence=0.9, engine='asr_b')
+        self.asr_c.transcribe_chunk.side_effect = hung_result
+        self.orchestrator.asr_timeout = 0.1
+        
+        results = self.orchestrator._run_additional_engines_parallel(
+            self.chunk, 'mixed', None, ('asr_b', 'asr_c'), 'test'
+        )
+        
+        self.assertEqual([r.engine for r in results], ['asr_b'])
+    
+    def test_agreeing_engine_abandons_slower_ones(self):
+        """Test an engine agreeing with ASR-A stops the wait for the rest."""
+        import time
+        
+        def slow_result(*args, **kwargs):
+            time.sleep(0.3)
+            return create_sample_asr_result(text='sat', confidence=0.8, engine='asr_c')
+        
+        asr_a_result = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ', confidence=0.9, engine='asr_a')
+        self.asr_b.transcribe_chunk.return_value = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ', confidence=0.9, engine='asr_b')
+        self.asr_c.transcribe_chunk.side_effect = slow_result
+        
+        start = time.monotonic()
+        results = self.orchestrator._run_additional_engines_parallel(
+            self.chunk, 'mixed', None, ('asr_b', 'asr_c'), 'test', asr_a_result
+        )
+        
+        self.assertEqual([r.engine for r in results], ['asr_b'])
+        self.assertLess(time.monotonic() - start, 0.25)
+    
+    def test_no_early_abort_when_pool_saturated(self):
+        """Test early abort waits instead of leaving every pool worker on abandoned engines."""
+        import threading
+        import time
+        
+        started = threading.Event()
+        
+        def agreeing_result(*args, **kwargs):
+            started.wait(timeout=1)  # ASR-C is running by the time ASR-B agrees
+            return create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ', confidence=0.9, engine='asr_b')
+        
+        def slow_result(*args, **kwargs):
+            started.set()
+            time.sleep(0.1)
+            return create_sample_asr_result(text='sat', confidence=0.8, engine='asr_c')
+        
+        asr_a_result = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ', confidence=0.9, engine='asr_a')
+        self.asr_b.transcribe_chunk.side_effect = agreeing_result
+        self.asr_c.transcribe_chunk.side_effect = slow_result
+        self.orchestrator._abandoned_engines = self.orchestrator._asr_pool_size - 1
+        
+        results = self.orchestrator._run_additional_engines_parallel(
+            self.chunk, 'mixed', None, ('asr_b', 'asr_c'), 'test', asr_a_result
+        )
+        
+        self.assertEqual([r.engine for r in results], ['asr_b', 'asr_c'])
+        self.assertEqual(self.orchestrator._abandoned_engines, self.orchestrator._asr_pool_size - 1)
+    
+    def test_abandoned_engine_releases_worker(self):
+        """Test an abandoned engine stops counting against the pool once it finishes."""
+        import threading
+        import time
+        
+        started = threading.Event()
+        
+        def agreeing_result(*args, **kwargs):
+            started.wait(timeout=1)  # ASR-C is running by the time ASR-B agrees
+            return create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ', confidence=0.9, engine='asr_b')
+        
+        def slow_result(*args, **kwargs):
+            started.set()
+            time.sleep(0.1)
+            return create_sample_asr_result(text='sat', confidence=0.8, engine='asr_c')
+        
+        asr_a_result = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ', confidence=0.9, engine='asr_a')
+        self.asr_b.transcribe_chunk.side_effect = agreeing_result
+        self.asr_c.transcribe_chunk.side_effect = slow_result
+        
+        self.orchestrator._run_additional_engines_parallel(
+            self.chunk, 'mixed', None, ('asr_b', 'asr_c'), 'test', asr_a_result
+        )
+        self.assertEqual(self.orchestrator._abandoned_engines, 1)
+        time.sleep(0.2)
+        self.assertEqual(self.orchestrator._abandoned_engines, 0)
+    
+    def test_pool_resize_during_submits(self):
+        """Test resizing the pool while another job submits engines never fails a submit."""
+        import threading
+        
+        self.asr_b.transcribe_chunk.return_value = create_sample_asr_result(text='ਸਤਿ', confidence=0.9, engine='asr_b')
+        self.asr_c.transcribe_chunk.return_value = create_sample_asr_result(text='sat', confidence=0.8, engine='asr_c')
+        done = threading.Event()
+        
+        def resize():
+            workers = 1
+            while not done.is_set():
+                workers = 3 - workers
+                self.orchestrator._apply_processing_options({'parallelWorkers': workers}, 'resize')
+        
+        resizer = threading.Thread(target=resize)
+        resizer.start()
+        try:
+            for _ in range(200):
+                results = self.orchestrator._run_additional_engines_parallel(
+                    self.chunk, 'mixed', None, ('asr_b', 'asr_c'), 'test'
+                )
+                self.assertEqual([r.engine for r in results], ['asr_b', 'asr_c'])
+        finally:
+            done.set()
+            resizer.join()
+    
+    def test_disagreeing_engine_waits_for_rest(self):
+        """Test a disagreeing first result still waits for the other engines."""
+        import time
+        
+        def slow_result(*args, **kwargs):
+            time.sleep(0.05)
+            return create_sample_asr_result(text='sat', confidence=0.8, engine='asr_c')
+        
+        asr_a_result = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ', confidence=0.9, engine='asr_a')
+        self.asr_b.transcribe_chunk.return_value = create_sample_asr_result(text='ਵਾਹਿਗੁਰੂ', confidence=0.9, engine='asr_b')
+        self.asr_c.transcribe_chunk.side_effect = slow_result
+        
+        results = self.orchestrator._run_additional_engines_parallel(
+            self.chunk, 'mixed', None, ('asr_b', 'asr_c'), 'test', asr_a_result
+        )
+        
+        self.assertEqual([r.engine for r in results], ['asr_b', 'asr_c'])
+
+
+class TestTranscribeFile(unittest.TestCase):
+    """Test transcribe_file with mocked VAD, LangID and ASR services."""
+    
+    def setUp(self):
+        import tempfile
+        from unittest.mock import Mock
+        from core.models import AudioChunk
+        from core.orchestrator import Orchestrator
+        
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
+            tmp_file.write(b'RIFF')
+            self.audio_path = Path(tmp_file.name)
+        
+        self.chunks = [
+            AudioChunk(start_time=float(i), end_time=float(i + 1), audio_path=self.audio_path, duration=1.0)
+            for i in range(5)
+        ]
+        vad_service = Mock()
+        vad_service.chunk_audio.return_value = self.chunks
+        
+        self.langid_service = Mock()
+        self.langid_service.identify_segment.side_effect = (
+            lambda chunk: 'english_speech' if chunk.start_time == 2.0 else 'unknown'
+        )
+        self.langid_service.get_language_code.return_value = 'pa'
+        
+        self.asr_a = Mock()
+        self.asr_a.transcribe_chunk.side_effect = (
+            lambda chunk, **kwargs: create_sample_asr_result(text=f'ਸਤਿ {int(chunk.start_time)}', confidence=0.95, engine='asr_a')
+        )
+        asr_c = Mock()
+        asr_c.transcribe_chunk.side_effect = (
+            lambda chunk, language, route: create_sample_asr_result(text=f'ਸਤਿ {int(chunk.start_time)}', confidence=0.95, engine='asr_c')
+        )
+        self.orchestrator = Orchestrator(
+            vad_service=vad_service,
+            langid_service=self.langid_service,
+            asr_service=self.asr_a,
+            asr_english=asr_c
+        )
+    
+    def tearDown(self):
+        self.orchestrator.close()
+        self.audio_path.unlink()
+    
+    def test_segments_follow_chunk_order(self):
+        """Test segments and routes line up with their chunks."""
+        result = self.orchestrator.transcribe_file(self.audio_path, job_id='test')
+        
+        self.assertEqual([seg.start for seg in result.segments], [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(result.segments[2].route, 'english_speech')
+        self.assertEqual(result.metrics['routes']['english_speech'], 1)
+        self.assertEqual(result.metrics['total_segments'], 5)
+    
+    def test_stream_yields_segments_in_order(self):
+        """Test transcribe_file_stream yields each segment before processing the next chunk."""
+        from core.models import ProcessedSegment
+        
+        fused = []
+        
+        def fake_fusion(chunk, route, language, job_id=None, asr_a_result=None):
+            fused.append(chunk.start_time)
+            return ProcessedSegment(
+                start=chunk.start_time, end=chunk.end_time, route=route, type="speech",
+                text="ਸਤਿ", confidence=1.0, language="pa"
+            )
+        
+        self.orchestrator._process_chunk_with_fusion = fake_fusion
+        stream = self.orchestrator.transcribe_file_stream(self.audio_path, job_id='test')
+        
+        first = next(stream)
+        self.assertEqual(first.start, 0.0)
+        self.assertEqual(fused, [0.0])
+        
+        rest = list(stream)
+        self.assertEqual([seg.start for seg in rest], [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(rest[1].route, 'english_speech')
+    
+    def test_out_of_order_segments_keep_chunk_order(self):
+        """Test segments completing out of order land in their chunk's slot."""
+        from core.models import ProcessedSegment
+        
+        def reversed_segments(chunks, mode, job_id, progress_callback=None):
+            for i in reversed(range(len(chunks))):
+                yield i, ProcessedSegment(
+                    start=chunks[i].start_time, end=chunks[i].end_time, route='mixed',
+                    type="speech", text="ਸਤਿ", confidence=1.0, language="pa"
+                )
+        
+        self.orchestrator._iter_segments = reversed_segments
+        result = self.orchestrator.transcribe_file(self.audio_path, job_id='test')
+        
+        self.assertEqual([seg.start for seg in result.segments], [0.0, 1.0, 2.0, 3.0, 4.0])
+    
+    def test_empty_transcription_is_flagged(self):
+        """Test segments without text get placeholder text and a review flag."""
+        from core.models import ProcessedSegment
+        from core.orchestrator import EMPTY_TRANSCRIPTION_TEXT
+        
+        def fake_fusion(chunk, route, language, job_id=None, asr_a_result=None):
+            return ProcessedSegment(
+                start=chunk.start_time, end=chunk.end_time, route=route, type="speech",
+                text="" if chunk.start_time == 1.0 else "ਸਤਿ", confidence=1.0, language="pa"
+            )
+        
+        self.orchestrator._process_chunk_with_fusion = fake_fusion
+        segments = list(self.orchestrator.transcribe_file_stream(self.audio_path, job_id='test'))
+        
+        self.assertEqual(segments[1].text, EMPTY_TRANSCRIPTION_TEXT)
+        self.assertEqual([seg.needs_review for seg in segments], [False, True, False, False, False])
+    
+    def test_failed_chunks_get_error_segments(self):
+        """Test each failing chunk gets its own placeholder segment."""
+        from core.orchestrator import TRANSCRIPTION_ERROR_TEXT
+        
+        def failing_fusion(chunk, route, language, job_id=None, asr_a_result=None):
+            raise RuntimeError('fusion failed')
+        
+        self.orchestrator._process_chunk_with_fusion = failing_fusion
+        segments = list(self.orchestrator.transcribe_file_stream(self.audio_path, job_id='test'))
+        
+        self.assertEqual([seg.text for seg in segments], [TRANSCRIPTION_ERROR_TEXT] * 5)
+        self.assertEqual([seg.start for seg in segments], [float(i) for i in range(5)])
+        self.assertEqual(segments[2].route, 'english_speech')
+        self.assertTrue(all(seg.needs_review for seg in segments))
+        self.assertIsNot(segments[0].hypotheses, segments[1].hypotheses)
+    
+    def test_metrics_aggregate_segments(self):
+        """Test review, confidence and quote metrics are counted over all segments."""
+        from unittest.mock import Mock
+        from core.models import ProcessedSegment
+        
+        def fake_fusion(chunk, route, language, job_id=None, asr_a_result=None):
+            i = int(chunk.start_time)
+            return ProcessedSegment(
+                start=chunk.start_time, end=chunk.end_time, route=route,
+                type="scripture_quote" if i in (1, 3) else "speech",
+                text=f"ਸਤਿ {i}", confidence=0.5 if i == 4 else 1.0, language="pa",
+                needs_review=i in (3, 4), quote_match=Mock() if i in (0, 1, 3) else None
+            )
+        
+        self.orchestrator._process_chunk_with_fusion = fake_fusion
+        metrics = self.orchestrator.transcribe_file(self.audio_path, job_id='test').metrics
+        
+        self.assertEqual(metrics['segments_needing_review'], 2)
+        self.assertAlmostEqual(metrics['average_confidence'], 0.9)
+        self.assertEqual(metrics['quotes_detected'], 3)
+        self.assertEqual(metrics['quotes_replaced'], 2)
+        self.assertEqual(metrics['quotes_flagged_review'], 1)
+        self.assertEqual(metrics['routes']['english_speech'], 1)
+        self.assertEqual(metrics['routes']['punjabi_speech'], 0)
+    
+    def test_batch_mode_groups_primary_asr(self):
+        """Test consecutive same-route chunks share one ASR-A batch call."""
+        batch_sizes = []
+        
+        class BatchASR:
+            def transcribe_chunk(self, chunk, **kwargs):
+                return create_sample_asr_result(text=f'ਸਤਿ {int(chunk.start_time)}', confidence=0.95)
+            
+            def transcribe_batch(self, chunks, **kwargs):
+                batch_sizes.append(len(chunks))
+                return [self.transcribe_chunk(chunk) for chunk in chunks]
+        
+        self.orchestrator.asr_service = BatchASR()
+        result = self.orchestrator.transcribe_file(self.audio_path, job_id='test')
+        
+        # Chunk 2 has its own route, splitting the others into two batches
+        self.assertEqual(batch_sizes, [2, 2])
+        self.assertEqual([seg.text for seg in result.segments], [f'ਸਤਿ {i}' for i in range(5)])
+    
+    def test_live_mode_skips_batching(self):
+        """Test ASR-A runs per chunk outside batch mode."""
+        from unittest.mock import patch
+        
+        with patch.object(self.orchestrator, '_supports_batch_asr', return_value=True):
+            self.orchestrator.transcribe_file(self.audio_path, mode='live', job_id='test')
+        
+        self.assertEqual(self.asr_a.transcribe_chunk.call_count, 5)
+    
+    def test_langid_runs_concurrently(self):
+        """Test upcoming chunks are identified on several threads at once."""
+        import threading
+        from unittest.mock import patch
+        
+        # Each identification lingers until another one overlaps it (or times out)
+        lock = threading.Lock()
+        overlapped = threading.Event()
+        running = []
+        peak = []
+        
+        def identify(chunk):
+            with lock:
+                running.append(chunk)
+                peak.append(len(running))
+                if len(running) > 1:
+                    overlapped.set()
+            overlapped.wait(timeout=2)
+            with lock:
+                running.remove(chunk)
+            return 'unknown'
+        
+        self.langid_service.identify_segment.side_effect = identify
+        
+        with patch.object(self.orchestrator._cfg, 'langid_workers', 2):
+            result = self.orchestrator.transcribe_file(self.audio_path, job_id='test')
+        
+        self.assertEqual(max(peak), 2)
+        self.assertEqual([seg.text for seg in result.segments], [f'ਸਤਿ {i}' for i in range(5)])
+    
+    def test_langid_error_propagates(self):
+        """Test identification errors surface from transcribe_file."""
+        self.langid_service.identify_segment.side_effect = RuntimeError('langid failed')
+        
+        with self.assertRaises(RuntimeError):
+            self.orchestrator.transcribe_file(self.audio_path, job_id='test')
+
+
+class TestStartupWarmup(unittest.TestCase):
+    """Test ASR warmup at orchestrator construction."""
+    
+    def test_warmup_runs_each_engine(self):
+        """Test every ASR engine transcribes a silent chunk once."""
+        from unittest.mock import Mock, patch
+        from core.orchestrator import Orchestrator
+        
+        engines = [Mock(), Mock(), Mock()]
+        with patch('config.WARMUP_AT_STARTUP', True):
+            Orchestrator(
+                asr_service=engines[0],
+                asr_indic=engines[1],
+                asr_english=engines[2],
+                langid_service=Mock()
+            )
+        
+        for engine in engines:
+            engine.transcribe_chunk.assert_called_once()
+            chunk = engine.transcribe_chunk.call_args[0][0]
+            self.assertFalse(chunk.audio_path.exists())  # Temp file cleaned up
+    
+    def test_warmup_disabled(self):
+        """Test no warmup happens when disabled."""
+        from unittest.mock import Mock, patch
+        from core.orchestrator import Orchestrator
+        
+        engine = Mock()
+        with patch('config.WARMUP_AT_STARTUP', False):
+            Orchestrator(asr_service=engine, langid_service=Mock())
+        
+        engine.transcribe_chunk.assert_not_called()
+
+
+class TestSettingsSnapshot(unittest.TestCase):
+    """Test the orchestrator config snapshot."""
+    
+    def test_snapshot_matches_config(self):
+        """Test snapshot values come from config."""
+        import config
+        from core.orchestrator import load_settings
+        
+        settings = load_settings()
+        self.assertEqual(settings.vad_aggressiveness, config.VAD_AGGRESSIVENESS)
+        self.assertEqual(settings.asr_timeout_seconds, config.ASR_TIMEOUT_SECONDS)
+        self.assertEqual(settings.segment_confidence_threshold, config.SEGMENT_CONFIDENCE_THRESHOLD)
+    
+    def test_settings_read_per_instance(self):
+        """Test config flags set after import apply to new orchestrators."""
+        from unittest.mock import Mock, patch
+        from core.orchestrator import Orchestrator
+        
+        with patch('config.ENABLE_QUOTE_ALIGNMENT', False), \
+                patch('config.ASR_TIMEOUT_SECONDS', 5):
+            orchestrator = Orchestrator(asr_service=Mock(), langid_service=Mock())
+        
+        self.assertFalse(orchestrator._enable_quote_alignment)
+        self.assertEqual(orchestrator.asr_timeout, 5)
+        orchestrator.close()
+
+
+class TestLiveAdmission(unittest.TestCase):
+    """Test stale and overload dropping of live chunks."""
+    
+    def setUp(self):
+        from unittest.mock import Mock
+        from core.orchestrator import Orchestrator
+        
+        self.live_callback = Mock()
+        self.orchestrator = Orchestrator(
+            asr_service=Mock(),
+            langid_service=Mock(),
+            live_callback=self.live_callback
+        )
+        self.orchestrator._process_live_audio_chunk = Mock(return_value="segment")
+    
+    def test_fresh_chunk_is_processed(self):
+        """Test a chunk within the threshold reaches fusion."""
+        import time
+        result = self.orchestrator.process_live_audio_chunk(
+            b"\x00" * 320, 0.0, 1.0, "session-1", arrival_monotonic=time.monotonic()
+        )
+        
+        self.assertEqual(result, "segment")
+        self.live_callback.assert_not_called()
+        self.assertEqual(self.orchestrator._live_inflight, {})
+    
+    def test_stale_chunk_is_dropped(self):
+        """Test a chunk queued past the threshold skips ASR."""
+        import time
+        from unittest.mock import Mock, patch
+        
+        del self.orchestrator._process_live_audio_chunk  # Use the real implementation
+        self.orchestrator.langid_service.identify_segment.return_value = "punjabi_speech"
+        self.orchestrator._process_chunk_with_fusion = Mock()
+        
+        with patch.object(self.orchestrator._cfg, 'live_stale_threshold_s', 1.0):
+            result = self.orchestrator.process_live_audio_chunk(
+                b"\x00\x00" * 160, 0.0, 1.0, "session-1",
+                arrival_monotonic=time.monotonic() - 5.0
+            )
+        
+        self.assertIsNone(result)
+        self.orchestrator._process_chunk_with_fusion.assert_not_called()
+        event, data = self.live_callback.call_args[0]
+        self.assertEqual(event, "dropped")
+        self.assertEqual(data["reason"], "stale")
+        self.assertEqual(data["session_id"], "session-1")
+        self.assertEqual(self.orchestrator._live_inflight, {})
+    
+    def test_chunk_stale_after_langid_is_dropped(self):
+        """Test time spent waiting in LangID counts towards staleness."""
+        import time
+        from unittest.mock import Mock, patch
+        
+        del self.orchestrator._process_live_audio_chunk  # Use the real implementation
+        
+        def slow_identify(chunk):
+            time.sleep(0.2)
+            return "punjabi_speech"
+        
+        self.orchestrator.langid_service.identify_segment.side_effect = slow_identify
+        self.orchestrator._process_chunk_with_fusion = Mock()
+        
+        with patch.object(self.orchestrator._cfg, 'live_stale_threshold_s', 0.1):
+            result = self.orchestrator.process_live_audio_chunk(b"\x00\x00" * 160, 0.0, 1.0, "session-1")
+        
+        self.assertIsNone(result)
+        self.orchestrator._process_chunk_with_fusion.assert_not_called()
+        self.assertEqual(self.live_callback.call_args[0][1]["reason"], "stale")
+    
+    def test_overloaded_session_is_dropped(self):
+        """Test chunks beyond the in-flight limit are rejected per session."""
+        from unittest.mock import patch
+        
+        self.orchestrator._live_inflight["session-1"] = 2
+        with patch.object(self.orchestrator._cfg, 'live_max_inflight_per_session', 2):
+            dropped = self.orchestrator.process_live_audio_chunk(b"", 0.0, 1.0, "session-1")
+            admitted = self.orchestrator.process_live_audio_chunk(b"", 0.0, 1.0, "session-2")
+        
+        self.assertIsNone(dropped)
+        self.assertEqual(self.live_callback.call_args[0][1]["reason"], "overloaded")
+        self.assertEqual(admitted, "segment")
+        self.assertEqual(self.orchestrator._live_inflight, {"session-1": 2})
+    
+    def test_live_chunk_stays_in_memory(self):
+        """Test the admitted chunk is built over an in-memory WAV."""
+        import wave
+        from unittest.mock import Mock
+        
+        del self.orchestrator._process_live_audio_chunk  # Use the real implementation
+        self.orchestrator.langid_service.identify_segment.return_value = "punjabi_speech"
+        self.orchestrator._process_chunk_with_fusion = Mock(return_value="segment")
+        
+        result = self.orchestrator.process_live_audio_chunk(b"\x00\x00" * 16000, 2.0, 3.0, "session-1")
+        
+        self.assertEqual(result, "segment")
+        chunk = self.orchestrator._process_chunk_with_fusion.call_args[0][0]
+        self.assertIsNone(chunk.audio_path)
+        with wave.open(chunk.audio_source(), 'rb') as wav_file:
+            self.assertEqual(wav_file.getframerate(), 16000)
+            self.assertEqual(wav_file.getnframes(), 16000)
+    
+    def test_concurrent_sessions_keep_own_session_id(self):
+        """Test each live thread sees its own session id during processing."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        
+        del self.orchestrator._process_live_audio_chunk  # Use the real implementation
+        self.orchestrator.langid_service.identify_segment.return_value = "punjabi_speech"
+        barrier = threading.Barrier(2)
+        
+        def fake_fusion(chunk, route, language, job_id):
+            barrier.wait(timeout=5)  # Both sessions have set their id before either reads it
+            return self.orchestrator._tls.session_id
+        
+        self.orchestrator._process_chunk_with_fusion = fake_fusion
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(
+                lambda sid: self.orchestrator.process_live_audio_chunk(b"\x00\x00" * 160, 0.0, 1.0, sid),
+                ["session-a", "session-b"]
+            ))
+        
+        self.assertEqual(results, ["session-a", "session-b"])
+    
+    def test_slot_released_on_error(self):
+        """Test the in-flight slot is released when processing raises."""
+        self.orchestrator._process_live_audio_chunk.side_effect = RuntimeError("boom")
+        
+        with self.assertRaises(RuntimeError):
+            self.orchestrator.process_live_audio_chunk(b"", 0.0, 1.0, "session-1")
+        self.assertEqual(self.orchestrator._live_inflight, {})
+
+
+class TestEnginePreload(unittest.TestCase):
+    """Test lazy and background loading of ASR-B/C."""
+    
+    def test_preload_loads_in_background(self):
+        """Test preloaded engines are picked up on first use."""
+        import threading
+        from unittest.mock import Mock, patch
+        from core.orchestrator import Orchestrator
+        
+        indic, english = Mock(), Mock()
+        load_threads = []
+        
+        def load_indic():
+            load_threads.append(threading.current_thread().name)
+            return indic
+        
+        with patch('config.ASR_PRELOAD_ENGINES', True), \
+                patch('asr.asr_indic.ASRIndic', side_effect=load_indic), \
+                patch('asr.asr_english_fallback.ASREnglish', return_value=english):
+            orchestrator = Orchestrator(asr_service=Mock(), langid_service=Mock())
+            self.assertIs(orchestrator._get_asr_indic(), indic)
+            self.assertIs(orchestrator._get_asr_english(), english)
+        
+        self.assertTrue(load_threads[0].startswith('asr-preload'))
+        self.assertEqual(orchestrator._engine_futures, {})
+        orchestrator.close()
+    
+    def test_lazy_load_happens_once(self):
+        """Test concurrent first uses share a single engine load."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import Mock, patch
+        from core.orchestrator import Orchestrator
+        
+        orchestrator = Orchestrator(asr_service=Mock(), langid_service=Mock())
+        with patch('asr.asr_indic.ASRIndic', side_effect=lambda: Mock()) as loader:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                engines = list(pool.map(lambda _: orchestrator._get_asr_indic(), range(8)))
+        
+        loader.assert_called_once()
+        self.assertTrue(all(engine is engines[0] for engine in engines))
+        orchestrator.close()
+
+
+class TestDraftConversion(unittest.TestCase):
+    """Test script conversion reuse between draft and verified captions."""
+    
+    def setUp(self):
+        from unittest.mock import Mock
+        from core.models import AudioChunk
+        from core.orchestrator import Orchestrator
+        
+        self.asr_a = Mock()
+        self.asr_a.transcribe_chunk.return_value = create_sample_asr_result(text='ਸਤਿ ਨਾਮੁ', confidence=0.95, engine='asr_a')
+        self.live_callback = Mock()
+        self.orchestrator = Orchestrator(
+            asr_service=self.asr_a,
+            langid_service=Mock(),
+            asr_indic=Mock(),
+            asr_english=Mock(),
+            live_callback=self.live_callback
+        )
+        self.orchestrator._get_engines_for_route = Mock(return_value=())
+        self.orchestrator.script_converter = Mock(wraps=self.orchestrator.script_converter)
+        self.chunk = AudioChunk(start_time=0.0, end_time=1.0, audio_path=Path('chunk.wav'), duration=1.0)
+    
+    def test_unchanged_text_converted_once(self):
+        """Test the draft conversion is reused when fusion keeps ASR-A's text."""
+        self.orchestrator._process_chunk_with_fusion(self.chunk, 'punjabi_speech', 'pa', 'test')
+        
+        self.orchestrator.script_converter.convert.assert_called_once()
+        self.assertEqual(self.live_callback.call_args_list[0][0][0], 'draft')
+    
+    def test_english_draft_not_converted(self):
+        """Test English speech drafts skip conversion and show the ASR text."""
+        self.orchestrator._process_chunk_with_fusion(self.chunk, 'english_speech', 'en', 'test')
+        
+        draft = self.live_callback.call_args_list[0][0][1]
+        self.assertEqual(draft['gurmukhi'], 'ਸਤਿ ਨਾਮੁ')
+        self.assertIsNone(draft['roman'])
+        # Only the verified pass converted the text
+        self.orchestrator.script_converter.convert.assert_called_once()
+
+
 def run_tests():
     """Run all orchestrator tests."""
     loader = unittest.TestLoader()
@@ -209,6 +1064,16 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestPipelineModels))
     suite.addTests(loader.loadTestsFromTestCase(TestDocumentFormatting))
     suite.addTests(loader.loadTestsFromTestCase(TestScriptConversion))
+    suite.addTests(loader.loadTestsFromTestCase(TestEngineRouting))
+    suite.addTests(loader.loadTestsFromTestCase(TestAudioPrefetch))
+    suite.addTests(loader.loadTestsFromTestCase(TestRedecodeGate))
+    suite.addTests(loader.loadTestsFromTestCase(TestParallelEngines))
+    suite.addTests(loader.loadTestsFromTestCase(TestTranscribeFile))
+    suite.addTests(loader.loadTestsFromTestCase(TestStartupWarmup))
+    suite.addTests(loader.loadTestsFromTestCase(TestSettingsSnapshot))
+    suite.addTests(loader.loadTestsFromTestCase(TestLiveAdmission))
+    suite.addTests(loader.loadTestsFromTestCase(TestEnginePreload))
+    suite.addTests(loader.loadTestsFromTestCase(TestDraftConversion))
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -98,6 +98,15 @@ class TestQuoteCandidateDetector:
         # Normal speech might still produce candidates via length, but confidence should be low
         if candidates:
             assert all(c.confidence < 0.5 for c in candidates)
+    
+    def test_quote_characteristics_screen(self):
+        """Test the Gurmukhi-ratio and repetition screen."""
+        detector = QuoteCandidateDetector()
+        
+        assert detector._has_quote_characteristics("ਹਰਿ ਹਰਿ ਨਾਮੁ ਜਪਿ")
+        assert not detector._has_quote_characteristics("ਸਤਿ ਨਾਮੁ ਕਰਤਾ ਪੁਰਖੁ")  # No repetition
+        assert not detector._has_quote_characteristics("hari hari naam ਜਪਿ")  # Mostly Latin
+        assert detector._count_gurbani_vocabulary("ਨਾਮ ਹਰਿ ਨਾਮ ਕੀ") == 2
 
 
 class TestAssistedMatcher:
@@ -255,6 +264,217 @@ class TestAssistedMatcher:
                     pass
 
 
+    def test_stage_a_scores_all_variants_in_one_batch(self):
+        """Test Stage A keeps each line's best score across text variants."""
+        from unittest.mock import MagicMock, patch
+        from rapidfuzz import fuzz
+        from scripture.gurmukhi_to_ascii import try_ascii_search
+        
+        def line(line_id, text):
+            return ScriptureLine(line_id=line_id, gurmukhi=try_ascii_search(text), source=ScriptureSource.SGGS)
+        
+        lines = {
+            "ਵਾਹਿਗੁਰੂ": [line("a", "ਵਾਹਿਗੁਰੂ"), line("c", "ਕੀ ਹਾਲ ਹੈ ਜੀ")],
+            "ਸਤਿ ਨਾਮੁ": [line("b", "ਸਤਿ ਨਾਮੁ ਕਰਤਾ"), line("a", "ਵਾਹਿਗੁਰੂ")],
+        }
+        scripture_service = MagicMock()
+        scripture_service.search_candidates.side_effect = lambda text, **kwargs: lines[text]
+        matcher = AssistedMatcher(scripture_service=scripture_service, use_embedding_search=False)
+        texts = ["ਵਾਹਿਗੁਰੂ", "ਸਤਿ ਨਾਮੁ", " "]
+        
+        results = matcher._stage_a_fuzzy_retrieval(texts)
+        with patch("quotes.assisted_matcher.RAPIDFUZZ_AVAILABLE", False):
+            fallback = matcher._stage_a_fuzzy_retrieval(texts)
+        
+        queries = [try_ascii_search(text) for text in texts[:2]]
+        best_b = max(fuzz.token_sort_ratio(q, try_ascii_search("ਸਤਿ ਨਾਮੁ ਕਰਤਾ"), score_cutoff=50) for q in queries)
+        expected = [("a", 1.0), ("b", best_b / 100.0)]
+        assert 0 < best_b < 100
+        assert [(l.line_id, score) for l, score in results] == expected
+        assert [(l.line_id, score) for l, score in fallback] == expected
+        # The fallback run is served from the search cache
+        assert scripture_service.search_candidates.call_count == 2
+
+    def test_stage_a_top_k_keeps_retrieval_order_for_ties(self):
+        """Test Stage A ranking is stable for equal scores and truncated to top_k."""
+        from unittest.mock import MagicMock
+
+        scripture_service = MagicMock()
+        scripture_service.search_candidates.return_value = [
+            ScriptureLine(line_id=line_id, gurmukhi=text, source=ScriptureSource.SGGS)
+            for line_id, text in [("x", "kuJ hor nhI"), ("a", "siq nwmu"), ("b", "siq nwmu"), ("c", "siq nwmu")]
+        ]
+        matcher = AssistedMatcher(scripture_service=scripture_service, use_embedding_search=False)
+
+        results = matcher._stage_a_fuzzy_retrieval(["siq nwmu"], top_k=2)
+
+        assert [(line.line_id, score) for line, score in results] == [("a", 1.0), ("b", 1.0)]
+    
+
+    def test_stage_b_tokenizes_search_texts_once(self):
+        """Test Stage B converts the search texts once, not once per candidate."""
+        from unittest.mock import MagicMock, patch
+        from quotes import assisted_matcher
+        
+        matcher = AssistedMatcher(scripture_service=MagicMock(), use_embedding_search=False)
+        fuzzy_matches = [
+            (ScriptureLine(line_id=str(i), gurmukhi="siq nwmu krqw purKu", source=ScriptureSource.SGGS), 0.9)
+            for i in range(3)
+        ]
+        
+        with patch.object(assisted_matcher, "try_ascii_search", wraps=assisted_matcher.try_ascii_search) as to_ascii:
+            verified = matcher._stage_b_semantic_verification(["siq nwmu", "krqw purKu!"], fuzzy_matches)
+        
+        assert to_ascii.call_count == 2
+        assert [line.line_id for line, _ in verified] == ["0", "1", "2"]
+        assert matcher._normalize_and_tokenize("krqw, purKu!") == ["krqw", "purKu"]
+
+    def test_stage_c_reuses_stage_b_word_sets(self):
+        """Test Stage C reads the candidate's word set from the Stage B cache."""
+        from unittest.mock import MagicMock
+        from quotes.assisted_matcher import _word_set
+
+        matcher = AssistedMatcher(scripture_service=MagicMock(), use_embedding_search=False)
+        line = ScriptureLine(line_id="1", gurmukhi="siq nwmu krqw", source=ScriptureSource.SGGS)
+        _word_set(line.gurmukhi, matcher.unicode_form)  # As built by Stage B
+        hits = _word_set.cache_info().hits
+
+        match = matcher._stage_c_verifier("siq nwmu krqw", [(line, 0.9)], ["siq nwmu krqw"])
+
+        assert match.line_id == "1"
+        assert match.confidence == 0.9
+        assert _word_set.cache_info().hits - hits >= 1
+
+    def test_stage_b_early_exit_for_near_exact_match(self):
+        """Test Stage B stops after the head candidates only when no other line could win."""
+        from unittest.mock import MagicMock, patch
+
+        def line(line_id, text):
+            return ScriptureLine(line_id=line_id, gurmukhi=text, source=ScriptureSource.SGGS)
+
+        matcher = AssistedMatcher(scripture_service=MagicMock(), use_embedding_search=False)
+        head = [(line("a", "siq nwmu krqw"), 1.0), (line("b", "siq nwmu"), 0.8), (line("c", "krqw"), 0.7)]
+        tail = [(line(str(i), "siq nwmu krqw purKu"), 0.6) for i in range(10)]
+
+        with patch.object(matcher, "_stage_b_semantic_verification",
+                          wraps=matcher._stage_b_semantic_verification) as stage_b:
+            early = matcher._stage_b_early_exit(["siq nwmu krqw"], head + tail)
+            assert stage_b.call_args[0][1] == head
+        full = matcher._stage_b_semantic_verification(["siq nwmu krqw"], head + tail)
+        assert early[0] == full[0]
+
+        # A tail line that could still outscore the head forces the full pass
+        close = [
+            (line("a", "siq nwmu krqw jI"), 1.0), (line("b", "siq nwmu"), 0.995),
+            (line("c", "krqw"), 0.992), (line("d", "siq nwmu krqw"), 0.99),
+        ]
+        assert matcher._stage_b_early_exit(["siq nwmu krqw"], close + tail) is None
+        # Hard queries never take the shortcut
+        assert matcher._stage_b_early_exit(["siq nwmu krqw"], [(l, 0.9) for l, _ in head + tail]) is None
+
+    def test_stage_b_combined_scores(self):
+        """Test Stage B weights, threshold and ordering, with and without embeddings."""
+        from unittest.mock import MagicMock
+
+        def line(line_id, text):
+            return ScriptureLine(line_id=line_id, gurmukhi=text, source=ScriptureSource.SGGS)
+
+        fuzzy_matches = [
+            (line("a", "siq nwmu"), 0.7),         # overlap 1.0, keywords equal
+            (line("b", "siq nwmu hir"), 0.9),     # overlap 2/3, keyword mismatch
+            (line("c", "!!"), 1.0),               # no words, skipped
+            (line("d", "kuJ hor"), 0.5),          # below threshold
+        ]
+        matcher = AssistedMatcher(scripture_service=MagicMock(), use_embedding_search=False)
+
+        verified = matcher._stage_b_semantic_verification(["siq nwmu"], fuzzy_matches)
+
+        assert [l.line_id for l, _ in verified] == ["a", "b"]
+        assert verified[0][1] == 0.7 * 0.5 + 1.0 * 0.3 + 1.0 * 0.2
+        assert verified[1][1] == 0.9 * 0.5 + (2 / 3) * 0.3 + 0.5 * 0.2
+
+        # Candidate word sets are reused from the first call
+        from quotes.assisted_matcher import _word_set, _critical_keywords
+        hits = _word_set.cache_info().hits
+        keyword_hits = _critical_keywords.cache_info().hits
+        assert matcher._stage_b_semantic_verification(["siq nwmu"], fuzzy_matches) == verified
+        assert _word_set.cache_info().hits - hits == len(fuzzy_matches)
+        assert _critical_keywords.cache_info().hits - keyword_hits == len(fuzzy_matches) - 1  # "!!" has no words
+
+        matcher.embedding_index = MagicMock()
+        matcher.embedding_index.search.return_value = [("b", 0.9), ("a", 0.2)]
+
+        verified = matcher._stage_b_semantic_verification(["siq nwmu"], fuzzy_matches)
+
+        matcher.embedding_index.search.assert_called_once_with("siq nwmu", top_k=5)
+        assert [l.line_id for l, _ in verified] == ["b"]
+        assert verified[0][1] == 0.9 * 0.4 + (2 / 3) * 0.2 + 0.9 * 0.4
+
+
+    def test_find_match_cached_per_search_texts(self):
+        """Test repeated queries skip the matching stages and return independent copies."""
+        from unittest.mock import MagicMock, patch
+        
+        matcher = AssistedMatcher(scripture_service=MagicMock(), use_embedding_search=False)
+        match = QuoteMatch(
+            source=ScriptureSource.SGGS, line_id="1", canonical_text="ਵਾਹਿਗੁਰੂ",
+            spoken_text="ਵਾਹਿਗੁਰੂ", confidence=0.9
+        )
+        candidate = QuoteCandidate(start=0.0, end=2.0, text="ਵਾਹਿਗੁਰੂ", confidence=0.8, detection_reason="route_hint")
+        
+        with patch.object(matcher, "_find_match_uncached", return_value=match) as uncached:
+            first = matcher.find_match([candidate])
+            first.confidence = 0.1
+            second = matcher.find_match([candidate])
+            matcher.find_match([candidate], hypotheses=[{"text": "ਸਤਿਗੁਰੂ"}])
+            matcher.find_match([candidate], source=ScriptureSource.SGGS)
+        
+        assert uncached.call_count == 3
+        assert second.confidence == 0.9
+        assert second is not first
+
+    def test_find_match_cache_concurrent(self):
+        """Test concurrent queries keep the match cache bounded and consistent."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import MagicMock, patch
+        
+        matcher = AssistedMatcher(scripture_service=MagicMock(), use_embedding_search=False)
+        candidates = [
+            QuoteCandidate(start=0.0, end=2.0, text=f"ਵਾਹਿਗੁਰੂ {i % 40}", confidence=0.8, detection_reason="route_hint")
+            for i in range(400)
+        ]
+        
+        with patch("quotes.assisted_matcher.MATCH_CACHE_SIZE", 8), \
+                patch.object(matcher, "_find_match_uncached", return_value=None):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda c: matcher.find_match([c]), candidates))
+        
+        assert results == [None] * len(candidates)
+        assert len(matcher._match_cache) <= 8
+
+    def test_stage_a_search_cached_until_close(self):
+        """Test repeated Stage A lookups hit the scripture service once until close()."""
+        from unittest.mock import MagicMock
+
+        service = MagicMock()
+        service.search_candidates.return_value = [
+            ScriptureLine(line_id="1", gurmukhi="siq nwmu krqw purKu", source=ScriptureSource.SGGS)
+        ]
+        matcher = AssistedMatcher(scripture_service=service, use_embedding_search=False)
+
+        first = matcher._stage_a_fuzzy_retrieval(["siq nwmu krqw purKu"])
+        second = matcher._stage_a_fuzzy_retrieval(["siq nwmu krqw purKu", "siq nwmu krqw purKu"])
+        assert service.search_candidates.call_count == 1
+        assert first == second
+
+        matcher._stage_a_fuzzy_retrieval(["siq nwmu krqw purKu"], source=ScriptureSource.SGGS)
+        assert service.search_candidates.call_count == 2
+
+        matcher.close()
+        matcher._stage_a_fuzzy_retrieval(["siq nwmu krqw purKu"])
+        assert service.search_candidates.call_count == 3
+
+
 class TestCanonicalReplacer:
     """Tests for CanonicalReplacer."""
     
@@ -286,6 +506,7 @@ class TestCanonicalReplacer:
         
         updated_segment = replacer.replace_with_canonical(segment, quote_match)
         
+        assert updated_segment is segment  # Updated in place, not rebuilt
         assert updated_segment.text == "ਵਾਹਿਗੁਰੂ"  # Should be canonical
         assert updated_segment.spoken_text == "wahiguru"  # Original preserved
         assert updated_segment.quote_match is not None
@@ -355,3 +576,142 @@ class TestCanonicalReplacer:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestSGGSContext:
+    """Test context line lookup around a matched line."""
+    
+    def _create_db(self, db_path: Path) -> None:
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("""
+            CREATE TABLE lines (
+                id TEXT PRIMARY KEY,
+                shabad_id TEXT,
+                line_order INTEGER,
+                gurmukhi TEXT NOT NULL
+            )
+        """)
+        rows = [
+            ('L1', 'S1', 1, 'ਪਹਿਲੀ'),
+            ('L2', 'S1', 2, 'ਵਾਹਿਗੁਰੂ'),
+            ('L3', 'S1', 3, 'ਤੀਜੀ'),
+            ('L4', 'S1', 4, 'ਵਾਹਿਗੁਰੂ'),
+            ('L5', 'S1', 5, 'ਪੰਜਵੀਂ'),
+            ('L6', 'S2', 6, 'ਹੋਰ ਸ਼ਬਦ'),
+        ]
+        conn.executemany("INSERT INTO lines VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+        conn.close()
+    
+    def test_context_excludes_text_and_limits(self, tmp_path):
+        """Test exclusion and limit are applied to the context query."""
+        db_path = tmp_path / "sggs.db"
+        self._create_db(db_path)
+        sggs_db = SGGSDatabase(db_path=db_path)
+        try:
+            context = sggs_db.get_context('L3', window=2)
+            assert [line.line_id for line in context] == ['L1', 'L2', 'L3', 'L4', 'L5']
+            
+            context = sggs_db.get_context('L3', window=2, exclude_text='ਵਾਹਿਗੁਰੂ')
+            assert [line.line_id for line in context] == ['L1', 'L3', 'L5']
+            
+            context = sggs_db.get_context('L3', window=2, exclude_text='ਵਾਹਿਗੁਰੂ', limit=2)
+            assert [line.gurmukhi for line in context] == ['ਪਹਿਲੀ', 'ਤੀਜੀ']
+        finally:
+            sggs_db.close()
+    
+    def test_batched_context_matches_per_line(self, tmp_path):
+        """Test batched context lookup returns the same lines as get_context."""
+        db_path = tmp_path / "sggs.db"
+        self._create_db(db_path)
+        sggs_db = SGGSDatabase(db_path=db_path)
+        try:
+            line_ids = ['L1', 'L3', 'L6', 'L3', 'missing']
+            contexts = sggs_db.get_contexts_batch(line_ids, window=2)
+            
+            assert set(contexts) == {'L1', 'L3', 'L6'}
+            for line_id in ('L1', 'L3', 'L6'):
+                expected = [line.line_id for line in sggs_db.get_context(line_id, window=2)]
+                assert [line.line_id for line in contexts[line_id]] == expected
+        finally:
+            sggs_db.close()
+    
+    def test_formatter_fetches_context_once(self, tmp_path):
+        """Test the document formatter batches context lookups for its quotes."""
+        from unittest.mock import patch
+        from core.models import TranscriptionResult
+        from post.document_formatter import DocumentFormatter
+        
+        db_path = tmp_path / "sggs.db"
+        self._create_db(db_path)
+        sggs_db = SGGSDatabase(db_path=db_path)
+        
+        def quote_segment(start, line_id, text):
+            match = QuoteMatch(
+                source=ScriptureSource.SGGS, line_id=line_id,
+                canonical_text=text, spoken_text=text, confidence=0.95
+            )
+            return ProcessedSegment(
+                start=start, end=start + 5.0, route="scripture_quote_likely", type="scripture_quote",
+                text=text, confidence=0.95, language="pa", quote_match=match
+            )
+        
+        result = TranscriptionResult(
+            filename="katha.mp3",
+            segments=[quote_segment(100.0, 'L2', 'ਵਾਹਿਗੁਰੂ'), quote_segment(200.0, 'L5', 'ਪੰਜਵੀਂ')],
+            transcription={"gurmukhi": "", "roman": ""},
+            metrics={}
+        )
+        
+        formatter = DocumentFormatter(sggs_db=sggs_db)
+        try:
+            with patch.object(sggs_db, 'get_context', wraps=sggs_db.get_context) as get_context, \
+                 patch.object(sggs_db, 'get_contexts_batch', wraps=sggs_db.get_contexts_batch) as get_batch:
+                document = formatter.format_document(result)
+            
+            assert get_batch.call_count == 1
+            assert get_context.call_count == 0
+            contexts = [section.content.context_lines for section in document.sections]
+            assert contexts == [['ਪਹਿਲੀ', 'ਤੀਜੀ'], ['ਤੀਜੀ', 'ਵਾਹਿਗੁਰੂ']]
+        finally:
+            formatter.close()
+    
+    def test_formatter_falls_back_when_batch_fails(self, tmp_path):
+        """Test quotes missing from a failed batch lookup still get their context."""
+        from unittest.mock import patch
+        from core.models import TranscriptionResult
+        from post.document_formatter import DocumentFormatter
+        
+        db_path = tmp_path / "sggs.db"
+        self._create_db(db_path)
+        sggs_db = SGGSDatabase(db_path=db_path)
+        
+        def quote_segment(start, line_id, text):
+            match = QuoteMatch(
+                source=ScriptureSource.SGGS, line_id=line_id,
+                canonical_text=text, spoken_text=text, confidence=0.95
+            )
+            return ProcessedSegment(
+                start=start, end=start + 5.0, route="scripture_quote_likely", type="scripture_quote",
+                text=text, confidence=0.95, language="pa", quote_match=match
+            )
+        
+        result = TranscriptionResult(
+            filename="katha.mp3",
+            segments=[quote_segment(100.0, 'L2', 'ਵਾਹਿਗੁਰੂ'), quote_segment(200.0, 'L5', 'ਪੰਜਵੀਂ')],
+            transcription={"gurmukhi": "", "roman": ""},
+            metrics={}
+        )
+        
+        formatter = DocumentFormatter(sggs_db=sggs_db)
+        try:
+            # get_contexts_batch logs a database error and returns what it found
+            with patch.object(sggs_db, 'get_context', wraps=sggs_db.get_context) as get_context, \
+                 patch.object(sggs_db, 'get_contexts_batch', return_value={}):
+                document = formatter.format_document(result)
+            
+            assert get_context.call_count == 2
+            contexts = [section.content.context_lines for section in document.sections]
+            assert contexts == [['ਪਹਿਲੀ', 'ਤੀਜੀ'], ['ਤੀਜੀ', 'ਵਾਹਿਗੁਰੂ']]
+        finally:
+            formatter.close()
@@ -59,6 +59,17 @@ class TestGurmukhiNormalizer(unittest.TestCase):
         self.assertEqual(self.normalizer.normalize(""), "")
         self.assertEqual(self.normalizer.normalize("   "), "   ")
     
+    def test_skip_unicode_pass_for_normalized_text(self):
+        """Test pre-normalized text gives the same result without the Unicode pass."""
+        import unicodedata
+        
+        for text in ["ਖ਼ਾਲਸਾ", "ਸਤਿ ਨਾਮੁ ਕਰਤਾ ਪੁਰਖੁ", "ਸੰਗਤਿ ਅੰਮ੍ਰਿਤ"]:
+            prepared = unicodedata.normalize(self.normalizer.normalization_form, text)
+            self.assertEqual(
+                self.normalizer.normalize(prepared, unicode_normalized=True),
+                self.normalizer.normalize(text)
+            )
+    
     def test_unicode_form_config(self):
         """Test that normalization form is read from config."""
         normalizer = GurmukhiNormalizer()
@@ -137,10 +148,35 @@ class TestUnicodeNormalization(unittest.TestCase):
         self.assertIsInstance(tokens, list)
         self.assertGreater(len(tokens), 0)
     
+    def test_assisted_matcher_tokenizes_unnormalized_text(self):
+        """Test input not in the configured form is normalized before tokenizing."""
+        import unicodedata
+        matcher = AssistedMatcher()
+        
+        # Gurmukhi nukta letters are composition exclusions, so use a Latin accent
+        text = "Café ਸ਼ਬਦ"
+        other_form = 'NFD' if matcher.unicode_form.endswith('C') else 'NFC'
+        unnormalized = unicodedata.normalize(other_form, text)
+        self.assertFalse(unicodedata.is_normalized(matcher.unicode_form, unnormalized))
+        
+        self.assertEqual(
+            matcher._normalize_and_tokenize(unnormalized),
+            matcher._normalize_and_tokenize(unicodedata.normalize(matcher.unicode_form, text))
+        )
+    
     def test_config_normalization_form(self):
         """Test that config.UNICODE_NORMALIZATION_FORM is defined."""
         self.assertTrue(hasattr(config, 'UNICODE_NORMALIZATION_FORM'))
         self.assertIn(config.UNICODE_NORMALIZATION_FORM, ['NFC', 'NFD', 'NFKC', 'NFKD'])
+    
+    def test_normalization_form_resolved_at_init(self):
+        """Test that the configured form is read once when the service is built."""
+        from unittest.mock import patch
+        
+        with patch.object(config, 'UNICODE_NORMALIZATION_FORM', 'NFD'):
+            converter = ScriptConverter()
+        
+        self.assertEqual(converter.unicode_form, 'NFD')
 
 
 class TestCanonicalQuoteTransliteration(unittest.TestCase):
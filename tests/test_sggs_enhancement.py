@@ -238,6 +238,14 @@ class TestQuoteContextDetector:
         assert detector is not None
         assert len(detector.intro_patterns) > 0
     
+    def test_patterns_compiled_once(self, detector):
+        """Test detectors share the patterns compiled at import."""
+        from quotes.quote_context_detector import QuoteContextDetector
+        
+        other = QuoteContextDetector()
+        assert other.intro_patterns is detector.intro_patterns
+        assert other.internal_patterns is detector.internal_patterns
+    
     def test_intro_pattern_detection(self, detector):
         """Test detection of introductory phrases."""
         # "As stated in Bani"
@@ -261,6 +269,15 @@ class TestQuoteContextDetector:
         result = detector.detect("॥ ੧ ॥")
         assert "internal:quote_verse_number" in result.detected_signals or result.is_quote_likely
     
+    def test_overlapping_patterns_all_reported(self, detector):
+        """Test every matching pattern is named once, even when matches overlap."""
+        assert detector._check_internal_patterns("॥ ਰਹਾਉ ॥ ॥ 1 ॥") == [
+            "quote_rahao", "quote_verse_number", "quote_double_danda"
+        ]
+        assert detector._check_intro_patterns("ਸੁਣੋ ਜੀ, ਸੁਣੋ") == ["intro_suno"]
+        assert detector._check_intro_patterns("ਅੱਜ ਮੌਸਮ ਬਹੁਤ ਵਧੀਆ ਹੈ") == []
+        assert detector._check_internal_patterns("ਅੱਜ ਮੌਸਮ ਬਹੁਤ ਵਧੀਆ ਹੈ") == []
+    
     def test_vocabulary_density(self, detector):
         """Test Gurbani vocabulary density calculation."""
         # High density Gurbani text
@@ -337,6 +354,42 @@ class TestConstrainedMatcher:
         dist = normalized_edit_distance("ਹਰਿ", "ਪ੍ਰਭ")
         assert 0 < dist <= 1
     
+    def test_edit_distance_without_rapidfuzz(self):
+        """Test the pure-Python fallback agrees with rapidfuzz."""
+        from unittest.mock import patch
+        from quotes.constrained_matcher import levenshtein_distance, normalized_edit_distance
+        
+        pairs = [("ਸਤਿ ਨਾਮੁ", "ਸਤ ਨਾਮ"), ("ਕਰਤਾ", "ਪੁਰਖੁ"), ("", "ਹਰਿ"), ("", "")]
+        fast = [(levenshtein_distance(a, b), normalized_edit_distance(a, b)) for a, b in pairs]
+        with patch("quotes.constrained_matcher.RAPIDFUZZ_AVAILABLE", False):
+            slow = [(levenshtein_distance(a, b), normalized_edit_distance(a, b)) for a, b in pairs]
+        
+        assert fast == slow
+    
+    def test_batched_alignment_matches_per_candidate(self, matcher):
+        """Test batch scoring picks the same alignment as aligning each candidate."""
+        from unittest.mock import patch
+        from core.models import ScriptureLine, ScriptureSource
+        
+        candidates = [
+            ScriptureLine(line_id=str(i), gurmukhi=text, source=ScriptureSource.SGGS)
+            for i, text in enumerate([
+                "ਹਰਿ ਹਰਿ ਨਾਮੁ", "ਸਤਿ ਨਾਮੁ ਕਰਤਾ ਪੁਰਖੁ", "ਸਤਿ ਨਾਮੁ ਕਰਤਾ", "ਵਾਹਿਗੁਰੂ"
+            ])
+        ]
+        transcription = "ਸਤਿ ਨਾਮ ਕਰਤਾ ਪੁਰਖ"
+        
+        batched = matcher.find_best_alignment(transcription, candidates=candidates)
+        with patch("quotes.constrained_matcher.RAPIDFUZZ_AVAILABLE", False):
+            looped = matcher.find_best_alignment(transcription, candidates=candidates)
+        
+        assert batched.matched_line.line_id == looped.matched_line.line_id == "1"
+        assert batched.alignment_score == looped.alignment_score
+        assert matcher.find_best_alignment("xyz", candidates=candidates) is None
+        
+        # Each candidate line was normalized once across all three calls
+        assert matcher._normalize_candidate.cache_info().misses == len(candidates)
+    
     def test_word_overlap_score(self):
         """Test word overlap scoring."""
         from quotes.constrained_matcher import word_overlap_score
@@ -355,6 +408,23 @@ class TestConstrainedMatcher:
         )
         assert 0 < score < 1
 
+    def test_matchers_open_own_service(self):
+        """Test each matcher without a service opens its own ScriptureService once."""
+        from unittest.mock import MagicMock, patch
+        from quotes import constrained_matcher
+
+        own_service = MagicMock()
+        with patch.object(constrained_matcher, "ScriptureService") as service_cls:
+            service_cls.side_effect = lambda: MagicMock()
+            first = constrained_matcher.ConstrainedQuoteMatcher()
+            second = constrained_matcher.ConstrainedQuoteMatcher()
+            assert first._ensure_service() is first._ensure_service()
+            assert first._ensure_service() is not second._ensure_service()
+            assert service_cls.call_count == 2
+
+            explicit = constrained_matcher.ConstrainedQuoteMatcher(scripture_service=own_service)
+            assert explicit._ensure_service() is own_service
+
 
 # ============================================
 # 6. SGGS Aligner Tests
@@ -0,0 +1,294 @@
+"""
+TranscriptMerger tests.
+
+Tests for:
+- Overlap-aware merging of adjacent chunk texts
+- Plain text merging of segments
+- SRT/VTT subtitle generation
+"""
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.models import ProcessedSegment, QuoteMatch, ScriptureSource
+from post.transcript_merger import TranscriptMerger, merge_overlapping_texts, _sorted_by_start
+
+
+def create_segment(start: float, end: float, text: str, roman=None) -> ProcessedSegment:
+    """Create a ProcessedSegment for merging tests."""
+    return ProcessedSegment(
+        start=start, end=end, route="punjabi_speech", type="speech",
+        text=text, confidence=0.9, language="pa", roman=roman
+    )
+
+
+class TestMergeOverlappingTexts(unittest.TestCase):
+    """Test removal of words repeated across a chunk boundary."""
+    
+    def test_repeated_boundary_words_dropped(self):
+        """Test the run shared by the previous tail and next head is removed."""
+        merged = merge_overlapping_texts(
+            "ਸਤਿ ਨਾਮੁ ਕਰਤਾ ਪੁਰਖੁ".split(),
+            "ਕਰਤਾ ਪੁਰਖੁ ਨਿਰਭਉ ਨਿਰਵੈਰੁ".split()
+        )
+        self.assertEqual(merged, "ਨਿਰਭਉ ਨਿਰਵੈਰੁ".split())
+    
+    def test_cut_off_word_at_boundary_tolerated(self):
+        """Test one partial word on either side still merges, keeping the unmatched word."""
+        merged = merge_overlapping_texts(
+            "ਸਤਿ ਨਾਮੁ ਕਰਤਾ ਪੁਰ".split(),
+            "ਤਾ ਨਾਮੁ ਕਰਤਾ ਪੁਰਖੁ ਨਿਰਭਉ".split()
+        )
+        self.assertEqual(merged, "ਤਾ ਪੁਰਖੁ ਨਿਰਭਉ".split())
+    
+    def test_single_shared_word_kept(self):
+        """Test a one-word match at the boundary is not treated as a repeat."""
+        next_tokens = "and ji is the word".split()
+        merged = merge_overlapping_texts("so we say ji today".split(), next_tokens)
+        self.assertEqual(merged, next_tokens)
+    
+    def test_repetition_away_from_boundary_kept(self):
+        """Test words that repeat but not at the boundary are kept."""
+        next_tokens = "ਨਿਰਭਉ ਨਿਰਵੈਰੁ ਵਾਹਿਗੁਰੂ ਵਾਹਿਗੁਰੂ".split()
+        merged = merge_overlapping_texts("ਵਾਹਿਗੁਰੂ ਸਤਿ ਨਾਮੁ".split(), next_tokens)
+        self.assertEqual(merged, next_tokens)
+    
+    def test_empty_inputs(self):
+        """Test empty token lists pass through."""
+        self.assertEqual(merge_overlapping_texts([], ["ਸਤਿ"]), ["ਸਤਿ"])
+        self.assertEqual(merge_overlapping_texts(["ਸਤਿ"], []), [])
+
+
+class TestMergeSegments(unittest.TestCase):
+    """Test TranscriptMerger.merge_segments."""
+    
+    def setUp(self):
+        self.merger = TranscriptMerger()
+    
+    def test_overlapping_segments_deduplicated(self):
+        """Test time-overlapping segments do not repeat boundary words."""
+        segments = [
+            create_segment(0.0, 5.0, "ਸਤਿ ਨਾਮੁ ਕਰਤਾ ਪੁਰਖੁ", roman="sat naam karataa purakh"),
+            create_segment(4.5, 9.0, "ਕਰਤਾ ਪੁਰਖੁ ਨਿਰਭਉ ਨਿਰਵੈਰੁ", roman="karataa purakh nirbhau niravair")
+        ]
+        
+        self.assertEqual(
+            self.merger.merge_segments(segments, format="gurmukhi"),
+            "ਸਤਿ ਨਾਮੁ ਕਰਤਾ ਪੁਰਖੁ ਨਿਰਭਉ ਨਿਰਵੈਰੁ"
+        )
+        self.assertEqual(
+            self.merger.merge_segments(segments, format="roman"),
+            "sat naam karataa purakh nirbhau niravair"
+        )
+    
+    def test_empty_roman_segment_between_overlaps(self):
+        """Test a segment without roman text does not break overlap removal."""
+        import json
+        segments = [
+            create_segment(0.0, 5.0, "ਸਤਿ ਨਾਮੁ ਕਰਤਾ ਪੁਰਖੁ", roman="sat naam karataa purakh"),
+            create_segment(4.2, 4.4, "ਜੀ"),
+            create_segment(4.5, 9.0, "ਕਰਤਾ ਪੁਰਖੁ ਨਿਰਭਉ", roman="karataa purakh nirbhau")
+        ]
+        
+        self.assertEqual(
+            json.loads(self.merger.merge_segments(segments, format="json"))["full_text_roman"],
+            "sat naam karataa purakh nirbhau"
+        )
+    
+    def test_non_overlapping_segments_unchanged(self):
+        """Test segments that do not overlap in time are joined as-is."""
+        segments = [
+            create_segment(0.0, 4.0, "ਵਾਹਿਗੁਰੂ"),
+            create_segment(4.0, 8.0, "ਵਾਹਿਗੁਰੂ")
+        ]
+        
+        self.assertEqual(self.merger.merge_segments(segments), "ਵਾਹਿਗੁਰੂ ਵਾਹਿਗੁਰੂ")
+    
+    def test_json_format(self):
+        """Test JSON output carries segments and both full texts."""
+        import json
+        segments = [
+            create_segment(4.5, 9.0, "ਕਰਤਾ ਪੁਰਖੁ ਨਿਰਭਉ", roman="karataa purakh nirbhau"),
+            create_segment(0.0, 5.0, "ਸਤਿ ਕਰਤਾ ਪੁਰਖੁ", roman="sat karataa purakh"),
+        ]
+        
+        output = self.merger.merge_segments(segments, format="json")
+        data = json.loads(output)
+        
+        self.assertEqual([seg["start"] for seg in data["segments"]], [0.0, 4.5])
+        self.assertEqual(data["full_text_gurmukhi"], "ਸਤਿ ਕਰਤਾ ਪੁਰਖੁ ਨਿਰਭਉ")
+        self.assertEqual(data["full_text_roman"], "sat karataa purakh nirbhau")
+        self.assertIn("\n", output)
+        
+        compact = self.merger.merge_segments(segments, format="json", json_indent=None)
+        self.assertNotIn("\n", compact)
+        self.assertEqual(json.loads(compact), data)
+    
+    def test_json_format_without_orjson(self):
+        """Test the stdlib json fallback produces the same transcript."""
+        import json
+        from unittest.mock import patch
+        segments = [create_segment(0.0, 5.0, "ਸਤਿ ਨਾਮੁ", roman="sat naam")]
+        
+        fast = self.merger.merge_segments(segments, format="json")
+        with patch('post.transcript_merger.ORJSON_AVAILABLE', False):
+            stdlib = self.merger.merge_segments(segments, format="json")
+        
+        self.assertEqual(json.loads(fast), json.loads(stdlib))
+        self.assertIn("ਸਤਿ ਨਾਮੁ", stdlib)
+
+
+class TestSegmentOrdering(unittest.TestCase):
+    """Test segments are put in time order before merging."""
+    
+    def test_sorted_input_returned_as_is(self):
+        """Test an already ordered list is not copied or re-sorted."""
+        segments = [create_segment(0.0, 2.0, "ਸਤਿ"), create_segment(2.0, 4.0, "ਨਾਮੁ")]
+        self.assertIs(_sorted_by_start(segments), segments)
+        self.assertEqual(_sorted_by_start([]), [])
+    
+    def test_unsorted_input_sorted(self):
+        """Test out-of-order segments are sorted without changing the input."""
+        segments = [create_segment(5.0, 8.0, "ਨਾਮੁ"), create_segment(0.0, 2.0, "ਸਤਿ")]
+        
+        filled = TranscriptMerger().fill_gaps(segments)
+        
+        self.assertEqual([seg.text for seg in filled], ["ਸਤਿ", "[...]", "ਨਾਮੁ"])
+        self.assertEqual([seg.text for seg in segments], ["ਨਾਮੁ", "ਸਤਿ"])
+
+
+class TestNormalizeSegments(unittest.TestCase):
+    """Test overlap resolution and gap filling."""
+    
+    def setUp(self):
+        self.merger = TranscriptMerger()
+    
+    def create_segments(self):
+        """Create segments with two overlaps and one long gap."""
+        segments = [
+            create_segment(0.0, 5.0, "ਸਤਿ"),
+            create_segment(4.0, 6.0, "ਨਾਮੁ"),
+            create_segment(4.5, 5.5, "ਕਰਤਾ"),
+            create_segment(9.0, 12.0, "ਪੁਰਖੁ"),
+        ]
+        segments[1].confidence = 0.95
+        return segments
+    
+    def test_handle_overlaps(self):
+        """Test higher-confidence segments win overlaps and empty ones are dropped."""
+        resolved = self.merger.handle_overlaps(self.create_segments())
+        
+        self.assertEqual(
+            [(seg.text, seg.start, seg.end) for seg in resolved],
+            [("ਸਤਿ", 0.0, 4.0), ("ਨਾਮੁ", 4.0, 6.0), ("ਪੁਰਖੁ", 9.0, 12.0)]
+        )
+    
+    def test_single_pass_matches_separate_calls(self):
+        """Test the fused pass equals resolving overlaps and then filling gaps."""
+        separate = self.merger.fill_gaps(self.merger.handle_overlaps(self.create_segments()))
+        fused = self.merger.normalize_segments(self.create_segments())
+        
+        self.assertEqual(
+            [(seg.text, seg.start, seg.end) for seg in fused],
+            [(seg.text, seg.start, seg.end) for seg in separate]
+        )
+        self.assertEqual([seg.type for seg in fused].count("gap"), 1)
+
+
+    def test_gaps_without_overlaps(self):
+        """Test gap markers are placed between the right segments when nothing overlaps."""
+        segments = [
+            create_segment(0.0, 2.0, "ਸਤਿ"),
+            create_segment(2.5, 4.0, "ਨਾਮੁ"),
+            create_segment(6.0, 7.0, "ਕਰਤਾ"),
+            create_segment(7.0, 8.0, "ਪੁਰਖੁ"),
+            create_segment(10.0, 11.0, "ਨਿਰਭਉ"),
+        ]
+        
+        normalized = self.merger.normalize_segments(segments)
+        
+        self.assertEqual(
+            [(seg.text, seg.start, seg.end) for seg in normalized],
+            [
+                ("ਸਤਿ", 0.0, 2.0), ("ਨਾਮੁ", 2.5, 4.0), ("[...]", 4.0, 6.0),
+                ("ਕਰਤਾ", 6.0, 7.0), ("ਪੁਰਖੁ", 7.0, 8.0), ("[...]", 8.0, 10.0),
+                ("ਨਿਰਭਉ", 10.0, 11.0)
+            ]
+        )
+        self.assertEqual(self.merger.handle_overlaps(segments), segments)
+        self.assertEqual(self.merger.normalize_segments([]), [])
+
+
+class TestSubtitles(unittest.TestCase):
+    """Test SRT and VTT subtitle generation."""
+    
+    def setUp(self):
+        self.merger = TranscriptMerger()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        quote = QuoteMatch(
+            source=ScriptureSource.SGGS, line_id="1", canonical_text="ਵਾਹਿਗੁਰੂ",
+            spoken_text="ਵਾਹਿਗੁਰੂ", confidence=0.95
+        )
+        self.segments = [
+            create_segment(65.5, 70.25, "", roman="dhan guru"),
+            create_segment(0.0, 4.0, "ਵਾਹਿਗੁਰੂ")
+        ]
+        self.segments[1].quote_match = quote
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_generate_srt(self):
+        """Test SRT cues are numbered in time order with Roman fallback."""
+        output_path = self.merger.generate_srt(self.segments, self.output_dir / "out.srt")
+        
+        self.assertEqual(
+            output_path.read_text(encoding="utf-8"),
+            "1\n00:00:00,000 --> 00:00:04,000\nਵਾਹਿਗੁਰੂ\n\n"
+            "2\n00:01:05,500 --> 00:01:10,250\ndhan guru\n\n"
+        )
+    
+    def test_timestamps(self):
+        """Test timestamps are rounded to whole milliseconds across hours."""
+        self.assertEqual(self.merger._format_srt_timestamp(0.29), "00:00:00,290")
+        self.assertEqual(self.merger._format_srt_timestamp(3725.0004), "01:02:05,000")
+        self.assertEqual(self.merger._format_vtt_timestamp(59.9996), "00:01:00.000")
+    
+    def test_generate_vtt(self):
+        """Test VTT output has a header and marks quote cues."""
+        output_path = self.merger.generate_vtt(self.segments, self.output_dir / "out.vtt")
+        
+        self.assertEqual(
+            output_path.read_text(encoding="utf-8"),
+            "WEBVTT\n\n"
+            "00:00:00.000 --> 00:00:04.000 class=\"quote\"\nਵਾਹਿਗੁਰੂ\n\n"
+            "00:01:05.500 --> 00:01:10.250\ndhan guru\n\n"
+        )
+
+
+def run_tests():
+    """Run all transcript merger tests."""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    
+    suite.addTests(loader.loadTestsFromTestCase(TestMergeOverlappingTexts))
+    suite.addTests(loader.loadTestsFromTestCase(TestMergeSegments))
+    suite.addTests(loader.loadTestsFromTestCase(TestSegmentOrdering))
+    suite.addTests(loader.loadTestsFromTestCase(TestNormalizeSegments))
+    suite.addTests(loader.loadTestsFromTestCase(TestSubtitles))
+    
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    
+    return result.wasSuccessful()
+
+
+if __name__ == '__main__':
+    success = run_tests()
+    sys.exit(0 if success else 1)